@@ -35,6 +35,9 @@ print("🔍 Importing utils...")
 from NightCityBot.utils.permissions import is_fixer
 
 print("✅ permissions imported")
+from NightCityBot.utils import json_codec
+
+print("✅ json_codec imported")
 
 print("🔍 Importing cogs...")
 from NightCityBot.cogs.dm_handling import DMHandler
@@ -78,9 +81,16 @@ print("🔍 Importing startup checks...")
 from NightCityBot.utils.startup_checks import perform_startup_checks
 
 print("✅ startup_checks imported")
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+print("✅ UnbelievaBoatAPI imported")
+from NightCityBot.services.sqlite_backend import get_backend
+from NightCityBot.services.state_store import get_state_store
+
+print("✅ StateStore imported")
 
 print("🔍 Importing Flask...")
-from flask import Flask
+from flask import Flask, jsonify
 
 print("✅ Flask imported")
 from threading import Thread
@@ -103,6 +113,12 @@ class NightCityBot(commands.Bot):
         intents.dm_messages = True
 
         super().__init__(command_prefix="!", help_command=None, intents=intents)
+        # Shared by every cog so they reuse one pooled HTTP session
+        self.unbelievaboat = UnbelievaBoatAPI(
+            config.UNBELIEVABOAT_API_TOKEN,
+            cache_ttl=getattr(config, "BALANCE_CACHE_TTL", 0),
+            cache_size=getattr(config, "BALANCE_CACHE_SIZE", 1024),
+        )
 
     async def setup_hook(self):
         # Load all cogs
@@ -153,11 +169,33 @@ def home():
     return "Bot is alive Version 1.2!"
 
 
+@app.route("/api_stats")
+def api_stats():
+    bot = app.config.get("BOT")
+    client = getattr(bot, "unbelievaboat", None)
+    # ``Client.loop`` raises until the bot has logged in
+    loop = getattr(bot, "loop", None)
+    if client is None or loop is None or not loop.is_running():
+        return jsonify({}), 503
+
+    async def snapshot():
+        # Runs on the bot's loop so the metrics aren't read mid-update
+        return {**client.stats(), "json": json_codec.metrics.snapshot()}
+
+    try:
+        stats = asyncio.run_coroutine_threadsafe(snapshot(), loop).result(timeout=5)
+    except Exception:
+        logger.exception("Failed to collect API stats")
+        return jsonify({}), 503
+    return jsonify(stats)
+
+
 def run_flask():
     app.run(host="0.0.0.0", port=5000)
 
 
-def keep_alive():
+def keep_alive(bot: commands.Bot | None = None):
+    app.config["BOT"] = bot
     t = Thread(target=run_flask)
     t.start()
 
@@ -174,6 +212,22 @@ def register_shutdown(bot: NightCityBot):
                 await admin.log_audit(bot.user, "🛑 Bot shutting down.")
             except Exception:
                 logger.exception("Failed to log shutdown audit")
+        try:
+            await bot.unbelievaboat.close()
+        except Exception:
+            logger.exception("Failed to close UnbelievaBoat session")
+        try:
+            await get_state_store().close()
+        except Exception:
+            logger.exception("Failed to write pending state files")
+        # Last: the state store, event logs and backup store all write
+        # through this backend and fail once it is closed.
+        backend = get_backend()
+        if backend:
+            try:
+                await backend.close()
+            except Exception:
+                logger.exception("Failed to close the SQLite database")
         await bot.close()
         print("✅ Shutdown complete")
         logger.info("Shutdown complete")
@@ -217,7 +271,7 @@ def main():
     # Start keep-alive server
     print("🌐 Starting keep-alive server...")
     try:
-        keep_alive()
+        keep_alive(bot)
         print("✅ Keep-alive server started")
     except Exception as e:
         print(f"❌ Failed to start keep-alive server: {e}")
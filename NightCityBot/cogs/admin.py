@@ -9,7 +9,12 @@ import config
 from NightCityBot.utils.permissions import is_fixer
 from NightCityBot.utils import constants
 from NightCityBot.utils import startup_checks
-from NightCityBot.utils.helpers import load_json_file, save_json_file
+from NightCityBot.utils import json_codec
+from NightCityBot.utils.output import BufferedSender
+from NightCityBot.services.event_log import get_event_log
+from NightCityBot.services import storage_migration
+from NightCityBot.services.sqlite_backend import get_backend, open_backend
+from NightCityBot.services.unbelievaboat import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -192,6 +197,7 @@ class Admin(commands.Cog):
                     "`!due` – display a detailed breakdown of what a user owes on the 1st.",
                     "`!paydue [-v]` – pay your monthly obligations early.",
                     "`!collect_rent [@user] [-v] [-force]` (alias: !collectrent) – run the monthly rent cycle. Use `-force` to ignore the 30\u202fday limit.",
+                    "`!resume_rent <run_id> [-v]` – finish an interrupted rent collection from its journal without charging anyone twice.",
                     "`!collect_housing @user [-v] [-force]` / `!collect_business @user [-v] [-force]` / `!collect_trauma @user [-v] [-force]` – charge specific fees with optional verbose logs. (aliases: !collecthousing / !collectbusiness / !collecttrauma)",
                     "`!list_deficits` – list members who can't cover upcoming charges.",
                 ]),
@@ -259,6 +265,8 @@ class Admin(commands.Cog):
                     "`!test_bot [tests] [-silent] [-verbose]` – execute the built-in test suite. Results can be DMed when `-silent` is used and step details are shown with `-verbose`. Prefixes run groups of tests.",
                     "`!list_tests` – show all available self-test names.",
                     "`!test__bot [pattern]` – run the PyTest suite optionally filtering by pattern.",
+                    "`!api_stats [reset]` – show UnbelievaBoat latency, retry, 429 and error counts plus time spent encoding and decoding JSON files.",
+                    "`!migrate_storage` – import the JSON state files into the SQLite database before switching `STORAGE_BACKEND` to `sqlite`.",
                 ]),
             ),
             (
@@ -307,8 +315,10 @@ class Admin(commands.Cog):
         attend_channel = ctx.guild.get_channel(config.ATTENDANCE_CHANNEL_ID)
         open_channel = ctx.guild.get_channel(config.BUSINESS_ACTIVITY_CHANNEL_ID)
 
-        attend_data = await load_json_file(config.ATTEND_LOG_FILE, default={})
-        open_data = await load_json_file(config.OPEN_LOG_FILE, default={})
+        attend_log = get_event_log(config.ATTEND_LOG_FILE)
+        open_log = get_event_log(config.OPEN_LOG_FILE)
+        attend_data = await attend_log.snapshot()
+        open_data = await open_log.snapshot()
 
         attend_added = 0
         open_added = 0
@@ -365,8 +375,8 @@ class Admin(commands.Cog):
                             entries.append(ts)
                             open_added += 1
 
-        await save_json_file(config.ATTEND_LOG_FILE, attend_data)
-        await save_json_file(config.OPEN_LOG_FILE, open_data)
+        await attend_log.replace(attend_data)
+        await open_log.replace(open_data)
 
         await ctx.send(
             f"✅ Backfilled {attend_added} attendance entries and {open_added} business opens."
@@ -376,6 +386,47 @@ class Admin(commands.Cog):
             f"Backfilled logs: attend {attend_added}, open {open_added}",
         )
 
+    @commands.command(name="migrate_storage")
+    @commands.has_permissions(administrator=True)
+    async def migrate_storage(self, ctx):
+        """Import the JSON state files into the SQLite database."""
+        if get_backend():
+            await ctx.send("❌ The bot is already using the SQLite backend.")
+            return
+        backend = open_backend(config.SQLITE_DB_FILE)
+        try:
+            counts = await storage_migration.import_json(backend)
+        finally:
+            await backend.close()
+        lines = [f"✅ Imported JSON state into `{backend.path.name}`:"]
+        lines.extend(f"• {name}: {count}" for name, count in counts.items())
+        lines.append("Set `STORAGE_BACKEND=sqlite` and restart the bot to switch over.")
+        await ctx.send("\n".join(lines))
+        await self.log_audit(ctx.author, f"Migrated storage to {backend.path.name}")
+
+    @commands.command(name="api_stats")
+    @commands.has_permissions(administrator=True)
+    async def api_stats(self, ctx, action: Optional[str] = None):
+        """Show UnbelievaBoat request and JSON file metrics. Use ``reset`` to clear them."""
+        client = get_shared_client(self.bot)
+        if action and action.lower() == "reset":
+            client.metrics.reset()
+            json_codec.metrics.reset()
+            await ctx.send("🧹 API metrics reset.")
+            return
+        stats = client.stats()
+        lines = ["📊 **UnbelievaBoat API**"]
+        lines.extend(client.metrics.summary_lines() or ["No requests recorded yet."])
+        cache = stats["cache"]
+        lines.append(
+            f"Cache: {cache['hits']} hits, {cache['misses']} misses, {cache['size']} entries"
+        )
+        rates = ", ".join(f"{k} {v}/s" for k, v in stats["rate_limits"].items())
+        lines.append(f"Circuit: {stats['circuit']['state']} | Rate limits: {rates}")
+        lines.extend(json_codec.metrics.summary_lines())
+        async with BufferedSender(ctx.send) as out:
+            await out.extend(lines)
+
     @commands.Cog.listener()
     async def on_command_error(self, ctx, error):
         """Global error handler for commands."""
@@ -13,8 +13,11 @@ from NightCityBot.utils.helpers import (
     append_json_file,
     get_tz_now,
 )
-from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+from NightCityBot.services.state_store import get_state_store
+from NightCityBot.services.unbelievaboat import get_shared_client
 from NightCityBot.utils.permissions import is_ripperdoc, is_fixer
+from NightCityBot.utils.member_index import MemberIndex
+from NightCityBot.utils.output import BufferedSender
 
 MAX_COST = {
     "medium": 2000,
@@ -29,7 +32,7 @@ class CyberwareManager(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.unbelievaboat = UnbelievaBoatAPI(config.UNBELIEVABOAT_API_TOKEN)
+        self.unbelievaboat = get_shared_client(bot)
         self.data: Dict[str, Dict[str, Optional[str] | int]] = {}
         self.last_run: Optional[datetime] = None
         self.bot.loop.create_task(self.load_data())
@@ -37,7 +40,7 @@ class CyberwareManager(commands.Cog):
 
     async def load_data(self):
         path = Path(config.CYBERWARE_LOG_FILE)
-        raw = await load_json_file(path, default={})
+        raw = await get_state_store().load(path, default={})
         if isinstance(raw, dict):
             ts = raw.get("_last_run")
             if ts:
@@ -132,7 +135,8 @@ class CyberwareManager(commands.Cog):
 
         Returns a mapping with keys ``checkup`` (players who did a checkup),
         ``paid`` (kept the role and paid) and ``unpaid`` (kept the role but
-        couldn't pay).
+        couldn't pay). Processing stops early when the economy backend is
+        unavailable.
         """
         control = self.bot.get_cog("SystemControl")
         if control and not control.is_enabled("cyberware"):
@@ -151,8 +155,24 @@ class CyberwareManager(commands.Cog):
 
         results = {"checkup": [], "paid": [], "unpaid": []}
 
+        if dry_run and log is not None:
+            check = await self.unbelievaboat.check_write_access()
+            log.append(
+                "🔄 Balance update check passed."
+                if check
+                else "⚠️ Balance update check failed."
+            )
+
         week_inc = self._week_increment()
-        members = [target_member] if target_member else guild.members
+        if target_member:
+            members = [target_member]
+        else:
+            index = MemberIndex(guild.members)
+            members = index.ordered(
+                index.with_role_id(config.APPROVED_ROLE_ID)
+                & index.with_any(medium_role, high_role, extreme_role)
+                - index.with_any(loa_role, ripper_role)
+            )
         today = get_tz_now().date()
         for member in members:
             if not any(r.id == config.APPROVED_ROLE_ID for r in member.roles):
@@ -216,9 +236,18 @@ class CyberwareManager(commands.Cog):
             # User kept the checkup role for another week → charge them
             weeks += member_inc
             cost = self.calculate_cost(role_level, weeks)
+            if not self.unbelievaboat.available:
+                msg = "❌ Economy backend unavailable — stopping cyberware processing."
+                if log_channel and not dry_run:
+                    await log_channel.send(msg)
+                if log is not None:
+                    log.append(msg)
+                break
             if log is not None:
                 log.append(f"Processing <@{member.id}> — week {weeks} cost ${cost}")
-            balance = await self.unbelievaboat.get_balance(member.id)
+            balance = await self.unbelievaboat.get_balance(
+                member.id, fresh=not dry_run
+            )
             if not balance:
                 if log_channel and not dry_run:
                     await log_channel.send(
@@ -231,15 +260,6 @@ class CyberwareManager(commands.Cog):
                         log.append(f"⚠️ Could not fetch balance for <@{member.id}>")
                 continue
 
-            if dry_run:
-                check = await self.unbelievaboat.verify_balance_ops(member.id)
-                if log is not None:
-                    log.append(
-                        "🔄 Balance check passed."
-                        if check
-                        else "⚠️ Balance update check failed."
-                    )
-
             total = balance.get("cash", 0) + balance.get("bank", 0)
             if total < cost:
                 if log_channel and not dry_run:
@@ -303,7 +323,11 @@ class CyberwareManager(commands.Cog):
             save_payload = {**self.data}
             if self.last_run:
                 save_payload["_last_run"] = self.last_run.isoformat()
-            await save_json_file(Path(config.CYBERWARE_LOG_FILE), save_payload)
+            store = get_state_store()
+            await store.save(Path(config.CYBERWARE_LOG_FILE), save_payload)
+            # The streaks and last run decide next week's charges; don't
+            # leave them waiting for the background write
+            await store.flush(Path(config.CYBERWARE_LOG_FILE))
             if log is not None:
                 log.append("✅ Data saved.")
         elif log is not None:
@@ -385,7 +409,8 @@ class CyberwareManager(commands.Cog):
         await self.process_week(dry_run=True, log=logs, target_member=resolved_member)
         summary = "\n".join(logs) if logs else "✅ Simulation complete."
         if verbose:
-            await ctx.send(summary)
+            async with BufferedSender(ctx.send) as out:
+                await out.extend(logs or [summary])
         else:
             await ctx.send("✅ Simulation complete.")
         admin_cog = self.bot.get_cog("Admin")
@@ -423,7 +448,7 @@ class CyberwareManager(commands.Cog):
         payload = {**self.data}
         if self.last_run:
             payload["_last_run"] = self.last_run.isoformat()
-        await save_json_file(Path(config.CYBERWARE_LOG_FILE), payload)
+        await get_state_store().save(Path(config.CYBERWARE_LOG_FILE), payload)
 
     @commands.command(aliases=["weekswithoutcheckup", "wwocup", "wwc"])
     @commands.check_any(is_ripperdoc(), is_fixer())
@@ -462,7 +487,14 @@ class CyberwareManager(commands.Cog):
             await ctx.send("⚠️ Checkup role is not configured.")
             return
 
-        members = [member] if member else guild.members
+        if member:
+            members = [member]
+        else:
+            index = MemberIndex(guild.members)
+            members = index.ordered(
+                index.with_any(medium_role, high_role, extreme_role)
+                - index.with_any(loa_role, ripper_role)
+            )
         count = 0
         for m in members:
             if loa_role and loa_role in m.roles:
@@ -619,17 +651,10 @@ class CyberwareManager(commands.Cog):
         extreme_role = guild.get_role(config.CYBER_EXTREME_ROLE_ID)
         loa_role = guild.get_role(config.LOA_ROLE_ID)
 
+        index = MemberIndex(guild.members)
+        cyber_members = index.with_any(medium_role, high_role, extreme_role)
         lines = [f"**Cyberware Status ({timestamp})**"]
-        for member in guild.members:
-            if loa_role and loa_role in member.roles:
-                continue
-            has_cyber = any(
-                r
-                for r in (medium_role, high_role, extreme_role)
-                if r and r in member.roles
-            )
-            if not has_cyber:
-                continue
+        for member in index.ordered(cyber_members - index.with_role(loa_role)):
             status: str
             if member.id in checkup_set:
                 status = "checkup"
@@ -643,7 +668,8 @@ class CyberwareManager(commands.Cog):
             weeks = self.data.get(str(member.id), {}).get("weeks", 0)
             lines.append(f"{member.display_name}: {status} (week {weeks})")
 
-        await ctx.send("\n".join(lines))
+        async with BufferedSender(ctx.send) as out:
+            await out.extend(lines)
 
     @commands.command(name="paycyberware", aliases=["pay_cyberware"])
     async def pay_cyberware(self, ctx: commands.Context, *args: str) -> None:
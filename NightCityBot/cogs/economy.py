@@ -1,9 +1,10 @@
 import logging
 import os
-import json
 from datetime import datetime, timedelta
 import asyncio
-from typing import Optional, List, Dict, Callable, Awaitable, Any
+import itertools
+from collections import deque
+from typing import Optional, List, Dict, Callable, Awaitable, Any, Collection
 from zoneinfo import ZoneInfo
 
 import discord
@@ -20,6 +21,8 @@ from NightCityBot.utils.constants import (
     TRAUMA_ROLE_COSTS,
 )
 from NightCityBot.utils import helpers
+from NightCityBot.utils.member_index import MemberIndex, is_tier_role
+from NightCityBot.utils.output import BufferedSender
 
 safe_filename = helpers.safe_filename
 
@@ -28,11 +31,39 @@ load_json_file = helpers.load_json_file
 save_json_file = helpers.save_json_file
 append_json_file = helpers.append_json_file
 import config
-from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+from NightCityBot.services.unbelievaboat import (
+    BalanceUpdateUnconfirmed,
+    get_shared_client,
+    parse_balance,
+)
+from NightCityBot.services.backup_store import BalanceBackupStore, SQLiteBackupStore
 from NightCityBot.services.trauma_team import TraumaTeamService
+from NightCityBot.services import rent_audit, rent_journal, rent_plan
+from NightCityBot.services.event_log import get_event_log
+from NightCityBot.services.open_log import OpenLogIndex
+from NightCityBot.services.rent_audit import RentAuditWriter
+from NightCityBot.services.rent_journal import JournalState, RentJournal
+from NightCityBot.services.rent_plan import (
+    Charge,
+    LineItem,
+    RentPlan,
+    build_rent_plan,
+    split_deduction,
+)
+from NightCityBot.services.sqlite_backend import get_backend
+from NightCityBot.services.state_store import get_state_store
 
 logger = logging.getLogger(__name__)
 
+# Members started ahead of the one being reported, per RENT_CONCURRENCY slot
+RENT_WINDOW_FACTOR = 4
+
+DISABLED_SYSTEM_MESSAGES = {
+    rent_plan.HOUSING: "⚠️ Housing rent system disabled.",
+    rent_plan.BUSINESS: "⚠️ Business rent system disabled.",
+    rent_plan.TRAUMA: "⚠️ Trauma Team system disabled.",
+}
+
 
 class Economy(commands.Cog):
     """Cog managing player economy and automated rent."""
@@ -40,19 +71,22 @@ class Economy(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the economy cog."""
         self.bot = bot
-        self.unbelievaboat = UnbelievaBoatAPI(config.UNBELIEVABOAT_API_TOKEN)
+        self.unbelievaboat = get_shared_client(bot)
         self.trauma_service = TraumaTeamService(bot)
-        self.open_log_lock = asyncio.Lock()
-        self.attend_lock = asyncio.Lock()
+        # Built from OPEN_LOG_FILE on the first !open_shop
+        self.open_index: Optional[OpenLogIndex] = None
+        backend = get_backend()
+        if backend:
+            self.backup_store = SQLiteBackupStore(backend)
+        else:
+            # Looked up at call time so tests can patch ``load_json_file``
+            self.backup_store = BalanceBackupStore(
+                load=lambda path, default=None: load_json_file(path, default=default)
+            )
         self.event_expires_at: Optional[datetime] = None
         self.event_started_at: Optional[datetime] = None
 
-    @staticmethod
-    def _split_deduction(cash: int, amount: int) -> tuple[int, int]:
-        """Return cash/bank portions ensuring negative cash isn't double counted."""
-        cash_deduct = min(max(cash, 0), amount)
-        bank_deduct = max(0, amount - cash_deduct)
-        return cash_deduct, bank_deduct
+    _split_deduction = staticmethod(split_deduction)
 
     @staticmethod
     def _get_cyber_weeks(entry: Any) -> int:
@@ -122,9 +156,6 @@ class Economy(commands.Cog):
                         f"🗑️ Deleted message in {message.channel.mention}: {message.content}",
                     )
 
-    def cog_unload(self):
-        self.bot.loop.create_task(self.unbelievaboat.close())
-
     def calculate_passive_income(self, role: str, open_count: int) -> int:
         """Calculate passive income based on role and number of shop opens."""
         if role == "Business Tier 0":
@@ -220,27 +251,24 @@ class Economy(commands.Cog):
         now_str = now.isoformat()
 
         duplicate = False
-        async with self.open_log_lock:
-            data = await load_json_file(config.OPEN_LOG_FILE, default={})
-
-            all_opens = data.get(user_id, [])
-            this_month_opens = [
-                datetime.fromisoformat(ts)
-                for ts in all_opens
-                if datetime.fromisoformat(ts).month == now.month
-                and datetime.fromisoformat(ts).year == now.year
-            ]
-
-            if any(ts.date() == now.date() for ts in this_month_opens):
+        open_log = get_event_log(config.OPEN_LOG_FILE)
+        async with open_log.lock(user_id):
+            if self.open_index is None:
+                self.open_index = OpenLogIndex.from_log(await open_log.snapshot())
+            elif self.open_index.total(user_id) != await open_log.count(user_id):
+                # The log was replaced behind the index (e.g. !backfill_logs)
+                self.open_index.resync(user_id, await open_log.entries(user_id))
+            opens = self.open_index.count(user_id, now.year, now.month)
+
+            if self.open_index.last_open(user_id, now.year, now.month) == now.date():
                 duplicate = True
             else:
-                open_count_before = min(len(this_month_opens), 4)
+                open_count_before = min(opens, 4)
                 open_count_after = min(open_count_before + 1, 4)
-                open_count_total = len(this_month_opens) + 1
+                open_count_total = opens + 1
 
-                all_opens.append(now_str)
-                data[user_id] = all_opens
-                await save_json_file(config.OPEN_LOG_FILE, data)
+                await open_log.append(user_id, now_str)
+                self.open_index.add(user_id, now)
 
         if duplicate:
             await ctx.send("❌ You've already logged a business opening today.")
@@ -310,18 +338,14 @@ class Economy(commands.Cog):
         user_id = str(ctx.author.id)
         now_str = now.isoformat()
 
-        async with self.attend_lock:
-            data = await load_json_file(config.ATTEND_LOG_FILE, default={})
-
-            all_logs = data.get(user_id, [])
-            parsed = [datetime.fromisoformat(ts) for ts in all_logs]
-            if any(ts >= event_start for ts in parsed):
+        attend_log = get_event_log(config.ATTEND_LOG_FILE)
+        async with attend_log.lock(user_id):
+            all_logs = await attend_log.entries(user_id)
+            if any(datetime.fromisoformat(ts) >= event_start for ts in all_logs):
                 await ctx.send("❌ You've already logged attendance for this event.")
                 return
 
-            all_logs.append(now_str)
-            data[user_id] = all_logs
-            await save_json_file(config.ATTEND_LOG_FILE, data)
+            await attend_log.append(user_id, now_str)
 
         reward = ATTEND_REWARD
         await self.unbelievaboat.update_balance(
@@ -331,65 +355,70 @@ class Economy(commands.Cog):
 
     def calculate_due(self, member: discord.Member) -> tuple[int, List[str]]:
         """Calculate upcoming rent, baseline, cyberware and subscription costs."""
+        plan = self.plan_rent(member, include_cyberware=True)
         details: List[str] = []
-        total = 0
-        role_names = [r.name for r in member.roles]
-        loa_role = member.guild.get_role(config.LOA_ROLE_ID)
-        on_loa = loa_role in member.roles if loa_role else False
-
-        if on_loa:
+        if plan.on_loa:
             details.append("LOA active: baseline, housing, and Trauma Team skipped")
-        else:
-            total += BASELINE_LIVING_COST
-            details.append(f"Baseline living cost: ${BASELINE_LIVING_COST}")
-            for role in role_names:
-                if "Housing Tier" in role:
-                    amount = ROLE_COSTS_HOUSING.get(role, 0)
-                    total += amount
-                    details.append(f"{role}: ${amount}")
-
-        for role in role_names:
-            if "Business Tier" in role:
-                amount = ROLE_COSTS_BUSINESS.get(role, 0)
-                total += amount
-                details.append(f"{role}: ${amount}")
-
-        if not on_loa:
-            trauma_role = next(
-                (r for r in member.roles if r.name in TRAUMA_ROLE_COSTS), None
-            )
-            if trauma_role:
-                cost = TRAUMA_ROLE_COSTS[trauma_role.name]
-                total += cost
-                details.append(f"{trauma_role.name}: ${cost}")
-
-            cyber = self.bot.get_cog("CyberwareManager")
-            if cyber:
-                guild = member.guild
-                checkup_role = guild.get_role(config.CYBER_CHECKUP_ROLE_ID)
-                medium = guild.get_role(config.CYBER_MEDIUM_ROLE_ID)
-                high = guild.get_role(config.CYBER_HIGH_ROLE_ID)
-                extreme = guild.get_role(config.CYBER_EXTREME_ROLE_ID)
-
-                level = None
-                if extreme and extreme in member.roles:
-                    level = "extreme"
-                elif high and high in member.roles:
-                    level = "high"
-                elif medium and medium in member.roles:
-                    level = "medium"
+        for item in plan.items:
+            details.extend(f"{name}: ${amount}" for name, amount in item.roles)
+        level, upcoming = self._upcoming_cyberware(member)
+        if not plan.on_loa and level and upcoming is None:
+            details.append("Cyberware checkup due — no med cost")
+        return plan.total_due, details
+
+    def _upcoming_cyberware(
+        self, member: discord.Member
+    ) -> tuple[Optional[str], Optional[tuple[int, int]]]:
+        """Return the member's cyberware level and ``(week, cost)`` of the next meds.
 
-                if level:
-                    weeks = self._get_cyber_weeks(cyber.data.get(str(member.id)))
-                    if checkup_role and checkup_role in member.roles:
-                        upcoming = weeks + 1
-                        cost = cyber.calculate_cost(level, upcoming)
-                        total += cost
-                        details.append(f"Cyberware meds week {upcoming}: ${cost}")
-                    else:
-                        details.append("Cyberware checkup due — no med cost")
+        The cost is ``None`` when the member has no checkup role yet.
+        """
+        cyber = self.bot.get_cog("CyberwareManager")
+        if not cyber:
+            return None, None
+        guild = member.guild
+        checkup_role = guild.get_role(config.CYBER_CHECKUP_ROLE_ID)
+        medium = guild.get_role(config.CYBER_MEDIUM_ROLE_ID)
+        high = guild.get_role(config.CYBER_HIGH_ROLE_ID)
+        extreme = guild.get_role(config.CYBER_EXTREME_ROLE_ID)
+
+        level = None
+        if extreme and extreme in member.roles:
+            level = "extreme"
+        elif high and high in member.roles:
+            level = "high"
+        elif medium and medium in member.roles:
+            level = "medium"
+        if not level or not (checkup_role and checkup_role in member.roles):
+            return level, None
+        upcoming = self._get_cyber_weeks(cyber.data.get(str(member.id))) + 1
+        return level, (upcoming, cyber.calculate_cost(level, upcoming))
+
+    def plan_rent(
+        self,
+        member: discord.Member,
+        balance: Optional[Dict[str, int]] = None,
+        *,
+        include_cyberware: bool = False,
+    ) -> RentPlan:
+        """Build the member's :class:`RentPlan` from roles and local data only."""
+        loa_role = member.guild.get_role(config.LOA_ROLE_ID)
+        on_loa = loa_role in member.roles if loa_role else False
+        control = self.bot.get_cog("SystemControl")
 
-        return total, details
+        def enabled(system: str) -> bool:
+            return not control or control.is_enabled(system)
+
+        cyberware = self._upcoming_cyberware(member)[1] if include_cyberware else None
+        return build_rent_plan(
+            [r.name for r in member.roles],
+            on_loa=on_loa,
+            balance=balance,
+            cyberware=cyberware,
+            housing=enabled("housing_rent"),
+            business=enabled("business_rent"),
+            trauma=enabled("trauma_team"),
+        )
 
     @commands.command(name="due")
     async def due(self, ctx, member: discord.Member | None = None) -> None:
@@ -419,7 +448,7 @@ class Economy(commands.Cog):
     @commands.command(name="last_payment")
     async def last_payment(self, ctx):
         """Show the details of your last automated payment."""
-        data = await load_json_file(config.LAST_PAYMENT_FILE, default={})
+        data = await get_state_store().load(config.LAST_PAYMENT_FILE, default={})
         summary = data.get(str(ctx.author.id))
         if not summary:
             await ctx.send("❌ No payment record found.")
@@ -428,79 +457,46 @@ class Economy(commands.Cog):
 
     def _list_obligations(self, member: discord.Member) -> List[tuple[str, int]]:
         """Return a list of (name, cost) tuples for a member's upcoming fees."""
-        obligations: List[tuple[str, int]] = []
-        role_names = [r.name for r in member.roles]
-
-        loa_role = member.guild.get_role(config.LOA_ROLE_ID)
-        on_loa = loa_role in member.roles if loa_role else False
+        plan = self.plan_rent(member, include_cyberware=True)
+        return [(item.name, item.amount) for item in plan.items]
 
-        if not on_loa:
-            obligations.append(("Baseline living cost", BASELINE_LIVING_COST))
-            for role in role_names:
-                if "Housing Tier" in role:
-                    amount = ROLE_COSTS_HOUSING.get(role, 0)
-                    obligations.append((role, amount))
+    async def _balance_snapshot(self) -> Dict[int, Dict[str, int]]:
+        """Return balances for the whole guild from the leaderboard.
 
-        for role in role_names:
-            if "Business Tier" in role:
-                amount = ROLE_COSTS_BUSINESS.get(role, 0)
-                obligations.append((role, amount))
-
-        if not on_loa:
-            trauma_role = next(
-                (r for r in member.roles if r.name in TRAUMA_ROLE_COSTS), None
+        Members missing from the snapshot should fall back to ``get_balance``.
+        """
+        try:
+            return await self.unbelievaboat.fetch_all_balances(
+                concurrency=getattr(config, "LEADERBOARD_CONCURRENCY", 1)
             )
-            if trauma_role:
-                obligations.append(
-                    (trauma_role.name, TRAUMA_ROLE_COSTS[trauma_role.name])
-                )
-
-            cyber = self.bot.get_cog("CyberwareManager")
-            if cyber:
-                guild = member.guild
-                checkup_role = guild.get_role(config.CYBER_CHECKUP_ROLE_ID)
-                medium = guild.get_role(config.CYBER_MEDIUM_ROLE_ID)
-                high = guild.get_role(config.CYBER_HIGH_ROLE_ID)
-                extreme = guild.get_role(config.CYBER_EXTREME_ROLE_ID)
-
-                level = None
-                if extreme and extreme in member.roles:
-                    level = "extreme"
-                elif high and high in member.roles:
-                    level = "high"
-                elif medium and medium in member.roles:
-                    level = "medium"
+        except Exception as e:
+            logger.warning("Leaderboard snapshot failed: %s", e)
+            return {}
 
-                if level:
-                    weeks = self._get_cyber_weeks(cyber.data.get(str(member.id)))
-                    if checkup_role and checkup_role in member.roles:
-                        upcoming = weeks + 1
-                        cost = cyber.calculate_cost(level, upcoming)
-                        obligations.append((f"Cyberware meds week {upcoming}", cost))
-        return obligations
+    async def _write_check_message(self) -> str:
+        """Run the cached run-level balance update check and describe it."""
+        if await self.unbelievaboat.check_write_access():
+            return "🔄 Balance update check passed."
+        return "⚠️ Balance update check failed."
 
     async def _evaluate_member_funds(
-        self, member: discord.Member
+        self, member: discord.Member, balance: Optional[Dict[str, int]] = None
     ) -> Optional[tuple[int, int, List[str], List[str]]]:
-        """Return balance, deficit, payable items and unpaid items."""
-        balance = await self.unbelievaboat.get_balance(member.id)
+        """Return balance, deficit, payable items and unpaid items.
+
+        ``balance`` may be supplied when it was already fetched by the caller.
+        """
+        if balance is None:
+            balance = await self.unbelievaboat.get_balance(member.id)
         if not balance:
             return None
 
-        total_funds = balance.get("cash", 0) + balance.get("bank", 0)
-        obligations = self._list_obligations(member)
-        remaining = total_funds
+        plan = self.plan_rent(member, balance, include_cyberware=True)
         payable: List[str] = []
         unpaid: List[str] = []
-        for name, cost in obligations:
-            if remaining >= cost:
-                remaining -= cost
-                payable.append(f"{name} (${cost})")
-            else:
-                unpaid.append(f"{name} (${cost})")
-        deficit = sum(c for _, c in obligations) - total_funds
-        if deficit < 0:
-            deficit = 0
+        for item in plan.items:
+            (payable if item.payable else unpaid).append(f"{item.name} (${item.amount})")
+        total_funds, deficit = plan.funds, plan.deficit
         return total_funds, deficit, payable, unpaid
 
     async def backup_balances(
@@ -511,7 +507,7 @@ class Economy(commands.Cog):
         balances: Optional[Dict[int, Dict[str, int]]] = None,
         progress_hook: Optional[Callable[[discord.Member, int, int], Awaitable[None]]] = None,
     ) -> None:
-        """Append current balances for members to their backup files.
+        """Append current balances for members to their backup history.
 
         ``balances`` can be supplied to avoid fetching the balance for each
         member again if it was already retrieved by the caller.
@@ -519,8 +515,6 @@ class Economy(commands.Cog):
         When ``progress_hook`` is provided it will be awaited for each member
         with ``(member, index, total)`` to report progress.
         """
-        backup_dir = Path(config.BALANCE_BACKUP_DIR)
-        backup_dir.mkdir(exist_ok=True)
         total = len(members)
         for idx, m in enumerate(members, start=1):
             bal = balances.get(m.id) if balances else None
@@ -528,67 +522,23 @@ class Economy(commands.Cog):
                 bal = await self.unbelievaboat.get_balance(m.id)
             if not bal:
                 continue
-            file_path = backup_dir / f"balance_backup_{m.id}.json"
-
-            prev_entries = await load_json_file(file_path, default=[])
-            if not isinstance(prev_entries, list):
-                prev_entries = []
-
-            insert_index = len(prev_entries)
-            if label.endswith("_after") and label.startswith("collect_"):
-                before_label = label.replace("_after", "_before")
-                for i in range(len(prev_entries) - 1, -1, -1):
-                    if prev_entries[i].get("label") == before_label:
-                        insert_index = i + 1
-                        break
-
-            if prev_entries and insert_index > 0:
-                ref = prev_entries[insert_index - 1]
-                prev_total = ref.get("cash", 0) + ref.get("bank", 0)
-            else:
-                prev_total = 0
-
-            change = (bal.get("cash", 0) + bal.get("bank", 0)) - prev_total
-
-            entry = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "label": label,
-                "cash": bal.get("cash", 0),
-                "bank": bal.get("bank", 0),
-                "change": change,
-            }
-
-            prev_entries.insert(insert_index, entry)
-            await save_json_file(file_path, prev_entries)
+            await self.backup_store.append(m.id, label, bal)
             if progress_hook:
                 await progress_hook(m, idx, total)
 
     async def record_last_payment(self, member: discord.Member, summary: str) -> None:
         """Store the last payment summary for a member."""
-        data = await load_json_file(config.LAST_PAYMENT_FILE, default={})
+        store = get_state_store()
+        data = await store.load(config.LAST_PAYMENT_FILE, default={})
         data[str(member.id)] = summary
-        await save_json_file(config.LAST_PAYMENT_FILE, data)
+        await store.save(config.LAST_PAYMENT_FILE, data)
 
     async def _label_used_recently(
         self, member: discord.Member, label: str, days: int = 30
     ) -> bool:
         """Return ``True`` if the given label was used within ``days`` days."""
-        backup_dir = Path(config.BALANCE_BACKUP_DIR)
-        file_path = backup_dir / f"balance_backup_{member.id}.json"
-        entries = await load_json_file(file_path, default=[])
-        if not isinstance(entries, list):
-            return False
-        for entry in reversed(entries):
-            if entry.get("label") == label:
-                ts = entry.get("timestamp")
-                if not ts:
-                    return False
-                try:
-                    dt = datetime.fromisoformat(ts)
-                except Exception:
-                    return False
-                return datetime.utcnow() - dt < timedelta(days=days)
-        return False
+        last = await self.backup_store.last_used(member.id, label)
+        return last is not None and datetime.utcnow() - last < timedelta(days=days)
 
     @commands.command(name="backup_balances")
     @commands.has_permissions(administrator=True)
@@ -601,9 +551,10 @@ class Economy(commands.Cog):
         file_path = backup_dir / filename
 
         data: Dict[int, Dict[str, int]] = {}
+        snapshot = await self._balance_snapshot()
         total = len(members)
         for idx, m in enumerate(members, start=1):
-            bal = await self.unbelievaboat.get_balance(m.id)
+            bal = snapshot.get(m.id) or await self.unbelievaboat.get_balance(m.id)
             if not bal:
                 await ctx.send(
                     f"⚠️ Failed to fetch balance for {m.display_name} ({idx}/{total})"
@@ -662,7 +613,7 @@ class Economy(commands.Cog):
                     uid = int(uid_str)
                 except ValueError:
                     continue
-                current = await self.unbelievaboat.get_balance(uid)
+                current = await self.unbelievaboat.get_balance(uid, fresh=True)
                 if not current:
                     continue
                 payload = {}
@@ -685,24 +636,13 @@ class Economy(commands.Cog):
         # Otherwise treat it as a label that should be searched in member logs
         label = identifier
         restored = 0
-        for path in backup_dir.glob("balance_backup_*.json"):
-            entries = await load_json_file(path, default=[])
-            if not isinstance(entries, list):
-                continue
-            bal = None
-            for entry in reversed(entries):
-                if entry.get("label") == label:
-                    bal = {"cash": entry.get("cash", 0), "bank": entry.get("bank", 0)}
-                    break
-            if not bal:
-                continue
-
-            try:
-                uid = int(path.stem.split("_")[-1])
-            except ValueError:
+        for uid in await self.backup_store.member_ids():
+            entry = await self.backup_store.latest(uid, label)
+            if not entry:
                 continue
+            bal = {"cash": entry.get("cash", 0), "bank": entry.get("bank", 0)}
 
-            current = await self.unbelievaboat.get_balance(uid)
+            current = await self.unbelievaboat.get_balance(uid, fresh=True)
             if not current:
                 continue
             payload = {}
@@ -742,11 +682,17 @@ class Economy(commands.Cog):
             filename = identifier or f"balance_backup_{member.id}.json"
 
         backup_path = Path(config.BALANCE_BACKUP_DIR) / filename
-        if not backup_path.exists():
+        own_history = backup_path == self.backup_store.path(member.id)
+        if not backup_path.exists() and not (
+            own_history and await self.backup_store.has_history(member.id)
+        ):
             await ctx.send("❌ Backup file not found.")
             return
 
-        data = await load_json_file(backup_path, default={})
+        if own_history:
+            data = await self.backup_store.entries(member.id)
+        else:
+            data = await load_json_file(backup_path, default={})
         bal = None
         if label:
             if isinstance(data, list):
@@ -775,7 +721,7 @@ class Economy(commands.Cog):
             if not bal:
                 await ctx.send("❌ User not found in backup file.")
                 return
-        current = await self.unbelievaboat.get_balance(member.id)
+        current = await self.unbelievaboat.get_balance(member.id, fresh=True)
         if not current:
             await ctx.send("❌ Failed to fetch current balance.")
             return
@@ -797,6 +743,20 @@ class Economy(commands.Cog):
         else:
             await ctx.send("⚠️ Balance already matches backup.")
 
+    async def _apply_charge(
+        self,
+        member: discord.Member,
+        payload: Dict[str, int],
+        reason: str,
+        charge: Optional[Charge] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """PATCH ``payload`` for ``member`` or hand it to ``charge`` if given."""
+        if charge is not None:
+            return await charge(payload, reason)
+        return await self.unbelievaboat.update_balance_returning(
+            member.id, payload, reason=reason
+        )
+
     async def deduct_flat_fee(
         self,
         member: discord.Member,
@@ -806,6 +766,7 @@ class Economy(commands.Cog):
         amount: int = BASELINE_LIVING_COST,
         *,
         dry_run: bool = False,
+        charge: Optional[Charge] = None,
     ) -> tuple[bool, int, int]:
         total = (cash or 0) + (bank or 0)
         if total < amount:
@@ -822,13 +783,19 @@ class Economy(commands.Cog):
             payload["bank"] = -deduct_bank
 
         success = True
+        updated = None
         if not dry_run:
-            success = await self.unbelievaboat.update_balance(
-                member.id, payload, reason="Flat Monthly Fee"
+            result = await self._apply_charge(
+                member, payload, rent_plan.CHARGE_REASONS[rent_plan.BASELINE], charge
             )
+            success = result is not None
+            updated = parse_balance(result)
         if success:
-            cash -= deduct_cash
-            bank -= deduct_bank
+            if updated:
+                cash, bank = updated["cash"], updated["bank"]
+            else:
+                cash -= deduct_cash
+                bank -= deduct_bank
             log.append(
                 f"{'💸 Would deduct' if dry_run else '💸 Deducted'} flat monthly fee of ${amount} (Cash: ${deduct_cash}, Bank: ${deduct_bank})."
             )
@@ -853,61 +820,12 @@ class Economy(commands.Cog):
         if control and not control.is_enabled("housing_rent"):
             log.append("⚠️ Housing rent system disabled.")
             return cash, bank
-        housing_total = 0
-        for role in roles:
-            if "Housing Tier" in role:
-                amount = ROLE_COSTS_HOUSING.get(role, 0)
-                housing_total += amount
-                log.append(f"🔎 Housing Role {role} → Rent: ${amount}")
-
-        if housing_total == 0:
-            return cash, bank
-
-        total = (cash or 0) + (bank or 0)
-        if total < housing_total:
-            log.append(
-                f"❌ Cannot pay housing rent of ${housing_total}. Would result in negative balance."
-            )
-            if eviction_channel and not dry_run:
-                await eviction_channel.send(
-                    f"🚨 <@{member.id}> — Housing Rent due: ${housing_total} — **FAILED** (insufficient funds) 🚨\n## You have **7 days** to pay or face eviction."
-                )
-            log.append(
-                f"⚠️ Housing rent skipped for <@{member.id}> due to insufficient funds."
-            )
+        item = rent_plan.tier_item(rent_plan.HOUSING, roles)
+        if item is None:
             return cash, bank
-
-        deduct_cash, deduct_bank = self._split_deduction(cash, housing_total)
-        payload: Dict[str, int] = {}
-        if deduct_cash > 0:
-            payload["cash"] = -deduct_cash
-        if deduct_bank > 0:
-            payload["bank"] = -deduct_bank
-
-        success = True
-        if not dry_run:
-            success = await self.unbelievaboat.update_balance(
-                member.id, payload, reason="Housing Rent"
-            )
-        if success:
-            cash -= deduct_cash
-            bank -= deduct_bank
-            log.append(
-                f"🧮 {'Would subtract' if dry_run else 'Subtracted'} housing rent ${housing_total} — ${deduct_cash} from cash, ${deduct_bank} from bank."
-            )
-            log.append(
-                f"📈 Balance after housing rent — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
-            )
-            log.append("✅ Housing Rent collection completed. Notice Sent to #rent")
-            if rent_log_channel and not dry_run:
-                await rent_log_channel.send(
-                    f"✅ <@{member.id}> — Housing Rent paid: ${housing_total}"
-                )
-        else:
-            log.append(
-                "❌ Failed to deduct housing rent despite having sufficient funds."
-            )
-        return cash, bank
+        return await self._charge_tier_rent(
+            member, item, cash, bank, log, rent_log_channel, eviction_channel, dry_run=dry_run
+        )
 
     async def process_business_rent(
         self,
@@ -925,31 +843,48 @@ class Economy(commands.Cog):
         if control and not control.is_enabled("business_rent"):
             log.append("⚠️ Business rent system disabled.")
             return cash, bank
-        business_total = 0
-        for role in roles:
-            if "Business Tier" in role:
-                amount = ROLE_COSTS_BUSINESS.get(role, 0)
-                business_total += amount
-                log.append(f"🔎 Business Role {role} → Rent: ${amount}")
-
-        if business_total == 0:
+        item = rent_plan.tier_item(rent_plan.BUSINESS, roles)
+        if item is None:
             return cash, bank
+        return await self._charge_tier_rent(
+            member, item, cash, bank, log, rent_log_channel, eviction_channel, dry_run=dry_run
+        )
+
+    async def _charge_tier_rent(
+        self,
+        member: discord.Member,
+        item: LineItem,
+        cash: int,
+        bank: int,
+        log: List[str],
+        rent_log_channel: Optional[discord.TextChannel],
+        eviction_channel: Optional[discord.TextChannel],
+        *,
+        dry_run: bool = False,
+        charge: Optional[Charge] = None,
+    ) -> tuple[int, int]:
+        """Apply a housing or business rent line item and return the new balance."""
+        label = "Housing" if item.kind == rent_plan.HOUSING else "Business"
+        for role, amount in item.roles:
+            log.append(f"🔎 {label} Role {role} → Rent: ${amount}")
+        rent_total = item.amount
 
         total = (cash or 0) + (bank or 0)
-        if total < business_total:
+        if total < rent_total:
             log.append(
-                f"❌ Cannot pay business rent of ${business_total}. Would result in negative balance."
+                f"❌ Cannot pay {label.lower()} rent of ${rent_total}. Would result in negative balance."
             )
             if eviction_channel and not dry_run:
                 await eviction_channel.send(
-                    f"🚨 <@{member.id}> — Business Rent due: ${business_total} — **FAILED** (insufficient funds) 🚨\n## You have **7 days** to pay or face eviction."
+                    f"🚨 <@{member.id}> — {label} Rent due: ${rent_total} — **FAILED** (insufficient funds) 🚨\n## You have **7 days** to pay or face eviction."
                 )
             log.append(
-                f"⚠️ Business rent skipped for <@{member.id}> due to insufficient funds."
+                f"⚠️ {label} rent skipped for <@{member.id}> due to insufficient funds."
             )
             return cash, bank
 
-        deduct_cash, deduct_bank = self._split_deduction(cash, business_total)
+        # Re-split against the live balance in case an earlier charge failed
+        deduct_cash, deduct_bank = split_deduction(cash, rent_total)
         payload: Dict[str, int] = {}
         if deduct_cash > 0:
             payload["cash"] = -deduct_cash
@@ -957,30 +892,252 @@ class Economy(commands.Cog):
             payload["bank"] = -deduct_bank
 
         success = True
+        updated = None
         if not dry_run:
-            success = await self.unbelievaboat.update_balance(
-                member.id, payload, reason="Business Rent"
+            result = await self._apply_charge(
+                member, payload, rent_plan.CHARGE_REASONS[item.kind], charge
             )
+            success = result is not None
+            updated = parse_balance(result)
         if success:
-            cash -= deduct_cash
-            bank -= deduct_bank
+            if updated:
+                cash, bank = updated["cash"], updated["bank"]
+            else:
+                cash -= deduct_cash
+                bank -= deduct_bank
             log.append(
-                f"🧮 {'Would subtract' if dry_run else 'Subtracted'} business rent ${business_total} — ${deduct_cash} from cash, ${deduct_bank} from bank."
+                f"🧮 {'Would subtract' if dry_run else 'Subtracted'} {label.lower()} rent ${rent_total} — ${deduct_cash} from cash, ${deduct_bank} from bank."
             )
             log.append(
-                f"📈 Balance after business rent — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
+                f"📈 Balance after {label.lower()} rent — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
             )
-            log.append("✅ Business Rent collection completed. Notice Sent to #rent")
+            log.append(f"✅ {label} Rent collection completed. Notice Sent to #rent")
             if rent_log_channel and not dry_run:
                 await rent_log_channel.send(
-                    f"✅ <@{member.id}> — Business Rent paid: ${business_total}"
+                    f"✅ <@{member.id}> — {label} Rent paid: ${rent_total}"
                 )
         else:
             log.append(
-                "❌ Failed to deduct business rent despite having sufficient funds."
+                f"❌ Failed to deduct {label.lower()} rent despite having sufficient funds."
             )
         return cash, bank
 
+    def _preview_trauma(
+        self, item: LineItem, cash: int, bank: int, log: List[str]
+    ) -> tuple[int, int]:
+        """Log a simulated Trauma Team charge without searching the forum."""
+        if not isinstance(
+            self.bot.get_channel(config.TRAUMA_FORUM_CHANNEL_ID), discord.ForumChannel
+        ):
+            log.append("⚠️ TT forum channel not found.")
+            return cash, bank
+        log.append(f"🔎 {item.name} → Subscription: ${item.amount}")
+        log.append(f"💊 Deducting ${item.amount} for Trauma Team plan: {item.name}")
+        if (cash or 0) + (bank or 0) < item.amount:
+            log.append("❌ Insufficient funds for Trauma payment.")
+            return cash, bank
+        deduct_cash, deduct_bank = split_deduction(cash, item.amount)
+        log.append("✅ (Simulated) Trauma Team payment would succeed.")
+        return cash - deduct_cash, bank - deduct_bank
+
+    def _settled_charge(
+        self, reasons: List[str], result: Optional[Dict[str, Any]], fallback: Charge
+    ) -> Charge:
+        """Return a ``charge`` that reports ``result`` for already applied ``reasons``.
+
+        Anything else is sent through ``fallback``.
+        """
+        settled = set(reasons)
+
+        async def charge(payload: Dict[str, int], reason: str) -> Optional[Dict[str, Any]]:
+            if reason not in settled:
+                return await fallback(payload, reason)
+            settled.discard(reason)
+            if result is None or not settled:
+                return result
+            # Earlier steps subtract locally; the last one gets the balance
+            return {"merged": True}
+
+        return charge
+
+    async def _merge_plan_charges(
+        self, member: discord.Member, plan: RentPlan, patch: Charge
+    ) -> Optional[Charge]:
+        """Apply every payable charge in ``plan`` with a single PATCH.
+
+        Returns a ``charge`` callable for the rent steps that reports the
+        outcome of the merged PATCH instead of sending its own. Charges the
+        merge didn't cover still go through ``patch`` separately. Returns
+        ``None`` if the merged PATCH was rejected so every step is charged on
+        its own. If it may have been applied, the balance is re-read: a
+        balance that shows the merged charge settles the steps, an
+        unchanged one falls back to separate charges and anything else
+        leaves the member for ``!resume_rent``.
+        """
+        items = [
+            item
+            for item in plan.items
+            if item.payable and item.kind in rent_plan.CHARGE_REASONS
+        ]
+        trauma_forum = self.bot.get_channel(config.TRAUMA_FORUM_CHANNEL_ID)
+        if not isinstance(trauma_forum, discord.ForumChannel):
+            # The Trauma Team step skips the charge without its forum
+            items = [item for item in items if item.kind != rent_plan.TRAUMA]
+        if not items:
+            return None
+
+        reasons = [rent_plan.CHARGE_REASONS[item.kind] for item in items]
+        payload: Dict[str, int] = {}
+        for item in items:
+            for field, value in item.payload().items():
+                payload[field] = payload.get(field, 0) + value
+        try:
+            result = await patch(payload, " + ".join(reasons))
+        except BalanceUpdateUnconfirmed:
+            current = parse_balance(
+                await self.unbelievaboat.get_balance(member.id, fresh=True)
+            )
+            start = (plan.start_cash, plan.start_bank)
+            charged = (
+                start[0] + payload.get("cash", 0),
+                start[1] + payload.get("bank", 0),
+            )
+            if current and (current["cash"], current["bank"]) == charged:
+                return self._settled_charge(reasons, current, patch)
+            if not current or (current["cash"], current["bank"]) != start:
+                raise
+            result = None
+        if result is None:
+            logger.warning(
+                "Merged rent PATCH failed for %s; charging items separately", member.id
+            )
+            return None
+        return self._settled_charge(reasons, result, patch)
+
+    async def _execute_rent_plan(
+        self,
+        member: discord.Member,
+        plan: RentPlan,
+        cash: int,
+        bank: int,
+        log: List[str],
+        rent_log_channel: Optional[discord.TextChannel],
+        eviction_channel: Optional[discord.TextChannel],
+        *,
+        dry_run: bool = False,
+        flush: Optional[Callable[[int], None]] = None,
+        merge: bool = False,
+        journal: Optional[RentJournal] = None,
+        done: Collection[str] = (),
+        settled: Optional[tuple[List[str], Optional[Dict[str, Any]]]] = None,
+        outcomes: Optional[Dict[str, bool]] = None,
+    ) -> tuple[int, int]:
+        """Apply ``plan`` step by step and return the resulting balance.
+
+        Each step re-checks the live balance so a failed PATCH earlier in the
+        plan doesn't cause later charges to overdraw. Dry runs make no API or
+        Discord calls at all. With ``merge`` the affordable charges are sent
+        as one PATCH up front and the steps only log and post notices.
+
+        ``journal`` records every PATCH and finished step. When resuming,
+        ``done`` lists the steps to skip and ``settled`` gives the reasons and
+        result of a charge that went through before the interruption.
+        ``outcomes`` is filled with whether each charge reason went through.
+        """
+
+        async def patch(payload: Dict[str, int], reason: str) -> Optional[Dict[str, Any]]:
+            if journal:
+                # ``cash``/``bank`` still hold the balance before this step
+                await journal.record(
+                    rent_journal.INTENT,
+                    member=member.id,
+                    reasons=reason.split(" + "),
+                    payload=payload,
+                    balance={"cash": cash, "bank": bank},
+                )
+            result = await self._apply_charge(member, payload, reason)
+            if journal:
+                await journal.record(
+                    rent_journal.CHARGED, member=member.id, ok=result is not None
+                )
+            return result
+
+        charge = None if dry_run else patch
+        if not dry_run and settled:
+            charge = self._settled_charge(settled[0], settled[1], patch)
+        elif merge and not dry_run and not done and plan.has_balance:
+            charge = await self._merge_plan_charges(member, plan, patch) or charge
+        if charge is not None and outcomes is not None:
+            apply = charge
+
+            async def charge(payload: Dict[str, int], reason: str) -> Optional[Dict[str, Any]]:
+                result = await apply(payload, reason)
+                outcomes[reason] = result is not None
+                return result
+
+        for kind in (rent_plan.BASELINE, rent_plan.HOUSING, rent_plan.BUSINESS, rent_plan.TRAUMA):
+            start = len(log)
+            if kind in done:
+                log.append(
+                    f"⏭️ {rent_plan.CHARGE_REASONS[kind]} already handled before the interruption."
+                )
+                if flush:
+                    flush(start)
+                continue
+            if kind in plan.disabled:
+                log.append(DISABLED_SYSTEM_MESSAGES[kind])
+            item = plan.get(kind)
+            if item is None:
+                if flush and len(log) > start:
+                    flush(start)
+                continue
+            if kind == rent_plan.BASELINE:
+                base_ok, cash, bank = await self.deduct_flat_fee(
+                    member, cash, bank, log, item.amount, dry_run=dry_run, charge=charge
+                )
+                if not base_ok:
+                    if eviction_channel and not dry_run:
+                        await eviction_channel.send(
+                            f"⚠️ <@{member.id}> could not pay baseline living cost (${item.amount})."
+                        )
+                    log.append(
+                        "⚠️ Baseline living cost unpaid. Continuing with rent steps."
+                    )
+            elif kind == rent_plan.TRAUMA:
+                if dry_run:
+                    cash, bank = self._preview_trauma(item, cash, bank, log)
+                else:
+                    updated = await self.trauma_service.process_trauma_team_payment(
+                        member,
+                        log=log,
+                        balance={"cash": cash, "bank": bank},
+                        charge=charge,
+                    )
+                    if updated:
+                        cash, bank = updated["cash"], updated["bank"]
+            else:
+                cash, bank = await self._charge_tier_rent(
+                    member,
+                    item,
+                    cash,
+                    bank,
+                    log,
+                    rent_log_channel,
+                    eviction_channel,
+                    dry_run=dry_run,
+                    charge=charge,
+                )
+            if journal and not dry_run:
+                await journal.record(
+                    rent_journal.STEP,
+                    member=member.id,
+                    kind=kind,
+                    reason=rent_plan.CHARGE_REASONS[kind],
+                )
+            if flush:
+                flush(start)
+        return cash, bank
+
     @commands.command(aliases=["collecthousing"])
     @commands.has_permissions(administrator=True)
     async def collect_housing(self, ctx, *args):
@@ -1034,7 +1191,7 @@ class Economy(commands.Cog):
         role_names = [r.name for r in user.roles]
         log.append(f"🧾 Roles: {role_names}")
 
-        balance_data = await self.unbelievaboat.get_balance(user.id)
+        balance_data = await self.unbelievaboat.get_balance(user.id, fresh=True)
         if not balance_data:
             log.append("❌ Could not fetch balance.")
             await ctx.send(f"⚠️ Could not fetch balance for <@{user.id}>")
@@ -1059,15 +1216,10 @@ class Economy(commands.Cog):
             user, role_names, cash, bank, log, rent_log_channel, eviction_channel
         )
 
-        final = await self.unbelievaboat.get_balance(user.id)
-        if final:
-            final_cash = final.get("cash", 0)
-            final_bank = final.get("bank", 0)
-            final_total = final_cash + final_bank
-        else:
-            final_cash = cash
-            final_bank = bank
-            final_total = final_cash + final_bank
+        # process_*_rent returns the balance reported by the PATCH response
+        final_cash = cash
+        final_bank = bank
+        final_total = final_cash + final_bank
         log.append(
             f"📊 Final balance — Cash: ${final_cash:,}, Bank: ${final_bank:,}, Total: ${final_total:,}"
         )
@@ -1136,7 +1288,7 @@ class Economy(commands.Cog):
         role_names = [r.name for r in user.roles]
         log.append(f"🧾 Roles: {role_names}")
 
-        balance_data = await self.unbelievaboat.get_balance(user.id)
+        balance_data = await self.unbelievaboat.get_balance(user.id, fresh=True)
         if not balance_data:
             log.append("❌ Could not fetch balance.")
             await ctx.send(f"⚠️ Could not fetch balance for <@{user.id}>")
@@ -1155,15 +1307,10 @@ class Economy(commands.Cog):
             user, role_names, cash, bank, log, rent_log_channel, eviction_channel
         )
 
-        final = await self.unbelievaboat.get_balance(user.id)
-        if final:
-            final_cash = final.get("cash", 0)
-            final_bank = final.get("bank", 0)
-            final_total = final_cash + final_bank
-        else:
-            final_cash = cash
-            final_bank = bank
-            final_total = final_cash + final_bank
+        # process_*_rent returns the balance reported by the PATCH response
+        final_cash = cash
+        final_bank = bank
+        final_total = final_cash + final_bank
         log.append(
             f"📊 Final balance — Cash: ${final_cash:,}, Bank: ${final_bank:,}, Total: ${final_total:,}"
         )
@@ -1219,7 +1366,7 @@ class Economy(commands.Cog):
         log: List[str] = [
             f"💊 Manual Trauma Team Subscription Processing for <@{user.id}>"
         ]
-        balance_data = await self.unbelievaboat.get_balance(user.id)
+        balance_data = await self.unbelievaboat.get_balance(user.id, fresh=True)
         if not balance_data:
             log.append("❌ Could not fetch balance.")
             await ctx.send(f"⚠️ Could not fetch balance for <@{user.id}>")
@@ -1233,17 +1380,12 @@ class Economy(commands.Cog):
         log.append(f"💵 Balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: ${total:,}")
 
         await ctx.send(f"Working on <@{user.id}>")
-        await self.trauma_service.process_trauma_team_payment(user, log=log)
-
-        final = await self.unbelievaboat.get_balance(user.id)
-        if final:
-            final_cash = final.get("cash", 0)
-            final_bank = final.get("bank", 0)
-            final_total = final_cash + final_bank
-        else:
-            final_cash = cash
-            final_bank = bank
-            final_total = final_cash + final_bank
+        updated = await self.trauma_service.process_trauma_team_payment(
+            user, log=log, balance=balance_data
+        )
+        final_cash = updated["cash"] if updated else cash
+        final_bank = updated["bank"] if updated else bank
+        final_total = final_cash + final_bank
         log.append(
             f"📊 Final balance — Cash: ${final_cash:,}, Bank: ${final_bank:,}, Total: ${final_total:,}"
         )
@@ -1260,6 +1402,239 @@ class Economy(commands.Cog):
         if admin_cog:
             await admin_cog.log_audit(ctx.author, summary)
 
+    def _select_members(
+        self, guild: discord.Guild, target_user: Optional[discord.Member] = None
+    ) -> List[discord.Member]:
+        """Return the approved members a rent run or simulation covers.
+
+        With ``target_user`` only that member is returned, provided they have
+        an approved character.
+        """
+        if target_user is None:
+            return MemberIndex(guild.members).rent_members()
+        for m in guild.members:
+            if m.id == target_user.id:
+                if any(r.id == config.APPROVED_ROLE_ID for r in m.roles):
+                    return [m]
+                break
+        return []
+
+    async def _collect_member_rent(
+        self,
+        ctx,
+        member: discord.Member,
+        idx: int,
+        total: int,
+        *,
+        dry_run: bool,
+        verbose: bool,
+        force: bool,
+        preview_dm: bool,
+        eviction_channel,
+        rent_log_channel,
+        merge_charges: bool = False,
+        journal: Optional[RentJournal] = None,
+        resume: Optional[JournalState] = None,
+        results: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> List[tuple[str, str]]:
+        """Run the rent steps for one member and return the buffered output.
+
+        Output is returned as ``(kind, text)`` pairs so members processed
+        concurrently can be reported in member order: ``send`` goes to the
+        invoking channel, ``audit`` to the audit log, ``record`` to the rent
+        audit file, ``unavailable`` marks a member skipped because the
+        economy backend is down and ``unfinished`` one that hit an error. With ``resume`` the member continues from
+        what the interrupted run's journal says was already done.
+
+        When ``results`` is given the member's final ``cash`` and ``bank``
+        and the names of the ``paid`` and ``unpaid`` items are stored in it
+        under their ID.
+        """
+        out: List[tuple[str, str]] = []
+
+        def send(text: str) -> None:
+            out.append(("send", text))
+
+        def flush(start: int) -> None:
+            if verbose:
+                for line in log[start:]:
+                    send(line)
+
+        if not self.unbelievaboat.available:
+            out.append(("unavailable", str(member.id)))
+            return out
+        try:
+            if not force and resume is None:
+                recent = await self._label_used_recently(
+                    member, "collect_rent_after"
+                )
+                recent = recent or await self._label_used_recently(
+                    member, "collect_housing_after"
+                )
+                recent = recent or await self._label_used_recently(
+                    member, "collect_business_after"
+                )
+                recent = recent or await self._label_used_recently(
+                    member, "collect_trauma_after"
+                )
+                if recent:
+                    send(f"⏭️ Skipping <@{member.id}> — rent recently collected.")
+                    if journal:
+                        await journal.record(rent_journal.MEMBER_DONE, member=member.id)
+                    return out
+
+            if not any(r.id == config.APPROVED_ROLE_ID for r in member.roles):
+                send(f"⏭️ Skipping <@{member.id}> — no approved character.")
+                if journal:
+                    await journal.record(rent_journal.MEMBER_DONE, member=member.id)
+                return out
+
+            progress = f"{idx}/{total}"
+            log: List[str] = [f"🔍 **Working on:** <@{member.id}> ({progress})"]
+            send(log[0])
+
+            role_names = [r.name for r in member.roles]
+            app_roles = [r for r in role_names if "Tier" in r]
+            log.append(f"🏷️ Detected roles: {', '.join(app_roles) or 'None'}")
+            flush(len(log) - 1)
+
+            loa_role = member.guild.get_role(config.LOA_ROLE_ID)
+            on_loa = loa_role in member.roles if loa_role else False
+            if on_loa:
+                log.append("🏖️ Member is on LOA — skipping personal fees.")
+                flush(len(log) - 1)
+
+            bal = await self.unbelievaboat.get_balance(
+                member.id, fresh=not dry_run
+            )
+            if not bal:
+                log.append("⚠️ Could not fetch balance.")
+                summary = "\n".join(log)
+                flush(0)
+                if not verbose:
+                    send(f"⚠️ Could not fetch balance for <@{member.id}>")
+                if dry_run:
+                    out.append(("audit", summary))
+                return out
+            cash, bank = bal["cash"], bal["bank"]
+            log.append(
+                f"💵 Starting balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
+            )
+            flush(len(log) - 1)
+
+            done: set = set()
+            settled = None
+            if resume is not None:
+                progress = resume.member(member.id)
+                done = progress.steps
+                if progress.pending:
+                    pending = progress.pending
+                    before = pending["balance"]
+                    start_bal = (before.get("cash", 0), before.get("bank", 0))
+                    charged = (
+                        start_bal[0] + pending["payload"].get("cash", 0),
+                        start_bal[1] + pending["payload"].get("bank", 0),
+                    )
+                    if pending["ok"] or (cash, bank) == charged:
+                        # The PATCH went through; replay its steps without
+                        # charging again, starting from the balance before it.
+                        settled = (pending["reasons"], {"cash": cash, "bank": bank})
+                        cash, bank = start_bal
+                        log.append(
+                            f"↩️ {', '.join(pending['reasons'])} went through before the interruption."
+                        )
+                        flush(len(log) - 1)
+                    elif (cash, bank) != start_bal:
+                        log.append(
+                            "⚠️ Balance changed since the interrupted charge — "
+                            f"{', '.join(pending['reasons'])} needs a manual check."
+                        )
+                        flush(len(log) - 1)
+                        send(f"⚠️ Could not resume <@{member.id}> — check manually.")
+                        out.append(("record", "\n".join(log)))
+                        return out
+
+            plan = self.plan_rent(member, {"cash": cash, "bank": bank})
+            outcomes: Dict[str, bool] = {}
+            cash, bank = await self._execute_rent_plan(
+                member,
+                plan,
+                cash,
+                bank,
+                log,
+                rent_log_channel,
+                eviction_channel,
+                dry_run=dry_run,
+                flush=flush,
+                merge=merge_charges,
+                journal=journal,
+                done=done,
+                settled=settled,
+                outcomes=outcomes,
+            )
+
+            if results is not None:
+                paid: List[str] = []
+                unpaid = [item.name for item in plan.unpaid]
+                for item in plan.items:
+                    if not item.payable:
+                        continue
+                    # Dry runs and steps finished before an interruption
+                    # have no PATCH to go by; trust the plan for those.
+                    if (
+                        dry_run
+                        or item.kind in done
+                        or outcomes.get(rent_plan.CHARGE_REASONS.get(item.kind))
+                    ):
+                        paid.append(item.name)
+                    else:
+                        unpaid.append(item.name)
+                results[member.id] = {
+                    "cash": cash,
+                    "bank": bank,
+                    "paid": paid,
+                    "unpaid": unpaid,
+                }
+
+            log.append(
+                f"📊 {'Projected' if dry_run else 'Final'} balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
+            )
+            flush(len(log) - 1)
+
+            if dry_run and preview_dm:
+                log.append("💌 Would DM summary to user.")
+                flush(len(log) - 1)
+                log.append("📝 Would record last_payment entry.")
+                flush(len(log) - 1)
+
+            summary = "\n".join(log)
+            if not verbose:
+                send(f"✅ Completed for <@{member.id}>")
+            if dry_run:
+                out.append(("audit", summary))
+            else:
+                dm_failed = False
+                try:
+                    await member.send(summary)
+                except Exception:
+                    log.append("⚠️ Could not send DM.")
+                    dm_failed = True
+                if dm_failed:
+                    summary = "\n".join(log)
+                    flush(len(log) - 1)
+                await self.record_last_payment(member, summary)
+                if journal:
+                    await journal.record(rent_journal.MEMBER_DONE, member=member.id)
+            out.append(("record", summary))
+
+        except Exception as e:
+            send(f"❌ Error processing <@{member.id}>: `{e}`")
+            if dry_run:
+                out.append(("audit", f"Error processing <@{member.id}>: {e}"))
+            out.append(("record", f"Error processing <@{member.id}>: {e}"))
+            out.append(("unfinished", str(member.id)))
+        return out
+
     async def run_rent_collection(
         self,
         ctx,
@@ -1269,16 +1644,69 @@ class Economy(commands.Cog):
         verbose: bool = False,
         force: bool = False,
         preview_dm: bool = False,
+        merge_charges: Optional[bool] = None,
+        resume: Optional[JournalState] = None,
     ):
         """Internal helper for rent collection and simulation.
 
         When ``verbose`` is ``False`` only minimal status messages are sent.
+        ``merge_charges`` applies each member's charges in one PATCH and
+        defaults to ``config.RENT_MERGE_CHARGES``. Real runs are journaled;
+        ``resume`` finishes the members an interrupted run left behind.
+        Output to ``ctx`` is packed into as few messages as possible and real
+        runs stream each member's summary to the monthly rent audit log.
         """
-        await ctx.send(
+        audit = None if dry_run else RentAuditWriter(rent_audit.audit_path())
+        async with BufferedSender(ctx.send) as out:
+            try:
+                await self._run_rent_collection(
+                    ctx,
+                    out,
+                    audit,
+                    target_user=target_user,
+                    dry_run=dry_run,
+                    verbose=verbose,
+                    force=force,
+                    preview_dm=preview_dm,
+                    merge_charges=merge_charges,
+                    resume=resume,
+                )
+            finally:
+                if audit:
+                    await audit.close()
+                if not dry_run:
+                    await get_state_store().flush(config.LAST_PAYMENT_FILE)
+
+    async def _run_rent_collection(
+        self,
+        ctx,
+        out: BufferedSender,
+        audit: Optional[RentAuditWriter],
+        *,
+        target_user: Optional[discord.Member] = None,
+        dry_run: bool = False,
+        verbose: bool = False,
+        force: bool = False,
+        preview_dm: bool = False,
+        merge_charges: Optional[bool] = None,
+        resume: Optional[JournalState] = None,
+    ):
+        """Run a rent collection, sending channel output through ``out``.
+
+        ``audit`` receives the rent audit entries; it is ``None`` for dry runs.
+        """
+        if merge_charges is None:
+            merge_charges = getattr(config, "RENT_MERGE_CHARGES", False)
+        await out.send(
             "🧪 Starting rent simulation..."
             if dry_run
             else "🚦 Starting rent collection..."
         )
+        if not self.unbelievaboat.available:
+            await out.send(
+                "❌ Economy backend unavailable — rent run aborted. Try again later."
+            )
+            return
 
         notify_user = None
         if not dry_run:
@@ -1296,77 +1724,81 @@ class Economy(commands.Cog):
                 except Exception:
                     pass
 
-        audit_lines: List[str] = []
-        if not target_user:
-            if Path(config.OPEN_LOG_FILE).exists():
-                business_open_log = await load_json_file(
-                    config.OPEN_LOG_FILE, default={}
-                )
-                if not dry_run:
-                    backup_base = f"open_history_{datetime.utcnow():%B_%Y}.json"
-                    backup_path = Path(backup_base)
-                    counter = 1
-                    while backup_path.exists():
-                        backup_path = Path(f"{backup_base}_{counter}")
-                        counter += 1
-                    Path(config.OPEN_LOG_FILE).rename(backup_path)
-            else:
-                business_open_log = {}
+        # An interrupted run being resumed already rotated the open log
+        if resume is None and not target_user and not dry_run:
+            backup_base = f"open_history_{datetime.utcnow():%B_%Y}.json"
+            backup_path = Path(backup_base)
+            counter = 1
+            while backup_path.exists():
+                backup_path = Path(f"{backup_base}_{counter}")
+                counter += 1
+            await get_event_log(config.OPEN_LOG_FILE).rotate(backup_path)
+            self.open_index = OpenLogIndex()
 
-            if not dry_run:
-                await save_json_file(config.OPEN_LOG_FILE, {})
-        else:
-            if Path(config.OPEN_LOG_FILE).exists():
-                business_open_log = await load_json_file(
-                    config.OPEN_LOG_FILE, default={}
-                )
-            else:
-                business_open_log = {}
-
-        if not force and not target_user and Path(config.LAST_RENT_FILE).exists():
+        if (
+            not force
+            and not target_user
+            and resume is None
+            and Path(config.LAST_RENT_FILE).exists()
+        ):
             try:
                 data = await load_json_file(config.LAST_RENT_FILE, default=None)
                 last_run = datetime.fromisoformat(data["last_run"])
             except Exception:
                 last_run = None
             if last_run and datetime.utcnow() - last_run < timedelta(days=30):
-                await ctx.send(
+                await out.send(
                     "⚠️ Rent already collected in the last 30 days. Use -force to override."
                 )
                 return
-        if not target_user and not dry_run:
-            with open(config.LAST_RENT_FILE, "w") as f:
-                json.dump({"last_run": datetime.utcnow().isoformat()}, f)
+        if not target_user and not dry_run and resume is None:
+            await save_json_file(
+                config.LAST_RENT_FILE, {"last_run": datetime.utcnow().isoformat()}
+            )
 
         members_to_process: List[discord.Member] = []
-        for m in ctx.guild.members:
-            if target_user and m.id == target_user.id:
-                if any(r.id == config.APPROVED_ROLE_ID for r in m.roles):
-                    members_to_process = [m]
-                break
-            if not target_user:
-                has_verified = any(r.id == config.VERIFIED_ROLE_ID for r in m.roles)
-                has_tier = any("Tier" in r.name for r in m.roles)
-                has_approved = any(r.id == config.APPROVED_ROLE_ID for r in m.roles)
-                if (has_verified or has_tier) and has_approved:
-                    members_to_process.append(m)
+        if resume is not None:
+            for member_id in resume.remaining:
+                m = ctx.guild.get_member(member_id)
+                if m is None:
+                    await out.send(f"⏭️ <@{member_id}> is no longer in the server.")
+                    continue
+                members_to_process.append(m)
+        else:
+            members_to_process = self._select_members(ctx.guild, target_user)
         if not members_to_process:
             if target_user:
-                await ctx.send(
+                await out.send(
                     f"⏭️ <@{target_user.id}> has no approved character."
                 )
             else:
-                await ctx.send("❌ No matching members found.")
+                await out.send("❌ No matching members found.")
             return
 
-        await ctx.send(f"ℹ️ {len(members_to_process)} member(s) to process.")
+        await out.send(f"ℹ️ {len(members_to_process)} member(s) to process.")
 
+        journal = None
         if not dry_run:
-            await ctx.send("💾 Backing up member balances…")
+            if resume is not None:
+                journal = RentJournal(resume.run_id)
+            else:
+                journal = RentJournal(rent_journal.new_run_id())
+                await journal.record(
+                    rent_journal.RUN_START,
+                    members=[m.id for m in members_to_process],
+                    options={"merge": merge_charges},
+                )
+            await out.send(
+                f"🧾 Rent journal `{journal.run_id}` — if this run is interrupted, "
+                f"finish it with `!resume_rent {journal.run_id}`."
+            )
+
+        if not dry_run and resume is None:
+            await out.send("💾 Backing up member balances…")
 
             async def progress(member: discord.Member, idx: int, total: int) -> None:
                 if verbose:
-                    await ctx.send(f"💾 Backed up {member.display_name} ({idx}/{total})")
+                    await out.send(f"💾 Backed up {member.display_name} ({idx}/{total})")
 
             await self.backup_balances(
                 members_to_process,
@@ -1374,216 +1806,122 @@ class Economy(commands.Cog):
                 progress_hook=progress if verbose else None,
             )
 
-            await ctx.send("💾 Balance backup complete.")
+            await out.send("💾 Balance backup complete.")
 
         eviction_channel = ctx.guild.get_channel(config.EVICTION_CHANNEL_ID)
         rent_log_channel = ctx.guild.get_channel(config.RENT_LOG_CHANNEL_ID)
         admin_cog = self.bot.get_cog("Admin")
 
-        async def _flush(start: int) -> None:
-            if verbose:
-                for line in log[start:]:
-                    await ctx.send(line)
-
-        for idx, member in enumerate(members_to_process, start=1):
-            try:
-                if not force:
-                    recent = await self._label_used_recently(
-                        member, "collect_rent_after"
-                    )
-                    recent = recent or await self._label_used_recently(
-                        member, "collect_housing_after"
-                    )
-                    recent = recent or await self._label_used_recently(
-                        member, "collect_business_after"
-                    )
-                    recent = recent or await self._label_used_recently(
-                        member, "collect_trauma_after"
-                    )
-                    if recent:
-                        await ctx.send(
-                            f"⏭️ Skipping <@{member.id}> — rent recently collected."
-                        )
-                        continue
-
-                if not any(r.id == config.APPROVED_ROLE_ID for r in member.roles):
-                    await ctx.send(
-                        f"⏭️ Skipping <@{member.id}> — no approved character."
-                    )
-                    continue
-
-                progress = f"{idx}/{len(members_to_process)}"
-                log: List[str] = [f"🔍 **Working on:** <@{member.id}> ({progress})"]
-                await ctx.send(log[0])
-
-                role_names = [r.name for r in member.roles]
-                app_roles = [r for r in role_names if "Tier" in r]
-                log.append(f"🏷️ Detected roles: {', '.join(app_roles) or 'None'}")
-                await _flush(len(log) - 1)
-
-                loa_role = member.guild.get_role(config.LOA_ROLE_ID)
-                on_loa = loa_role in member.roles if loa_role else False
-                if on_loa:
-                    log.append("🏖️ Member is on LOA — skipping personal fees.")
-                    await _flush(len(log) - 1)
-
-                bal = await self.unbelievaboat.get_balance(member.id)
-                if not bal:
-                    log.append("⚠️ Could not fetch balance.")
-                    summary = "\n".join(log)
-                    await _flush(0)
-                    if not verbose:
-                        await ctx.send(f"⚠️ Could not fetch balance for <@{member.id}>")
-                    if dry_run and admin_cog:
-                        await admin_cog.log_audit(ctx.author, summary)
-                    continue
-                cash, bank = bal["cash"], bal["bank"]
-                log.append(
-                    f"💵 Starting balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
-                )
-                await _flush(len(log) - 1)
-
-                if dry_run:
-                    check = await self.unbelievaboat.verify_balance_ops(member.id)
-                    log.append(
-                        "🔄 Balance check passed."
-                        if check
-                        else "⚠️ Balance update check failed."
-                    )
-                    await _flush(len(log) - 1)
-
-                if not on_loa:
-                    start = len(log)
-                    base_ok, cash, bank = await self.deduct_flat_fee(
-                        member, cash, bank, log, BASELINE_LIVING_COST, dry_run=dry_run
-                    )
-                    if not base_ok:
-                        if eviction_channel and not dry_run:
-                            await eviction_channel.send(
-                                f"⚠️ <@{member.id}> could not pay baseline living cost (${BASELINE_LIVING_COST})."
-                            )
-                        log.append(
-                            "⚠️ Baseline living cost unpaid. Continuing with rent steps."
-                        )
-                    await _flush(start)
-
-                start = len(log)
-                cash, bank = (
-                    await self.process_housing_rent(
-                        member,
-                        app_roles,
-                        cash,
-                        bank,
-                        log,
-                        rent_log_channel,
-                        eviction_channel,
-                        dry_run=dry_run,
-                    )
-                    if not on_loa
-                    else (cash, bank)
-                )
-                await _flush(start)
-                start = len(log)
-                cash, bank = await self.process_business_rent(
+        if dry_run:
+            check_msg = await self._write_check_message()
+            await out.send(check_msg)
+            if admin_cog:
+                await admin_cog.log_audit(ctx.author, check_msg)
+
+        total = len(members_to_process)
+        # Final balances and items per member, reused once the run is over
+        results: Dict[int, Dict[str, Any]] = {}
+        concurrency = max(1, getattr(config, "RENT_CONCURRENCY", 1))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(idx: int, member: discord.Member) -> List[tuple[str, str]]:
+            async with semaphore:
+                return await self._collect_member_rent(
+                    ctx,
                     member,
-                    app_roles,
-                    cash,
-                    bank,
-                    log,
-                    rent_log_channel,
-                    eviction_channel,
+                    idx,
+                    total,
                     dry_run=dry_run,
+                    verbose=verbose,
+                    force=force,
+                    preview_dm=preview_dm,
+                    eviction_channel=eviction_channel,
+                    rent_log_channel=rent_log_channel,
+                    merge_charges=merge_charges,
+                    journal=journal,
+                    resume=resume,
+                    results=results,
                 )
-                await _flush(start)
-
-                if not on_loa:
-                    start = len(log)
-                    await self.trauma_service.process_trauma_team_payment(
-                        member, log=log, dry_run=dry_run
-                    )
-                    await _flush(start)
-
-                if not dry_run:
-                    final = await self.unbelievaboat.get_balance(member.id)
-                    if final:
-                        cash = final.get("cash", 0)
-                        bank = final.get("bank", 0)
-
-                log.append(
-                    f"📊 {'Projected' if dry_run else 'Final'} balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
-                )
-                await _flush(len(log) - 1)
 
-                if dry_run and preview_dm:
-                    log.append("💌 Would DM summary to user.")
-                    await _flush(len(log) - 1)
-                    log.append("📝 Would record last_payment entry.")
-                    await _flush(len(log) - 1)
-
-                summary = "\n".join(log)
-                if verbose:
-                    pass
-                else:
-                    await ctx.send(f"✅ Completed for <@{member.id}>")
-                if dry_run and admin_cog:
-                    await admin_cog.log_audit(ctx.author, summary)
-                if not dry_run:
-                    dm_failed = False
-                    try:
-                        await member.send(summary)
-                    except Exception:
-                        log.append("⚠️ Could not send DM.")
-                        dm_failed = True
-                    if dm_failed:
-                        summary = "\n".join(log)
-                        await _flush(len(log) - 1)
-                    await self.record_last_payment(member, summary)
-                audit_lines.append(summary)
-
-            except Exception as e:
-                await ctx.send(f"❌ Error processing <@{member.id}>: `{e}`")
-                if dry_run and admin_cog:
-                    await admin_cog.log_audit(
-                        ctx.author, f"Error processing <@{member.id}>: {e}"
-                    )
-                audit_lines.append(f"Error processing <@{member.id}>: {e}")
+        # Members are processed concurrently but their output is replayed in
+        # member order so the log reads the same as a sequential run. Only a
+        # window of tasks exists at a time; the next member starts as the
+        # oldest one is reported.
+        pending = enumerate(members_to_process, start=1)
+        window: deque[asyncio.Future] = deque(
+            asyncio.ensure_future(process(idx, member))
+            for idx, member in itertools.islice(pending, concurrency * RENT_WINDOW_FACTOR)
+        )
+        unprocessed = unfinished = 0
+        while window:
+            output = await window.popleft()
+            for idx, member in itertools.islice(pending, 1):
+                window.append(asyncio.ensure_future(process(idx, member)))
+            for kind, text in output:
+                try:
+                    if kind == "send":
+                        await out.send(text)
+                    elif kind == "audit" and admin_cog:
+                        await admin_cog.log_audit(ctx.author, text)
+                    elif kind == "record" and audit:
+                        await audit.write(text)
+                    elif kind == "unavailable":
+                        unprocessed += 1
+                    elif kind == "unfinished":
+                        unfinished += 1
+                except Exception:
+                    logger.exception("Failed to report rent output: %s", text)
+        if unprocessed:
+            msg = (
+                "❌ Economy backend unavailable — stopping rent run with "
+                f"{unprocessed} member(s) left unprocessed."
+            )
+            if journal:
+                msg += f" Finish them later with `!resume_rent {journal.run_id}`."
+            await out.send(msg)
+            if audit:
+                await audit.write(msg)
+        if unfinished and journal:
+            msg = (
+                f"⚠️ {unfinished} member(s) hit errors. Finish them with "
+                f"`!resume_rent {journal.run_id}`."
+            )
+            await out.send(msg)
+            if audit:
+                await audit.write(msg)
 
         if not dry_run:
 
             async def progress_after(member: discord.Member, idx: int, total: int) -> None:
                 if verbose:
-                    await ctx.send(f"💾 Finalised {member.display_name} ({idx}/{total})")
+                    await out.send(f"💾 Finalised {member.display_name} ({idx}/{total})")
 
             await self.backup_balances(
                 members_to_process,
                 label="collect_rent_after",
+                balances=results,
                 progress_hook=progress_after if verbose else None,
             )
+            if journal and not unprocessed and not unfinished:
+                await journal.record(rent_journal.RUN_END)
         end_msg = (
             "✅ Rent simulation completed."
             if dry_run
             else "✅ Rent collection completed."
         )
-        await ctx.send(end_msg)
+        await out.send(end_msg)
         if dry_run and admin_cog:
             await admin_cog.log_audit(ctx.author, end_msg)
         if not dry_run:
-            audit_lines.append(end_msg)
-            audit_dir = Path(getattr(config, "RENT_AUDIT_DIR", "rent_audits"))
-            audit_dir.mkdir(exist_ok=True)
-            log_file = audit_dir / f"rent_audit_{datetime.utcnow():%B_%Y}.log"
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write("\n".join(audit_lines) + "\n")
+            await audit.write(end_msg)
 
             if notify_user:
                 summary_lines: List[str] = []
                 for m in members_to_process:
-                    result = await self._evaluate_member_funds(m)
-                    if not result:
-                        continue
-                    _total, deficit, _payable, unpaid = result
-                    if deficit <= 0:
+                    result = results.get(m.id)
+                    if not result or not result["unpaid"]:
                         continue
+                    unpaid = result["unpaid"]
                     baseline_only = all(
                         item.startswith("Baseline living cost") for item in unpaid
                     )
@@ -1593,9 +1931,8 @@ class Economy(commands.Cog):
                         has_trauma = any(r.name in TRAUMA_ROLE_COSTS for r in m.roles)
                         if not (has_housing or has_business or has_trauma):
                             continue
-                    items = [item.split(" ($")[0] for item in unpaid]
                     summary_lines.append(
-                        f"{m.display_name} can't pay: {', '.join(items)}"
+                        f"{m.display_name} can't pay: {', '.join(unpaid)}"
                     )
                 summary_text = "\n".join(summary_lines) if summary_lines else "✅ Everyone paid their dues."
                 try:
@@ -1613,9 +1950,11 @@ class Economy(commands.Cog):
         """Global or per-member rent collection.
 
         Pass ``-v``/``--verbose`` for detailed output and ``-force`` to ignore the 30 day cooldown.
+        ``-merge`` applies each member's charges in a single balance update.
         """
         verbose = False
         force = False
+        merge = None
         if target_user is None:
             converter = commands.MemberConverter()
             remaining = []
@@ -1625,6 +1964,8 @@ class Economy(commands.Cog):
                     verbose = True
                 elif lower in {"-force", "--force", "force", "-f"}:
                     force = True
+                elif lower in {"-merge", "--merge"}:
+                    merge = True
                 else:
                     remaining.append(arg)
             for arg in remaining:
@@ -1640,8 +1981,39 @@ class Economy(commands.Cog):
                     verbose = True
                 elif lower in {"-force", "--force", "force", "-f"}:
                     force = True
+                elif lower in {"-merge", "--merge"}:
+                    merge = True
         await self.run_rent_collection(
-            ctx, target_user=target_user, dry_run=False, verbose=verbose, force=force
+            ctx,
+            target_user=target_user,
+            dry_run=False,
+            verbose=verbose,
+            force=force,
+            merge_charges=merge,
+        )
+
+    @commands.command(name="resume_rent")
+    @commands.has_permissions(administrator=True)
+    async def resume_rent(self, ctx, run_id: str, *args: str) -> None:
+        """Finish an interrupted rent collection from its journal.
+
+        Members the run finished are skipped and charges that already went
+        through are not sent again. Use ``-v`` for detailed output.
+        """
+        verbose = any(a.lower() in {"-v", "--verbose", "verbose"} for a in args)
+        state = await asyncio.to_thread(rent_journal.load_journal, run_id)
+        if state is None:
+            await ctx.send(f"❌ No rent journal found for `{run_id}`.")
+            return
+        if state.finished or not state.remaining:
+            await ctx.send(f"✅ Rent run `{run_id}` already completed.")
+            return
+        await self.run_rent_collection(
+            ctx,
+            dry_run=False,
+            verbose=verbose,
+            merge_charges=state.options.get("merge", False),
+            resume=state,
         )
 
     @commands.command(aliases=["simulaterent"])
@@ -1772,18 +2144,7 @@ class Economy(commands.Cog):
                     continue
 
         await ctx.send("🧪 Starting combined simulation...")
-        members: List[discord.Member] = []
-        for m in ctx.guild.members:
-            if target_user and m.id == target_user.id:
-                if any(r.id == config.APPROVED_ROLE_ID for r in m.roles):
-                    members = [m]
-                break
-            if not target_user:
-                has_verified = any(r.id == config.VERIFIED_ROLE_ID for r in m.roles)
-                has_tier = any("Tier" in r.name for r in m.roles)
-                has_approved = any(r.id == config.APPROVED_ROLE_ID for r in m.roles)
-                if (has_verified or has_tier) and has_approved:
-                    members.append(m)
+        members = self._select_members(ctx.guild, target_user)
         if not members:
             if target_user:
                 await ctx.send(
@@ -1799,127 +2160,80 @@ class Economy(commands.Cog):
             return
 
         admin_cog = self.bot.get_cog("Admin")
+        snapshot = await self._balance_snapshot() if not target_user else {}
+        await ctx.send(await self._write_check_message())
 
-        for member in members:
-            if not any(r.id == config.APPROVED_ROLE_ID for r in member.roles):
-                await ctx.send(f"⏭️ Skipping <@{member.id}> — no approved character.")
-                continue
-            log: List[str] = [f"🔍 **Working on:** <@{member.id}>"]
-            role_names = [r.name for r in member.roles]
-            app_roles = [r for r in role_names if "Tier" in r]
-            log.append(f"🏷️ Detected roles: {', '.join(app_roles) or 'None'}")
-
-            loa_role = member.guild.get_role(config.LOA_ROLE_ID)
-            on_loa = loa_role in member.roles if loa_role else False
-            if on_loa:
-                log.append("🏖️ Member is on LOA — skipping personal fees.")
-
-            bal = await self.unbelievaboat.get_balance(member.id)
-            if not bal:
-                log.append("⚠️ Could not fetch balance.")
-                summary = "\n".join(log)
-                if verbose:
-                    await ctx.send(summary)
-                else:
-                    await ctx.send(f"⚠️ Could not fetch balance for <@{member.id}>")
-                if admin_cog:
-                    await admin_cog.log_audit(ctx.author, summary)
-                continue
-            cash = bal.get("cash", 0)
-            bank = bal.get("bank", 0)
-            log.append(
-                f"💵 Starting balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
-            )
+        # Member summaries are packed into as few messages as possible
+        async with BufferedSender(ctx.send) as out:
+            for member in members:
+                if not any(r.id == config.APPROVED_ROLE_ID for r in member.roles):
+                    await out.send(f"⏭️ Skipping <@{member.id}> — no approved character.")
+                    continue
+                log: List[str] = [f"🔍 **Working on:** <@{member.id}>"]
+                role_names = [r.name for r in member.roles]
+                app_roles = [r for r in role_names if "Tier" in r]
+                log.append(f"🏷️ Detected roles: {', '.join(app_roles) or 'None'}")
 
-            check = await self.unbelievaboat.verify_balance_ops(member.id)
-            log.append(
-                "🔄 Balance check passed."
-                if check
-                else "⚠️ Balance update check failed."
-            )
+                loa_role = member.guild.get_role(config.LOA_ROLE_ID)
+                on_loa = loa_role in member.roles if loa_role else False
+                if on_loa:
+                    log.append("🏖️ Member is on LOA — skipping personal fees.")
 
-            if not on_loa:
-                _ok, cash, bank = await self.deduct_flat_fee(
-                    member, cash, bank, log, BASELINE_LIVING_COST, dry_run=True
+                bal = snapshot.get(member.id) or await self.unbelievaboat.get_balance(
+                    member.id
                 )
-                if not _ok:
-                    log.append(
-                        "⚠️ Baseline living cost unpaid. Continuing with rent steps."
-                    )
-
-            cash, bank = (
-                await self.process_housing_rent(
-                    member,
-                    app_roles,
-                    cash,
-                    bank,
-                    log,
-                    None,
-                    None,
-                    dry_run=True,
+                if not bal:
+                    log.append("⚠️ Could not fetch balance.")
+                    summary = "\n".join(log)
+                    if verbose:
+                        await out.send(summary)
+                    else:
+                        await out.send(f"⚠️ Could not fetch balance for <@{member.id}>")
+                    if admin_cog:
+                        await admin_cog.log_audit(ctx.author, summary)
+                    continue
+                cash = bal.get("cash", 0)
+                bank = bal.get("bank", 0)
+                log.append(
+                    f"💵 Starting balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
                 )
-                if not on_loa
-                else (cash, bank)
-            )
-            cash, bank = await self.process_business_rent(
-                member,
-                app_roles,
-                cash,
-                bank,
-                log,
-                None,
-                None,
-                dry_run=True,
-            )
 
-            if not on_loa:
-                await self.trauma_service.process_trauma_team_payment(
-                    member, log=log, dry_run=True
+                plan = self.plan_rent(
+                    member, {"cash": cash, "bank": bank}, include_cyberware=True
+                )
+                cash, bank = await self._execute_rent_plan(
+                    member, plan, cash, bank, log, None, None, dry_run=True
                 )
 
-            # Cyberware preview
-            checkup = member.guild.get_role(config.CYBER_CHECKUP_ROLE_ID)
-            medium = member.guild.get_role(config.CYBER_MEDIUM_ROLE_ID)
-            high = member.guild.get_role(config.CYBER_HIGH_ROLE_ID)
-            extreme = member.guild.get_role(config.CYBER_EXTREME_ROLE_ID)
-            level = None
-            if extreme and extreme in member.roles:
-                level = "extreme"
-            elif high and high in member.roles:
-                level = "high"
-            elif medium and medium in member.roles:
-                level = "medium"
-            if level and checkup and checkup in member.roles:
-                weeks = self._get_cyber_weeks(cyber.data.get(str(member.id))) + 1
-                cost = cyber.calculate_cost(level, weeks)
-                log.append(f"💊 Cyberware meds week {weeks}: ${cost}")
-                total = (cash or 0) + (bank or 0)
-                if total >= cost:
-                    deduct_cash = min(max(cash, 0), cost)
-                    deduct_bank = max(0, cost - deduct_cash)
-                    cash -= deduct_cash
-                    bank -= deduct_bank
-                    log.append(
-                        f"🧮 Would subtract cyberware meds ${cost} — ${deduct_cash} from cash, {deduct_bank} from bank."
-                    )
-                else:
-                    log.append(
-                        f"❌ Cannot pay cyberware meds of ${cost}. Would result in negative balance."
-                    )
-            elif level:
-                log.append("Cyberware checkup due — no med cost")
+                # Cyberware preview
+                meds = plan.get(rent_plan.CYBERWARE)
+                if meds:
+                    log.append(f"💊 {meds.name}: ${meds.amount}")
+                    if (cash or 0) + (bank or 0) >= meds.amount:
+                        deduct_cash, deduct_bank = split_deduction(cash, meds.amount)
+                        cash -= deduct_cash
+                        bank -= deduct_bank
+                        log.append(
+                            f"🧮 Would subtract cyberware meds ${meds.amount} — ${deduct_cash} from cash, {deduct_bank} from bank."
+                        )
+                    else:
+                        log.append(
+                            f"❌ Cannot pay cyberware meds of ${meds.amount}. Would result in negative balance."
+                        )
+                elif not on_loa and self._upcoming_cyberware(member)[0]:
+                    log.append("Cyberware checkup due — no med cost")
 
-            log.append(
-                f"📊 Projected balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
-            )
+                log.append(
+                    f"📊 Projected balance — Cash: ${cash:,}, Bank: ${bank:,}, Total: {(cash or 0) + (bank or 0):,}"
+                )
 
-            summary = "\n".join(log)
-            # Always send the detailed summary for each member.
-            await ctx.send(summary)
-            if admin_cog:
-                await admin_cog.log_audit(ctx.author, summary)
+                summary = "\n".join(log)
+                # Always send the detailed summary for each member.
+                await out.send(summary)
+                if admin_cog:
+                    await admin_cog.log_audit(ctx.author, summary)
 
-        await ctx.send("✅ Simulation complete.")
+            await out.send("✅ Simulation complete.")
 
     @commands.command(name="list_deficits")
     @commands.has_permissions(administrator=True)
@@ -1932,15 +2246,14 @@ class Economy(commands.Cog):
         ``simulate_all`` for a detailed balance preview.
         """
         await ctx.send("🔎 Checking member funds...")
-        members = [
-            m
-            for m in ctx.guild.members
-            if any("Tier" in r.name for r in m.roles)
-            or any(r.id == config.VERIFIED_ROLE_ID for r in m.roles)
-        ]
+        index = MemberIndex(ctx.guild.members)
+        members = index.ordered(
+            index.with_role_name(is_tier_role) | index.with_role_id(config.VERIFIED_ROLE_ID)
+        )
         failures: List[str] = []
+        snapshot = await self._balance_snapshot()
         for m in members:
-            result = await self._evaluate_member_funds(m)
+            result = await self._evaluate_member_funds(m, snapshot.get(m.id))
             if not result:
                 continue
             _total, deficit, _payable, unpaid = result
@@ -1960,7 +2273,7 @@ class Economy(commands.Cog):
             )
 
         if failures:
-            for line in failures:
-                await ctx.send(line)
+            async with BufferedSender(ctx.send) as out:
+                await out.extend(failures)
         else:
             await ctx.send("✅ Everyone can cover their upcoming obligations.")
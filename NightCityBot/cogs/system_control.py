@@ -2,7 +2,7 @@ import discord
 from discord.ext import commands
 from pathlib import Path
 import config
-from NightCityBot.utils.helpers import load_json_file, save_json_file
+from NightCityBot.services.state_store import get_state_store
 
 SYSTEMS = [
     "cyberware",
@@ -25,14 +25,14 @@ class SystemControl(commands.Cog):
 
     async def load_status(self):
         path = Path(config.SYSTEM_STATUS_FILE)
-        self.status = await load_json_file(path, default={})
+        self.status = await get_state_store().load(path, default={})
         updated = False
         for system in SYSTEMS:
             if system not in self.status:
                 self.status[system] = False
                 updated = True
         if updated:
-            await save_json_file(path, self.status)
+            await get_state_store().save(path, self.status)
 
     def is_enabled(self, system: str) -> bool:
         return self.status.get(system, False)
@@ -41,7 +41,7 @@ class SystemControl(commands.Cog):
         if system not in SYSTEMS:
             return False
         self.status[system] = value
-        await save_json_file(Path(config.SYSTEM_STATUS_FILE), self.status)
+        await get_state_store().save(Path(config.SYSTEM_STATUS_FILE), self.status)
         return True
 
     @commands.command(aliases=["enablesystem", "es", "systemenable"])
@@ -0,0 +1,106 @@
+import bisect
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket
+# catches everything slower.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointStats:
+    """Counters and a latency histogram for one API endpoint."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.attempts = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self.rate_limit_sleep = 0.0
+        self.backoff_sleep = 0.0
+        self.limiter_wait = 0.0
+        self.upstream_time = 0.0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors: Counter = Counter()
+
+    def observe(self, elapsed: float, ok: bool) -> None:
+        self.calls += 1
+        if not ok:
+            self.failures += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Return the bucket bound containing ``fraction`` of calls."""
+        if not self.calls:
+            return None
+        target = fraction * self.calls
+        seen = 0
+        for idx, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return LATENCY_BUCKETS[idx] if idx < len(LATENCY_BUCKETS) else self.max_time
+        return self.max_time
+
+    def snapshot(self) -> Dict:
+        buckets = [f"<={b}s" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "failures": self.failures,
+            "rate_limited": self.rate_limited,
+            "rate_limit_sleep": round(self.rate_limit_sleep, 3),
+            "backoff_sleep": round(self.backoff_sleep, 3),
+            "limiter_wait": round(self.limiter_wait, 3),
+            "upstream_time": round(self.upstream_time, 3),
+            "total_time": round(self.total_time, 3),
+            "max_time": round(self.max_time, 3),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "histogram": dict(zip(buckets, self.histogram)),
+            "errors": dict(self.errors),
+        }
+
+
+class ApiMetrics:
+    """Per-endpoint request metrics for the UnbelievaBoat client.
+
+    ``upstream_time`` is time spent waiting on HTTP responses while
+    ``limiter_wait`` and the sleep counters are time spent in our own
+    throttling and retry logic, which separates slow upstream calls from
+    self-inflicted delays.
+    """
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    def endpoint(self, name: str) -> EndpointStats:
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointStats()
+        return stats
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {name: stats.snapshot() for name, stats in list(self.endpoints.items())}
+
+    def summary_lines(self) -> List[str]:
+        """Return one human readable line per endpoint."""
+        lines = []
+        for name, stats in sorted(self.endpoints.items()):
+            p50 = stats.percentile(0.5) or 0
+            p95 = stats.percentile(0.95) or 0
+            errors = ", ".join(f"{k}×{v}" for k, v in sorted(stats.errors.items()))
+            lines.append(
+                f"`{name}` — {stats.calls} calls, {stats.attempts} attempts, "
+                f"{stats.failures} failed | p50 ≤{p50:.2f}s p95 ≤{p95:.2f}s "
+                f"max {stats.max_time:.2f}s | upstream {stats.upstream_time:.1f}s, "
+                f"limiter {stats.limiter_wait:.1f}s | 429×{stats.rate_limited} "
+                f"(slept {stats.rate_limit_sleep:.1f}s), backoff {stats.backoff_sleep:.1f}s"
+                + (f" | errors: {errors}" if errors else "")
+            )
+        return lines
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from NightCityBot.utils import helpers
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "label_index.json"
+# Compacted ``.json`` histories and their ``.jsonl`` append logs; spelled
+# out so temporary ``.json.*.tmp`` files aren't picked up
+BACKUP_GLOBS = ("balance_backup_*.json", "balance_backup_*.jsonl")
+# Minimum seconds between index saves; anything newer is rescanned on load
+SAVE_INTERVAL = 30.0
+
+
+class BackupLabelIndex:
+    """Persistent ``(user_id, label) -> last timestamp`` index of balance backups.
+
+    The index is stored as ``label_index.json`` next to the backup files and
+    loaded once per backup directory. Backup files written after the index
+    was last saved (e.g. the bot died mid-backup) are rescanned on load, so
+    a lookup never misses a label that is on disk. That also means saves
+    can be batched: the index is written at most every ``SAVE_INTERVAL``
+    seconds. ``reader`` returns the entries stored in one backup file.
+    """
+
+    def __init__(
+        self, reader: Optional[Callable[[Path], Awaitable[List[Dict]]]] = None
+    ) -> None:
+        self._reader = reader or self._read_json
+        self._dir: Optional[Path] = None
+        self._labels: Dict[str, Dict[str, str]] = {}
+        self._lock = asyncio.Lock()
+        self._saved_at = 0.0
+
+    async def _ensure_loaded(self, backup_dir: Path) -> None:
+        if self._dir == backup_dir:
+            return
+        async with self._lock:
+            if self._dir == backup_dir:
+                return
+            path = backup_dir / INDEX_FILE
+            labels = await helpers.load_json_file(path, default={})
+            if not isinstance(labels, dict):
+                labels = {}
+            stale = await asyncio.to_thread(self._stale_files, backup_dir)
+            for backup in stale:
+                entries = await self._reader(backup)
+                user = backup.stem.rsplit("_", 1)[-1]
+                for entry in entries:
+                    self._merge(labels, user, entry.get("label"), entry.get("timestamp"))
+            self._labels = labels
+            self._dir = backup_dir
+            if stale:
+                logger.info("Indexed %s balance backup file(s)", len(stale))
+                await self._save()
+
+    @staticmethod
+    def _stale_files(backup_dir: Path) -> List[Path]:
+        """Return the backup files changed since the index was last saved."""
+        path = backup_dir / INDEX_FILE
+        saved_at = path.stat().st_mtime if path.exists() else 0
+        stale = []
+        for pattern in BACKUP_GLOBS:
+            for backup in backup_dir.glob(pattern):
+                try:
+                    if backup.stat().st_mtime >= saved_at:
+                        stale.append(backup)
+                except FileNotFoundError:
+                    # Replaced by a compaction while we were scanning
+                    continue
+        return stale
+
+    @staticmethod
+    async def _read_json(path: Path) -> List[Dict]:
+        entries = await helpers.load_json_file(path, default=[])
+        return entries if isinstance(entries, list) else []
+
+    @staticmethod
+    def _merge(
+        labels: Dict[str, Dict[str, str]], user: str, label: Optional[str], ts: Optional[str]
+    ) -> None:
+        if not label or not ts:
+            return
+        current = labels.setdefault(user, {}).get(label)
+        # ISO timestamps from ``datetime.isoformat`` sort chronologically
+        if current is None or ts > current:
+            labels[user][label] = ts
+
+    async def _save(self) -> None:
+        if self._dir is not None:
+            await helpers.save_json_file(self._dir / INDEX_FILE, self._labels)
+            self._saved_at = time.monotonic()
+
+    async def last_used(self, backup_dir: Path, user_id: int, label: str) -> Optional[datetime]:
+        """Return when ``label`` was last backed up for ``user_id``."""
+        await self._ensure_loaded(backup_dir)
+        ts = self._labels.get(str(user_id), {}).get(label)
+        if not ts:
+            return None
+        try:
+            return datetime.fromisoformat(ts)
+        except ValueError:
+            return None
+
+    async def record(
+        self, backup_dir: Path, entries: Iterable[tuple[int, str, str]]
+    ) -> None:
+        """Add ``(user_id, label, timestamp)`` entries to the index."""
+        await self._ensure_loaded(backup_dir)
+        for user_id, label, ts in entries:
+            self._merge(self._labels, str(user_id), label, ts)
+        if time.monotonic() - self._saved_at >= SAVE_INTERVAL:
+            async with self._lock:
+                await self._save()
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import config
+from NightCityBot.services.backup_index import BackupLabelIndex
+from NightCityBot.services.sqlite_backend import SQLiteBackend
+from NightCityBot.utils import helpers
+
+logger = logging.getLogger(__name__)
+
+# Appended records a member may collect before they are compacted
+COMPACT_AFTER = 32
+
+
+def _total(entry: Dict[str, Any]) -> int:
+    return entry.get("cash", 0) + entry.get("bank", 0)
+
+
+class _MemberLog:
+    """Enough of a member's history to append without rereading it."""
+
+    def __init__(self) -> None:
+        self.next_seq = 0
+        self.tail = 0
+        self.last_key: Optional[tuple] = None
+        self.last_total = 0
+        # Newest ``*_before`` entry per label as ``(seq, total)``
+        self.befores: Dict[str, tuple[int, int]] = {}
+
+    def key_for(self, label: str) -> tuple[tuple, int]:
+        """Return the ordering key for a new ``label`` and the total it follows."""
+        seq = self.next_seq
+        if label.endswith("_after") and label.startswith("collect_"):
+            before = self.befores.get(label.replace("_after", "_before"))
+            if before is not None:
+                # Right after its ``_before``, ahead of older ``_after`` entries
+                return (before[0], 1, -seq), before[1]
+        return (seq, 0, 0), self.last_total if self.last_key is not None else 0
+
+    def add(self, key: tuple, entry: Dict[str, Any]) -> None:
+        if self.last_key is None or key > self.last_key:
+            self.last_key = key
+            self.last_total = _total(entry)
+        if entry.get("label", "").endswith("_before") and key[1] == 0:
+            self.befores[entry["label"]] = (key[0], _total(entry))
+
+
+class BalanceBackupStore:
+    """Per-member balance history kept as a compacted list plus an append log.
+
+    ``balance_backup_<id>.json`` keeps the familiar JSON list, now acting as
+    the compacted part of the history. New entries are appended as single
+    lines to ``balance_backup_<id>.jsonl``. Each record carries an ordering
+    key, so a ``collect_*_after`` entry still sorts straight after its
+    ``_before`` entry. After ``COMPACT_AFTER`` appends the two files are merged
+    back into the JSON list.
+
+    Each record's ``seq`` is at least the length of the list when it was
+    written. That lets readers drop log lines already folded into the list
+    if the bot died between writing the list and truncating the log.
+    """
+
+    def __init__(self, load: Callable[..., Awaitable[Any]] = helpers.load_json_file) -> None:
+        self._load = load
+        self._logs: Dict[tuple[Path, int], _MemberLog] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self.index = BackupLabelIndex(self.read_file)
+
+    @property
+    def directory(self) -> Path:
+        return Path(config.BALANCE_BACKUP_DIR)
+
+    def path(self, user_id: int) -> Path:
+        return self.directory / f"balance_backup_{user_id}.json"
+
+    def log_path(self, user_id: int) -> Path:
+        return self.directory / f"balance_backup_{user_id}.jsonl"
+
+    async def member_ids(self) -> List[int]:
+        """Return every member with a backup history."""
+        ids = set()
+        for path in self.directory.glob("balance_backup_*.json*"):
+            try:
+                ids.add(int(path.name.split(".")[0].rsplit("_", 1)[-1]))
+            except ValueError:
+                continue
+        return sorted(ids)
+
+    async def has_history(self, user_id: int) -> bool:
+        """Return ``True`` if ``user_id`` has any backup entries stored."""
+        return self.path(user_id).exists() or self.log_path(user_id).exists()
+
+    async def _read_compacted(self, user_id: int) -> List[Dict[str, Any]]:
+        entries = await self._load(self.path(user_id), default=[])
+        return entries if isinstance(entries, list) else []
+
+    def _read_log(self, path: Path) -> List[Dict[str, Any]]:
+        records = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping truncated line in %s", path.name)
+        except FileNotFoundError:
+            pass
+        return records
+
+    async def read_file(self, path: Path) -> List[Dict[str, Any]]:
+        """Return the entries stored in a single backup file."""
+        if path.suffix == ".jsonl":
+            return await asyncio.to_thread(self._read_log, path)
+        entries = await self._load(path, default=[])
+        return entries if isinstance(entries, list) else []
+
+    async def _read_member(self, user_id: int) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        compacted = await self._read_compacted(user_id)
+        records = await asyncio.to_thread(self._read_log, self.log_path(user_id))
+        return compacted, [r for r in records if r.get("seq", -1) >= len(compacted)]
+
+    @staticmethod
+    def _merge(compacted: List[Dict[str, Any]], records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        keyed = [((i, 0, 0), entry) for i, entry in enumerate(compacted)]
+        for record in records:
+            entry = {k: v for k, v in record.items() if k not in {"key", "seq"}}
+            keyed.append((tuple(record["key"]), entry))
+        keyed.sort(key=lambda pair: pair[0])
+        return [entry for _, entry in keyed]
+
+    async def entries(self, user_id: int) -> List[Dict[str, Any]]:
+        """Return a member's backup history in order, oldest first."""
+        compacted, records = await self._read_member(user_id)
+        return self._merge(compacted, records)
+
+    async def latest(self, user_id: int, label: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the last entry, or the last one with ``label``."""
+        for entry in reversed(await self.entries(user_id)):
+            if label is None or entry.get("label") == label:
+                return entry
+        return None
+
+    async def _member_log(self, user_id: int) -> _MemberLog:
+        cache_key = (self.directory, user_id)
+        log = self._logs.get(cache_key)
+        if log is None:
+            compacted, records = await self._read_member(user_id)
+            log = _MemberLog()
+            for i, entry in enumerate(compacted):
+                log.add((i, 0, 0), entry)
+            for record in sorted(records, key=lambda r: r["seq"]):
+                log.add(tuple(record["key"]), record)
+            log.next_seq = max([len(compacted)] + [r["seq"] + 1 for r in records])
+            log.tail = len(records)
+            self._logs[cache_key] = log
+        return log
+
+    def _append(self, user_id: int, record: Dict[str, Any]) -> None:
+        with open(self.log_path(user_id), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    async def append(self, user_id: int, label: str, balance: Dict[str, int]) -> Dict[str, Any]:
+        """Record ``balance`` under ``label`` and return the new entry."""
+        lock = self._locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            log = await self._member_log(user_id)
+            key, prev_total = log.key_for(label)
+            entry = {
+                "timestamp": datetime.utcnow().isoformat(),
+                "label": label,
+                "cash": balance.get("cash", 0),
+                "bank": balance.get("bank", 0),
+            }
+            entry["change"] = _total(entry) - prev_total
+            record = {"seq": log.next_seq, "key": list(key), **entry}
+            self.directory.mkdir(exist_ok=True)
+            # Index first so a lookup never misses a backup that reached disk
+            await self.index.record(self.directory, [(user_id, label, entry["timestamp"])])
+            await asyncio.to_thread(self._append, user_id, record)
+            log.add(key, entry)
+            log.next_seq += 1
+            log.tail += 1
+            if log.tail >= COMPACT_AFTER:
+                await self._compact(user_id)
+            return entry
+
+    def _replace(self, user_id: int, entries: List[Dict[str, Any]]) -> None:
+        path = self.path(user_id)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(entries, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        # A crash before this leaves log lines the new list already holds;
+        # their ``seq`` is below its length so readers skip them.
+        self.log_path(user_id).unlink(missing_ok=True)
+
+    async def _compact(self, user_id: int) -> None:
+        entries = await self.entries(user_id)
+        await asyncio.to_thread(self._replace, user_id, entries)
+        self._logs.pop((self.directory, user_id), None)
+
+    async def last_used(self, user_id: int, label: str) -> Optional[datetime]:
+        """Return when ``label`` was last backed up for ``user_id``."""
+        return await self.index.last_used(self.directory, user_id, label)
+
+
+class SQLiteBackupStore(BalanceBackupStore):
+    """:class:`BalanceBackupStore` kept in the ``balance_backups`` table.
+
+    Appends are single inserts, and the last time a label was used comes
+    from an indexed query instead of ``label_index.json``.
+    """
+
+    def __init__(self, backend: SQLiteBackend) -> None:
+        super().__init__()
+        self.backend = backend
+
+    async def member_ids(self) -> List[int]:
+        return await self.backend.backup_member_ids()
+
+    async def has_history(self, user_id: int) -> bool:
+        return await self.backend.has_backups(user_id)
+
+    async def entries(self, user_id: int) -> List[Dict[str, Any]]:
+        return await self.backend.backup_entries(user_id)
+
+    async def latest(self, user_id: int, label: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return await self.backend.latest_backup(user_id, label)
+
+    async def append(self, user_id: int, label: str, balance: Dict[str, int]) -> Dict[str, Any]:
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "label": label,
+            "cash": balance.get("cash", 0),
+            "bank": balance.get("bank", 0),
+        }
+        return await self.backend.append_backup(user_id, entry)
+
+    async def last_used(self, user_id: int, label: str) -> Optional[datetime]:
+        ts = await self.backend.backup_last_used(user_id, label)
+        if not ts:
+            return None
+        try:
+            return datetime.fromisoformat(ts)
+        except ValueError:
+            return None
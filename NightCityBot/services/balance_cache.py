@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class BalanceCache:
+    """Small LRU cache of member balances with a time-to-live."""
+
+    def __init__(self, ttl: float, max_size: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, tuple[float, Dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[Dict]:
+        """Return a copy of the cached balance or ``None`` if missing/expired."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_at, balance = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return dict(balance)
+
+    def set(self, user_id: int, balance: Dict) -> None:
+        self._entries[user_id] = (time.monotonic(), dict(balance))
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop one member's entry, or everything when ``user_id`` is ``None``."""
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,83 @@
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling a backend after repeated failures.
+
+    The breaker starts ``closed``. After ``failure_threshold`` consecutive
+    failures it opens and every call is rejected for ``reset_timeout``
+    seconds. It then goes ``half_open`` and lets a single probe through: a
+    success closes it again, a failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Return ``False`` while the breaker is open and still cooling down."""
+        if self.state != OPEN:
+            return True
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def allow(self) -> bool:
+        """Return ``True`` if a call may be sent now."""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+            logger.info("Circuit half-open; sending a probe request")
+        now = time.monotonic()
+        # A probe that never reported back (e.g. it hit its deadline) must not
+        # wedge the breaker half-open forever.
+        if self._probe_in_flight and now - self._probe_started < self.reset_timeout:
+            return False
+        self._probe_in_flight = True
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info("Circuit closed; backend recovered")
+        self.state = CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    "Circuit open after %s failure(s); rejecting calls for %.0fs",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """Return the next retry delay using decorrelated jitter.
+
+    Each delay is drawn between ``base`` and three times the previous one so
+    concurrent callers spread out instead of retrying in lockstep.
+    """
+    return min(cap, random.uniform(base, max(base, previous * 3)))
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from NightCityBot.services.sqlite_backend import SQLiteBackend, get_backend
+from NightCityBot.utils import helpers, json_codec
+
+logger = logging.getLogger(__name__)
+
+# Appended events kept in the log before it is folded into the JSON file
+COMPACT_AFTER = 256
+
+
+class EventLog:
+    """Per-user timestamp log kept as a JSON snapshot plus an append log.
+
+    ``<name>.json`` keeps the familiar ``{user_id: [timestamps]}`` layout
+    and is only rewritten when the log is compacted: on load, after
+    ``COMPACT_AFTER`` events and by :meth:`replace` / :meth:`rotate`.
+    Each new event is appended as one line to ``<name>.jsonl``. The merged
+    state lives in memory, so reads never touch the disk.
+
+    Callers take :meth:`lock` for the user they are about to check and
+    update; other users are not held up. Events already in the snapshot
+    (e.g. after a crash between compacting and removing the log) are
+    skipped when the log is replayed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(".jsonl")
+        self._data: Optional[Dict[str, List[str]]] = None
+        self._tail = 0
+        self._file_lock = asyncio.Lock()
+        self._user_locks: Dict[str, asyncio.Lock] = {}
+
+    def lock(self, user_id: int | str) -> asyncio.Lock:
+        """Return the lock guarding ``user_id``'s entries."""
+        return self._user_locks.setdefault(str(user_id), asyncio.Lock())
+
+    def _read_log(self) -> List[Dict[str, str]]:
+        events = []
+        try:
+            with open(self.log_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping truncated line in %s", self.log_path.name)
+        except FileNotFoundError:
+            pass
+        return events
+
+    async def load(self) -> Dict[str, List[str]]:
+        """Rebuild the in-memory state from disk once and return it."""
+        if self._data is not None:
+            return self._data
+        async with self._file_lock:
+            if self._data is None:
+                data = await helpers.load_json_file(self.path, default={})
+                if not isinstance(data, dict):
+                    data = {}
+                events = await asyncio.to_thread(self._read_log)
+                for event in events:
+                    entries = data.setdefault(str(event.get("user")), [])
+                    if event.get("ts") not in entries:
+                        entries.append(event.get("ts"))
+                self._data = data
+                if events:
+                    logger.info("Replayed %s event(s) from %s", len(events), self.log_path.name)
+                    await self._write_snapshot()
+        return self._data
+
+    async def entries(self, user_id: int | str) -> List[str]:
+        """Return a copy of ``user_id``'s timestamps, oldest first."""
+        data = await self.load()
+        return list(data.get(str(user_id), []))
+
+    async def count(self, user_id: int | str) -> int:
+        """Return how many timestamps ``user_id`` has without copying them."""
+        await self.load()
+        async with self._file_lock:
+            return len(self._data.get(str(user_id), ()))
+
+    async def snapshot(self) -> Dict[str, List[str]]:
+        """Return a copy of every user's timestamps."""
+        data = await self.load()
+        return {uid: list(entries) for uid, entries in data.items()}
+
+    def _append(self, line: str) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def append(self, user_id: int | str, ts: str) -> None:
+        """Durably record ``ts`` for ``user_id``."""
+        await self.load()
+        user_id = str(user_id)
+        async with self._file_lock:
+            await asyncio.to_thread(self._append, json.dumps({"user": user_id, "ts": ts}))
+            self._data.setdefault(user_id, []).append(ts)
+            self._tail += 1
+            if self._tail >= COMPACT_AFTER:
+                await self._write_snapshot()
+
+    def _replace_file(self, payload: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        # Anything still in the log is in the snapshot now and is skipped
+        # on replay if the bot stops before this line.
+        self.log_path.unlink(missing_ok=True)
+
+    async def _write_snapshot(self) -> None:
+        payload = await json_codec.dumps(self._data, indent=2)
+        await asyncio.to_thread(self._replace_file, payload)
+        self._tail = 0
+
+    async def replace(self, data: Dict[str, List[str]]) -> None:
+        """Overwrite every user's entries with ``data``."""
+        await self.load()
+        async with self._file_lock:
+            self._data = {str(uid): list(entries) for uid, entries in data.items()}
+            await self._write_snapshot()
+
+    async def retain(self, user_ids: Iterable[int | str]) -> int:
+        """Drop users not in ``user_ids`` and return how many were removed."""
+        keep = {str(uid) for uid in user_ids}
+        await self.load()
+        async with self._file_lock:
+            before = len(self._data)
+            self._data = {uid: entries for uid, entries in self._data.items() if uid in keep}
+            removed = before - len(self._data)
+            if removed:
+                await self._write_snapshot()
+        return removed
+
+    def _rename(self, dest: Path) -> None:
+        self.path.rename(dest)
+
+    async def rotate(self, dest: Path) -> Dict[str, List[str]]:
+        """Move the current entries to ``dest``, start empty and return them."""
+        await self.load()
+        async with self._file_lock:
+            old = self._data
+            if old or self.path.exists():
+                await self._write_snapshot()
+                await asyncio.to_thread(self._rename, dest)
+            self._data = {}
+            await self._write_snapshot()
+        return old
+
+
+class SQLiteEventLog(EventLog):
+    """:class:`EventLog` kept in the ``events`` table of the SQLite database.
+
+    Every event is one indexed row, so checking a user's entries no longer
+    loads the whole log. Rotation still archives the month as a JSON file.
+    """
+
+    def __init__(self, path: Path, backend: SQLiteBackend) -> None:
+        super().__init__(path)
+        self.backend = backend
+        self.name = self.path.stem
+
+    async def load(self) -> Dict[str, List[str]]:
+        return await self.backend.events(self.name)
+
+    async def entries(self, user_id: int | str) -> List[str]:
+        data = await self.backend.events(self.name, str(user_id))
+        return data.get(str(user_id), [])
+
+    async def count(self, user_id: int | str) -> int:
+        return await self.backend.count_events(self.name, str(user_id))
+
+    async def snapshot(self) -> Dict[str, List[str]]:
+        return await self.backend.events(self.name)
+
+    async def append(self, user_id: int | str, ts: str) -> None:
+        await self.backend.add_event(self.name, str(user_id), ts)
+
+    async def replace(self, data: Dict[str, List[str]]) -> None:
+        await self.backend.replace_events(self.name, data)
+
+    async def retain(self, user_ids: Iterable[int | str]) -> int:
+        return await self.backend.retain_events(self.name, {str(uid) for uid in user_ids})
+
+    async def rotate(self, dest: Path) -> Dict[str, List[str]]:
+        async with self._file_lock:
+            old = await self.backend.events(self.name)
+            if old:
+                await helpers.save_json_file(dest, old)
+            await self.backend.replace_events(self.name, {})
+        return old
+
+
+_logs: Dict[Path, EventLog] = {}
+
+
+def get_event_log(path: Path | str) -> EventLog:
+    """Return the shared log for ``path`` on the configured storage backend."""
+    key = Path(path)
+    log = _logs.get(key)
+    if log is None:
+        backend = get_backend()
+        log = _logs[key] = SQLiteEventLog(key, backend) if backend else EventLog(key)
+    return log
@@ -0,0 +1,66 @@
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MonthKey = Tuple[str, int, int]
+
+
+class OpenLogIndex:
+    """Business opens counted per ``(user_id, year, month)``.
+
+    Built once from the open log (``{user_id: [iso timestamps]}``) and kept
+    up to date with :meth:`add`, so the monthly open count and the date of
+    the last open are dictionary lookups instead of a parse of the
+    member's whole history. Comparing :meth:`total` with the log's own count
+    lets callers notice when the file was changed behind the index and
+    :meth:`resync` the member.
+    """
+
+    def __init__(self) -> None:
+        self._months: Dict[MonthKey, Tuple[int, date]] = {}
+        self._totals: Dict[str, int] = {}
+
+    @classmethod
+    def from_log(cls, data: Optional[Dict[str, Iterable[str]]]) -> "OpenLogIndex":
+        index = cls()
+        for user_id, stamps in (data or {}).items():
+            index.resync(user_id, stamps)
+        return index
+
+    def _add(self, user_id: str, ts: datetime) -> None:
+        key = (user_id, ts.year, ts.month)
+        count, last = self._months.get(key, (0, None))
+        day = ts.date()
+        self._months[key] = (count + 1, day if last is None or day > last else last)
+        self._totals[user_id] = self._totals.get(user_id, 0) + 1
+
+    def add(self, user_id: int | str, ts: datetime) -> None:
+        """Record an open by ``user_id`` at ``ts``."""
+        self._add(str(user_id), ts)
+
+    def resync(self, user_id: int | str, stamps: Iterable[str]) -> None:
+        """Replace everything known about ``user_id`` with ``stamps``."""
+        user_id = str(user_id)
+        for key in [k for k in self._months if k[0] == user_id]:
+            del self._months[key]
+        self._totals[user_id] = 0
+        for stamp in stamps:
+            try:
+                self._add(user_id, datetime.fromisoformat(stamp))
+            except (TypeError, ValueError):
+                logger.warning("Skipping bad open timestamp for %s: %r", user_id, stamp)
+                self._totals[user_id] += 1
+
+    def total(self, user_id: int | str) -> int:
+        """Return how many log entries ``user_id`` has, valid or not."""
+        return self._totals.get(str(user_id), 0)
+
+    def count(self, user_id: int | str, year: int, month: int) -> int:
+        """Return how many times ``user_id`` opened in ``year``/``month``."""
+        return self._months.get((str(user_id), year, month), (0, None))[0]
+
+    def last_open(self, user_id: int | str, year: int, month: int) -> Optional[date]:
+        """Return the date of the user's latest open in ``year``/``month``."""
+        return self._months.get((str(user_id), year, month), (0, None))[1]
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default request budgets per bucket (requests per second, burst size). They
+# are deliberately conservative and adapt to the headers UnbelievaBoat sends.
+DEFAULT_BUDGETS = {
+    "get": (10.0, 10),
+    "patch": (5.0, 5),
+}
+MIN_RATE = 0.5
+
+
+class TokenBucket:
+    """Token bucket for a single class of requests."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        # asyncio.Lock wakes waiters in FIFO order which keeps callers fair
+        self.lock = asyncio.Lock()
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+
+class RateLimiter:
+    """Shared limiter with separate buckets and a global pause.
+
+    Callers await :meth:`acquire` before each request. When any request is
+    rate limited :meth:`backoff` pauses every bucket so the whole bot stops
+    sending until the upstream limit has reset.
+    """
+
+    def __init__(self, budgets: Optional[Mapping[str, tuple]] = None) -> None:
+        budgets = budgets or DEFAULT_BUDGETS
+        self.buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(rate, capacity)
+            for name, (rate, capacity) in budgets.items()
+        }
+        self.paused_until = 0.0
+
+    def _bucket(self, name: str) -> TokenBucket:
+        bucket = self.buckets.get(name)
+        if bucket is None:
+            rate, capacity = DEFAULT_BUDGETS["get"]
+            bucket = self.buckets[name] = TokenBucket(rate, capacity)
+        return bucket
+
+    async def acquire(self, name: str) -> None:
+        """Wait until a request in bucket ``name`` may be sent."""
+        bucket = self._bucket(name)
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                wait = max(self.paused_until, bucket.blocked_until) - now
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                bucket.refill(now)
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+
+    def backoff(self, name: str, retry_after: float) -> None:
+        """Pause all callers for ``retry_after`` seconds and slow ``name`` down."""
+        bucket = self._bucket(name)
+        resume = time.monotonic() + max(retry_after, 0)
+        if resume > self.paused_until:
+            self.paused_until = resume
+        bucket.rate = max(MIN_RATE, bucket.rate / 2)
+        bucket.tokens = 0
+        logger.warning(
+            "Rate limited on %s bucket; pausing all requests for %.2fs (rate now %.2f/s)",
+            name,
+            retry_after,
+            bucket.rate,
+        )
+
+    def record_success(self, name: str) -> None:
+        """Recover the bucket rate gradually after successful requests."""
+        bucket = self._bucket(name)
+        if bucket.rate < bucket.base_rate:
+            bucket.rate = min(bucket.base_rate, bucket.rate + 0.1 * bucket.base_rate)
+
+    def update_from_headers(self, name: str, headers: Mapping[str, str]) -> None:
+        """Learn the bucket size and reset window from rate-limit headers."""
+        bucket = self._bucket(name)
+        try:
+            limit = headers.get("X-RateLimit-Limit")
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset_after = headers.get("X-RateLimit-Reset-After")
+            if limit is not None:
+                bucket.capacity = max(1, int(limit))
+                bucket.tokens = min(bucket.tokens, bucket.capacity)
+            if remaining is not None:
+                bucket.tokens = min(bucket.tokens, float(remaining))
+                if int(remaining) <= 0 and reset_after is not None:
+                    bucket.blocked_until = max(
+                        bucket.blocked_until, time.monotonic() + float(reset_after)
+                    )
+        except (TypeError, ValueError):
+            logger.debug("Ignoring malformed rate-limit headers: %s", dict(headers))
+
+
+def parse_retry_after(data: Optional[Dict], headers: Mapping[str, str]) -> float:
+    """Return the delay in seconds requested by a 429 response.
+
+    UnbelievaBoat reports ``retry_after`` in the body in milliseconds while the
+    ``Retry-After`` header is in seconds.
+    """
+    if isinstance(data, dict) and data.get("retry_after") is not None:
+        try:
+            return float(data["retry_after"]) / 1000
+        except (TypeError, ValueError):
+            pass
+    try:
+        return float(headers.get("Retry-After", 1))
+    except (TypeError, ValueError):
+        return 1.0
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between fsyncs of the audit log while a run is writing it
+SYNC_INTERVAL = 5.0
+
+
+def audit_path(when: Optional[datetime] = None) -> Path:
+    """Return the monthly rent audit log for ``when`` (default: now)."""
+    audit_dir = Path(getattr(config, "RENT_AUDIT_DIR", "rent_audits"))
+    return audit_dir / f"rent_audit_{when or datetime.utcnow():%B_%Y}.log"
+
+
+class RentAuditWriter:
+    """Stream rent audit entries to the monthly log as a run goes.
+
+    Each entry is handed to the OS as soon as it is written, from a worker
+    thread so the event loop never waits on the disk, and the file is
+    fsynced at most every ``SYNC_INTERVAL`` seconds and on :meth:`close`.
+    Nothing is held in memory, and a crash keeps every entry written
+    before it. The file is only created once the first entry arrives.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: Optional[IO[str]] = None
+        self._lock = asyncio.Lock()
+        self._synced_at = 0.0
+
+    async def __aenter__(self) -> "RentAuditWriter":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _open(self) -> IO[str]:
+        self.path.parent.mkdir(exist_ok=True)
+        return open(self.path, "a", encoding="utf-8")
+
+    def _write(self, text: str, sync: bool) -> None:
+        self._file.write(text + "\n")
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    async def write(self, text: str) -> None:
+        """Append ``text`` to the audit log; errors are logged, not raised."""
+        async with self._lock:
+            sync = time.monotonic() - self._synced_at >= SYNC_INTERVAL
+            try:
+                if self._file is None:
+                    self._file = await asyncio.to_thread(self._open)
+                await asyncio.to_thread(self._write, text, sync)
+            except OSError:
+                # The audit is a record, not a reason to stop charging members
+                logger.exception("Could not write to %s", self.path.name)
+                return
+            if sync:
+                self._synced_at = time.monotonic()
+
+    def _close(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._file is None:
+                return
+            try:
+                await asyncio.to_thread(self._close)
+            except OSError as e:
+                logger.warning("Could not close %s: %s", self.path.name, e)
+            self._file = None
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Journal events, in the order they are written for a member
+RUN_START = "run_start"
+INTENT = "intent"
+CHARGED = "charged"
+STEP = "step"
+MEMBER_DONE = "member_done"
+RUN_END = "run_end"
+
+
+def journal_dir() -> Path:
+    return Path(getattr(config, "RENT_JOURNAL_DIR", "rent_journals"))
+
+
+def new_run_id() -> str:
+    return f"{datetime.utcnow():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:4]}"
+
+
+class RentJournal:
+    """Append-only write-ahead log of one rent run.
+
+    Every line is a JSON object with an ``event`` field. Lines are flushed
+    and fsynced before :meth:`record` returns, so an ``intent`` is on disk
+    before its PATCH is sent and a ``charged`` line right after it returns.
+    """
+
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self.path = journal_dir() / f"rent_{run_id}.jsonl"
+        self._lock = asyncio.Lock()
+
+    def _write(self, line: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def record(self, event: str, **fields: Any) -> None:
+        entry = {"event": event, "time": datetime.utcnow().isoformat(), **fields}
+        async with self._lock:
+            await asyncio.to_thread(self._write, json.dumps(entry))
+
+
+class MemberProgress:
+    """What an interrupted run already did for one member."""
+
+    def __init__(self) -> None:
+        self.steps: Set[str] = set()
+        self.done = False
+        # Last charge whose outcome wasn't confirmed yet, or that succeeded
+        # without its step being logged.
+        self.pending: Optional[Dict[str, Any]] = None
+
+    def apply(self, entry: Dict[str, Any]) -> None:
+        event = entry.get("event")
+        if event == INTENT:
+            self.pending = {
+                "reasons": entry.get("reasons", []),
+                "payload": entry.get("payload", {}),
+                "balance": entry.get("balance", {}),
+                "ok": None,
+            }
+        elif event == CHARGED and self.pending is not None:
+            if entry.get("ok"):
+                self.pending["ok"] = True
+            else:
+                # A failed PATCH changed nothing; the step is simply retried
+                self.pending = None
+        elif event == STEP:
+            self.steps.add(entry.get("kind"))
+            if self.pending is not None and entry.get("reason") in self.pending["reasons"]:
+                self.pending["reasons"].remove(entry.get("reason"))
+                if not self.pending["reasons"]:
+                    self.pending = None
+        elif event == MEMBER_DONE:
+            self.done = True
+            self.pending = None
+
+
+class JournalState:
+    """A rent run rebuilt from its journal."""
+
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self.options: Dict[str, Any] = {}
+        self.members: List[int] = []
+        self.progress: Dict[int, MemberProgress] = {}
+        self.finished = False
+
+    def member(self, member_id: int) -> MemberProgress:
+        progress = self.progress.get(member_id)
+        if progress is None:
+            progress = self.progress[member_id] = MemberProgress()
+        return progress
+
+    @property
+    def remaining(self) -> List[int]:
+        return [m for m in self.members if not self.member(m).done]
+
+
+def load_journal(run_id: str) -> Optional[JournalState]:
+    """Rebuild the state of ``run_id`` or return ``None`` if it has no journal."""
+    path = RentJournal(run_id).path
+    if not path.exists():
+        return None
+    state = JournalState(run_id)
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                # The process died mid-write; nothing after this was sent
+                logger.warning("Ignoring truncated line in %s", path.name)
+                break
+            event = entry.get("event")
+            if event == RUN_START:
+                state.options = entry.get("options", {})
+                state.members = entry.get("members", [])
+            elif event == RUN_END:
+                state.finished = True
+            elif "member" in entry:
+                state.member(entry["member"]).apply(entry)
+    return state
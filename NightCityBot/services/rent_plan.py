@@ -0,0 +1,164 @@
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from NightCityBot.utils.constants import (
+    ROLE_COSTS_BUSINESS,
+    ROLE_COSTS_HOUSING,
+    TRAUMA_ROLE_COSTS,
+    BASELINE_LIVING_COST,
+)
+
+BASELINE = "baseline"
+HOUSING = "housing"
+BUSINESS = "business"
+TRAUMA = "trauma"
+CYBERWARE = "cyberware"
+
+# UnbelievaBoat reason string for each kind of charge
+CHARGE_REASONS = {
+    BASELINE: "Flat Monthly Fee",
+    HOUSING: "Housing Rent",
+    BUSINESS: "Business Rent",
+    TRAUMA: "Trauma Team Subscription",
+}
+
+# ``charge(payload, reason)`` applies one balance change and returns the API
+# response, or ``None`` when it failed.
+Charge = Callable[[Dict[str, int], str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def split_deduction(cash: int, amount: int) -> tuple[int, int]:
+    """Return cash/bank portions ensuring negative cash isn't double counted."""
+    cash_deduct = min(max(cash, 0), amount)
+    bank_deduct = max(0, amount - cash_deduct)
+    return cash_deduct, bank_deduct
+
+
+class LineItem:
+    """One charge in a member's rent plan.
+
+    ``roles`` lists the ``(role name, cost)`` pairs the amount was built from.
+    ``payable`` is ``None`` when the plan was built without a balance.
+    """
+
+    def __init__(
+        self, kind: str, name: str, amount: int, roles: Optional[List[tuple[str, int]]] = None
+    ) -> None:
+        self.kind = kind
+        self.name = name
+        self.amount = amount
+        self.roles = roles or [(name, amount)]
+        self.payable: Optional[bool] = None
+        self.cash = 0
+        self.bank = 0
+
+    def payload(self) -> Dict[str, int]:
+        """Return the PATCH body that applies this charge."""
+        payload: Dict[str, int] = {}
+        if self.cash > 0:
+            payload["cash"] = -self.cash
+        if self.bank > 0:
+            payload["bank"] = -self.bank
+        return payload
+
+
+class RentPlan:
+    """A member's charges in order with projected balances."""
+
+    def __init__(self, on_loa: bool, balance: Optional[Dict[str, int]] = None) -> None:
+        self.on_loa = on_loa
+        self.items: List[LineItem] = []
+        # Kinds skipped because their system is switched off
+        self.disabled: List[str] = []
+        self.start_cash = balance.get("cash", 0) if balance else None
+        self.start_bank = balance.get("bank", 0) if balance else None
+        self.cash = self.start_cash
+        self.bank = self.start_bank
+
+    @property
+    def has_balance(self) -> bool:
+        return self.start_cash is not None
+
+    @property
+    def total_due(self) -> int:
+        return sum(item.amount for item in self.items)
+
+    @property
+    def funds(self) -> int:
+        return (self.start_cash or 0) + (self.start_bank or 0)
+
+    @property
+    def deficit(self) -> int:
+        return max(0, self.total_due - self.funds)
+
+    @property
+    def unpaid(self) -> List[LineItem]:
+        return [item for item in self.items if item.payable is False]
+
+    def get(self, kind: str) -> Optional[LineItem]:
+        return next((item for item in self.items if item.kind == kind), None)
+
+    def _add(self, item: LineItem) -> None:
+        if self.has_balance:
+            total = (self.cash or 0) + (self.bank or 0)
+            item.payable = total >= item.amount
+            if item.payable:
+                item.cash, item.bank = split_deduction(self.cash, item.amount)
+                self.cash -= item.cash
+                self.bank -= item.bank
+        self.items.append(item)
+
+
+def tier_item(kind: str, role_names: Iterable[str]) -> Optional[LineItem]:
+    """Return the combined housing or business rent for ``role_names``."""
+    marker, costs = (
+        ("Housing Tier", ROLE_COSTS_HOUSING)
+        if kind == HOUSING
+        else ("Business Tier", ROLE_COSTS_BUSINESS)
+    )
+    roles = [(role, costs.get(role, 0)) for role in role_names if marker in role]
+    total = sum(amount for _, amount in roles)
+    if not total:
+        return None
+    return LineItem(kind, ", ".join(role for role, _ in roles), total, roles)
+
+
+def build_rent_plan(
+    role_names: Iterable[str],
+    *,
+    on_loa: bool,
+    balance: Optional[Dict[str, int]] = None,
+    cyberware: Optional[tuple[int, int]] = None,
+    housing: bool = True,
+    business: bool = True,
+    trauma: bool = True,
+) -> RentPlan:
+    """Work out a member's charges without touching the API.
+
+    Items are ordered the way rent is collected: baseline, housing, business,
+    Trauma Team and, when ``cyberware`` is given as ``(week, cost)``, the
+    upcoming medication. Each item is checked against the balance left by the
+    items before it. LOA skips everything but business rent. ``housing``,
+    ``business`` and ``trauma`` are cleared when those systems are disabled.
+    """
+    role_names = list(role_names)
+    plan = RentPlan(on_loa, balance)
+    if not on_loa:
+        plan._add(LineItem(BASELINE, "Baseline living cost", BASELINE_LIVING_COST))
+        if not housing:
+            plan.disabled.append(HOUSING)
+        elif item := tier_item(HOUSING, role_names):
+            plan._add(item)
+    if not business:
+        plan.disabled.append(BUSINESS)
+    elif item := tier_item(BUSINESS, role_names):
+        plan._add(item)
+    if not on_loa:
+        trauma_role = next((r for r in role_names if r in TRAUMA_ROLE_COSTS), None)
+        if not trauma:
+            plan.disabled.append(TRAUMA)
+        elif trauma_role:
+            plan._add(LineItem(TRAUMA, trauma_role, TRAUMA_ROLE_COSTS[trauma_role]))
+        if cyberware:
+            week, cost = cyberware
+            plan._add(LineItem(CYBERWARE, f"Cyberware meds week {week}", cost))
+    return plan
@@ -0,0 +1,380 @@
+import asyncio
+import json
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import config
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (name, key)
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    log TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    UNIQUE (log, user_id, ts)
+);
+CREATE TABLE IF NOT EXISTS balance_backups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    sub INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT NOT NULL,
+    label TEXT NOT NULL,
+    cash INTEGER NOT NULL,
+    bank INTEGER NOT NULL,
+    change INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS balance_backups_order
+    ON balance_backups (user_id, pos, sub);
+CREATE INDEX IF NOT EXISTS balance_backups_label
+    ON balance_backups (user_id, label, timestamp);
+"""
+
+# History order: an ``_after`` row shares its ``_before`` row's ``pos`` and
+# sorts right after it, newest first, like ``BalanceBackupStore`` keys.
+BACKUP_ORDER = "pos, sub, CASE WHEN sub = 0 THEN 0 ELSE -id END"
+BACKUP_ORDER_DESC = "pos DESC, sub DESC, CASE WHEN sub = 0 THEN 0 ELSE -id END DESC"
+BACKUP_COLUMNS = "timestamp, label, cash, bank, change"
+
+
+def _backup_entry(row: tuple) -> Dict[str, Any]:
+    timestamp, label, cash, bank, change = row
+    return {
+        "timestamp": timestamp,
+        "label": label,
+        "cash": cash,
+        "bank": bank,
+        "change": change,
+    }
+
+
+class SQLiteBackend:
+    """Bot state kept in one SQLite database in WAL mode.
+
+    Every query runs on a single worker thread that owns the connection, so
+    the event loop never blocks on disk and statements never interleave.
+    Each call is its own transaction. Tables:
+
+    * ``documents`` – the :class:`StateStore` files, one row per top-level key.
+    * ``events`` – the open-shop and attendance logs, one row per event.
+    * ``balance_backups`` – each member's balance history, indexed by member
+      and label so the rent cooldown check is a single lookup.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._closed = False
+        # Encoded values last written per document, so saves only touch changed keys
+        self._documents: Dict[str, Dict[str, str]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _call(self, fn: Callable[..., Any], args: tuple) -> Any:
+        conn = self._connect()
+        with conn:
+            return fn(conn, *args)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._closed:
+            # Stores created before shutdown still hold this backend
+            raise RuntimeError(f"SQLite backend for {self.path.name} is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+
+    # Documents
+
+    async def load_document(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the document ``name`` or ``None`` if it has no rows."""
+
+        def load(conn):
+            return conn.execute(
+                "SELECT key, value FROM documents WHERE name = ?", (name,)
+            ).fetchall()
+
+        rows = await self._run(load)
+        if not rows:
+            return None
+        self._documents[name] = dict(rows)
+        return {key: json.loads(value) for key, value in rows}
+
+    async def save_document(self, name: str, data: Dict[str, Any]) -> None:
+        """Write the keys of ``data`` that changed since the last save."""
+        encoded = {str(key): json.dumps(value) for key, value in data.items()}
+
+        def save(conn):
+            previous = self._documents.get(name)
+            if previous is None:
+                previous = dict(
+                    conn.execute("SELECT key, value FROM documents WHERE name = ?", (name,))
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO documents (name, key, value) VALUES (?, ?, ?)",
+                [(name, k, v) for k, v in encoded.items() if previous.get(k) != v],
+            )
+            conn.executemany(
+                "DELETE FROM documents WHERE name = ? AND key = ?",
+                [(name, k) for k in previous if k not in encoded],
+            )
+            self._documents[name] = encoded
+
+        await self._run(save)
+
+    # Events
+
+    async def events(self, log: str, user_id: Optional[str] = None) -> Dict[str, List[str]]:
+        """Return ``{user_id: [timestamps]}`` for ``log``, optionally one user."""
+
+        def load(conn):
+            if user_id is None:
+                return conn.execute(
+                    "SELECT user_id, ts FROM events WHERE log = ? ORDER BY id", (log,)
+                ).fetchall()
+            return conn.execute(
+                "SELECT user_id, ts FROM events WHERE log = ? AND user_id = ? ORDER BY id",
+                (log, user_id),
+            ).fetchall()
+
+        data: Dict[str, List[str]] = {}
+        for uid, ts in await self._run(load):
+            data.setdefault(uid, []).append(ts)
+        return data
+
+    async def count_events(self, log: str, user_id: str) -> int:
+        def count(conn):
+            return conn.execute(
+                "SELECT COUNT(*) FROM events WHERE log = ? AND user_id = ?", (log, user_id)
+            ).fetchone()[0]
+
+        return await self._run(count)
+
+    async def add_event(self, log: str, user_id: str, ts: str) -> None:
+        def add(conn):
+            conn.execute(
+                "INSERT OR IGNORE INTO events (log, user_id, ts) VALUES (?, ?, ?)",
+                (log, user_id, ts),
+            )
+
+        await self._run(add)
+
+    async def replace_events(self, log: str, data: Dict[str, List[str]]) -> None:
+        """Overwrite every event in ``log`` with ``data``."""
+        rows = [(log, str(uid), ts) for uid, entries in data.items() for ts in entries]
+
+        def replace(conn):
+            conn.execute("DELETE FROM events WHERE log = ?", (log,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO events (log, user_id, ts) VALUES (?, ?, ?)", rows
+            )
+
+        await self._run(replace)
+
+    async def retain_events(self, log: str, keep: Set[str]) -> int:
+        """Delete ``log`` events of users not in ``keep``; return how many users went."""
+
+        def retain(conn):
+            users = [
+                uid
+                for (uid,) in conn.execute(
+                    "SELECT DISTINCT user_id FROM events WHERE log = ?", (log,)
+                )
+                if uid not in keep
+            ]
+            conn.executemany(
+                "DELETE FROM events WHERE log = ? AND user_id = ?",
+                [(log, uid) for uid in users],
+            )
+            return len(users)
+
+        return await self._run(retain)
+
+    # Balance backups
+
+    async def backup_member_ids(self) -> List[int]:
+        def load(conn):
+            return conn.execute(
+                "SELECT DISTINCT user_id FROM balance_backups ORDER BY user_id"
+            ).fetchall()
+
+        return [uid for (uid,) in await self._run(load)]
+
+    async def has_backups(self, user_id: int) -> bool:
+        def load(conn):
+            return conn.execute(
+                "SELECT 1 FROM balance_backups WHERE user_id = ? LIMIT 1", (user_id,)
+            ).fetchone()
+
+        return await self._run(load) is not None
+
+    async def backup_entries(self, user_id: int) -> List[Dict[str, Any]]:
+        """Return a member's history in order, oldest first."""
+
+        def load(conn):
+            return conn.execute(
+                f"SELECT {BACKUP_COLUMNS} FROM balance_backups "
+                f"WHERE user_id = ? ORDER BY {BACKUP_ORDER}",
+                (user_id,),
+            ).fetchall()
+
+        return [_backup_entry(row) for row in await self._run(load)]
+
+    async def latest_backup(
+        self, user_id: int, label: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the last entry in history order, or the last with ``label``."""
+
+        def load(conn):
+            query = f"SELECT {BACKUP_COLUMNS} FROM balance_backups WHERE user_id = ?"
+            params: tuple = (user_id,)
+            if label is not None:
+                query += " AND label = ?"
+                params += (label,)
+            return conn.execute(
+                f"{query} ORDER BY {BACKUP_ORDER_DESC} LIMIT 1", params
+            ).fetchone()
+
+        row = await self._run(load)
+        return _backup_entry(row) if row else None
+
+    async def backup_last_used(self, user_id: int, label: str) -> Optional[str]:
+        """Return the newest timestamp stored under ``label`` for ``user_id``."""
+
+        def load(conn):
+            return conn.execute(
+                "SELECT MAX(timestamp) FROM balance_backups WHERE user_id = ? AND label = ?",
+                (user_id, label),
+            ).fetchone()[0]
+
+        return await self._run(load)
+
+    async def append_backup(self, user_id: int, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Add ``entry`` to a member's history and return it with its ``change``.
+
+        A ``collect_*_after`` entry is placed right after the newest matching
+        ``_before`` entry and its change is measured from it; anything else
+        goes last and is measured from the previous last entry.
+        """
+        label = entry["label"]
+        total = entry["cash"] + entry["bank"]
+
+        def append(conn):
+            prev = None
+            pos = sub = None
+            if label.startswith("collect_") and label.endswith("_after"):
+                prev = conn.execute(
+                    "SELECT pos, cash + bank FROM balance_backups "
+                    "WHERE user_id = ? AND label = ? AND sub = 0 "
+                    "ORDER BY pos DESC LIMIT 1",
+                    (user_id, label.replace("_after", "_before")),
+                ).fetchone()
+                if prev is not None:
+                    pos, sub = prev[0], 1
+            if prev is None:
+                prev = conn.execute(
+                    "SELECT pos, cash + bank FROM balance_backups WHERE user_id = ? "
+                    f"ORDER BY {BACKUP_ORDER_DESC} LIMIT 1",
+                    (user_id,),
+                ).fetchone()
+                pos = conn.execute(
+                    "SELECT COALESCE(MAX(pos), -1) + 1 FROM balance_backups WHERE user_id = ?",
+                    (user_id,),
+                ).fetchone()[0]
+                sub = 0
+            change = total - (prev[1] if prev else 0)
+            conn.execute(
+                "INSERT INTO balance_backups "
+                "(user_id, pos, sub, timestamp, label, cash, bank, change) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (user_id, pos, sub, entry["timestamp"], label, entry["cash"], entry["bank"], change),
+            )
+            return change
+
+        change = await self._run(append)
+        return {**entry, "change": change}
+
+    async def replace_backups(self, user_id: int, entries: Iterable[Dict[str, Any]]) -> None:
+        """Overwrite a member's history with ``entries``, oldest first."""
+        rows = [
+            (
+                user_id,
+                pos,
+                entry.get("timestamp", ""),
+                entry.get("label", ""),
+                entry.get("cash", 0),
+                entry.get("bank", 0),
+                entry.get("change", 0),
+            )
+            for pos, entry in enumerate(entries)
+        ]
+
+        def replace(conn):
+            conn.execute("DELETE FROM balance_backups WHERE user_id = ?", (user_id,))
+            conn.executemany(
+                "INSERT INTO balance_backups "
+                "(user_id, pos, sub, timestamp, label, cash, bank, change) "
+                "VALUES (?, ?, 0, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        await self._run(replace)
+
+    async def close(self) -> None:
+        """Checkpoint the WAL and close the connection.
+
+        Calls already queued finish first; any later call raises
+        :class:`RuntimeError`. Closing twice does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        def close():
+            if self._conn is not None:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+                self._conn = None
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, close)
+        self._executor.shutdown(wait=False)
+        if _backends.get(self.path) is self:
+            del _backends[self.path]
+
+
+_backends: Dict[Path, SQLiteBackend] = {}
+
+
+def open_backend(path: Path | str) -> SQLiteBackend:
+    """Return the shared :class:`SQLiteBackend` for the database at ``path``."""
+    key = Path(path)
+    backend = _backends.get(key)
+    if backend is None:
+        backend = _backends[key] = SQLiteBackend(key)
+    return backend
+
+
+def get_backend() -> Optional[SQLiteBackend]:
+    """Return the configured SQLite backend, or ``None`` for the JSON files."""
+    if getattr(config, "STORAGE_BACKEND", "json") != "sqlite":
+        return None
+    return open_backend(config.SQLITE_DB_FILE)
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import config
+from NightCityBot.services.sqlite_backend import SQLiteBackend, get_backend
+from NightCityBot.utils import helpers
+
+logger = logging.getLogger(__name__)
+
+
+class StateStore:
+    """Small JSON state files kept in memory and written back in the background.
+
+    :meth:`load` reads a file once and returns the cached document; later
+    calls return the same object, so a cog can keep a reference to it.
+    :meth:`save` records the new document and marks the file dirty. Dirty
+    files are written together ``interval`` seconds after the first change,
+    so a burst of updates costs one write. Writes go through
+    :func:`helpers.save_json_file`, which replaces the file atomically. A
+    failed write leaves the file dirty for the next flush. Call
+    :meth:`close` on shutdown so nothing pending is lost.
+
+    With a ``backend`` each document lives in the SQLite ``documents``
+    table, keyed by the file's stem. Only the top-level keys that changed
+    are written.
+    """
+
+    def __init__(
+        self, interval: Optional[float] = None, backend: Optional[SQLiteBackend] = None
+    ) -> None:
+        self.interval = (
+            getattr(config, "STATE_FLUSH_INTERVAL", 5.0) if interval is None else interval
+        )
+        self.backend = backend
+        self._docs: Dict[Path, Any] = {}
+        self._dirty: Set[Path] = set()
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self.writes = 0
+
+    async def load(self, path: Path | str, default=None) -> Any:
+        """Return the document for ``path``, reading the file the first time."""
+        key = Path(path)
+        if key not in self._docs:
+            if self.backend:
+                data = await self.backend.load_document(key.stem)
+                if data is None:
+                    data = default if default is not None else {}
+            else:
+                data = await helpers.load_json_file(key, default=default)
+            # Another caller may have loaded it while we were reading
+            self._docs.setdefault(key, data)
+        return self._docs[key]
+
+    async def save(self, path: Path | str, data: Any) -> None:
+        """Replace the document for ``path`` and schedule it to be written."""
+        key = Path(path)
+        self._docs[key] = data
+        self._dirty.add(key)
+        if self.interval <= 0:
+            await self.flush(key)
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self, path: Path | str | None = None) -> None:
+        """Write ``path``, or every dirty file, to disk now."""
+        async with self._lock:
+            keys = [Path(path)] if path is not None else list(self._dirty)
+            for key in keys:
+                if key not in self._dirty:
+                    continue
+                self._dirty.discard(key)
+                if await self._write(key, self._docs[key]):
+                    self.writes += 1
+                else:
+                    self._dirty.add(key)
+
+    async def _write(self, key: Path, data: Any) -> bool:
+        if not self.backend:
+            # Cogs keep updating ``data`` during the write. That is safe:
+            # save_json_file encodes small documents before its first await
+            # and copies large ones on the loop before a worker encodes them.
+            return await helpers.save_json_file(key, data)
+        try:
+            await self.backend.save_document(key.stem, data)
+            return True
+        except Exception:
+            logger.exception("Error saving %s to the database", key.stem)
+            return False
+
+    async def close(self) -> None:
+        """Stop the pending timer and write everything still dirty."""
+        timer, self._timer = self._timer, None
+        if timer is not None and not timer.done():
+            timer.cancel()
+        await self.flush()
+
+
+_store: Optional[StateStore] = None
+
+
+def get_state_store() -> StateStore:
+    """Return the :class:`StateStore` shared by every cog."""
+    global _store
+    if _store is None:
+        _store = StateStore(backend=get_backend())
+    return _store
@@ -0,0 +1,55 @@
+import logging
+from pathlib import Path
+from typing import Dict
+
+import config
+from NightCityBot.services.backup_store import BalanceBackupStore
+from NightCityBot.services.event_log import get_event_log
+from NightCityBot.services.sqlite_backend import SQLiteBackend
+from NightCityBot.services.state_store import get_state_store
+
+logger = logging.getLogger(__name__)
+
+# Config fields of the files kept by ``StateStore`` and ``EventLog``
+DOCUMENT_FILES = [
+    "THREAD_MAP_FILE",
+    "SYSTEM_STATUS_FILE",
+    "LAST_PAYMENT_FILE",
+    "CYBERWARE_LOG_FILE",
+]
+EVENT_LOG_FILES = ["OPEN_LOG_FILE", "ATTEND_LOG_FILE"]
+
+
+async def import_json(backend: SQLiteBackend) -> Dict[str, int]:
+    """Copy the JSON state files into ``backend``.
+
+    Must run while the bot still uses the JSON files, so the shared stores
+    hand over their latest state including unwritten changes. Each
+    dataset's rows are replaced, so running it again re-imports the files.
+    Returns the number of entries imported per dataset.
+    """
+    counts: Dict[str, int] = {}
+    store = get_state_store()
+    for field in DOCUMENT_FILES:
+        path = Path(getattr(config, field))
+        data = await store.load(path, default={})
+        if not isinstance(data, dict):
+            logger.warning("Skipping %s: not a JSON object", path.name)
+            continue
+        await backend.save_document(path.stem, data)
+        counts[path.stem] = len(data)
+
+    for field in EVENT_LOG_FILES:
+        path = Path(getattr(config, field))
+        data = await get_event_log(path).snapshot()
+        await backend.replace_events(path.stem, data)
+        counts[path.stem] = sum(len(entries) for entries in data.values())
+
+    backups = BalanceBackupStore()
+    total = 0
+    for user_id in await backups.member_ids():
+        entries = await backups.entries(user_id)
+        await backend.replace_backups(user_id, entries)
+        total += len(entries)
+    counts["balance_backups"] = total
+    return counts
@@ -1,19 +1,21 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 import discord
 from NightCityBot.utils.constants import TRAUMA_ROLE_COSTS
+from NightCityBot.services.unbelievaboat import (
+    BalanceUpdateUnconfirmed,
+    get_shared_client,
+    parse_balance,
+)
+from NightCityBot.services.rent_plan import Charge, split_deduction
 import config
 
 
 class TraumaTeamService:
     def __init__(self, bot):
         self.bot = bot
+        self.unbelievaboat = get_shared_client(bot)
 
-    @staticmethod
-    def _split_deduction(cash: int, amount: int) -> tuple[int, int]:
-        """Return cash and bank portions ensuring negative cash is ignored."""
-        cash_deduct = min(max(cash, 0), amount)
-        bank_deduct = max(0, amount - cash_deduct)
-        return cash_deduct, bank_deduct
+    _split_deduction = staticmethod(split_deduction)
 
     async def process_trauma_team_payment(
             self,
@@ -21,8 +23,17 @@ class TraumaTeamService:
             *,
             log: Optional[List[str]] = None,
             dry_run: bool = False,
-    ) -> None:
-        """Process Trauma Team subscription payment for a member."""
+            balance: Optional[Dict[str, int]] = None,
+            charge: Optional[Charge] = None,
+    ) -> Optional[Dict[str, int]]:
+        """Process Trauma Team subscription payment for a member.
+
+        ``balance`` may be passed when the caller already knows the member's
+        balance to skip the initial fetch. Returns the balance after a
+        successful payment, or ``None`` if nothing was deducted. ``charge``
+        replaces the PATCH and its balance backups when rent collection
+        merges a member's charges.
+        """
         control = self.bot.get_cog('SystemControl')
         if control and not control.is_enabled('trauma_team'):
             if log is not None:
@@ -38,7 +49,10 @@ class TraumaTeamService:
                 log.append("⚠️ TT forum channel not found.")
             return
 
-        balance = await self.bot.get_cog('Economy').unbelievaboat.get_balance(member.id)
+        if balance is None:
+            balance = await self.unbelievaboat.get_balance(
+                member.id, fresh=not dry_run
+            )
         if not balance:
             if log is not None:
                 log.append("⚠️ Could not fetch balance for Trauma processing.")
@@ -99,16 +113,33 @@ class TraumaTeamService:
             "bank": -bank_deduct,
         }
         success = True
+        updated = None
         economy = self.bot.get_cog("Economy")
         if not dry_run and economy:
-            await economy.backup_balances([member], label="cyberware_before")
-            success = await economy.unbelievaboat.update_balance(
-                member.id,
-                payload,
-                reason="Trauma Team Subscription",
-            )
+            if charge is not None:
+                result = await charge(payload, "Trauma Team Subscription")
+            else:
+                await economy.backup_balances([member], label="cyberware_before")
+                try:
+                    result = await self.unbelievaboat.update_balance_returning(
+                        member.id,
+                        payload,
+                        reason="Trauma Team Subscription",
+                    )
+                except BalanceUpdateUnconfirmed:
+                    if log is not None:
+                        log.append(
+                            "⚠️ Trauma Team payment may have gone through. Check the balance before retrying."
+                        )
+                    return None
+            success = result is not None
             if success:
-                await economy.backup_balances([member], label="cyberware_after")
+                updated = parse_balance(result) or {
+                    "cash": cash - cash_deduct,
+                    "bank": bank - bank_deduct,
+                }
+                if charge is None:
+                    await economy.backup_balances([member], label="cyberware_after")
 
         if success:
             if not dry_run and target_thread:
@@ -119,6 +150,7 @@ class TraumaTeamService:
                 log.append(
                     "✅ Trauma Team payment completed." if not dry_run else "✅ (Simulated) Trauma Team payment would succeed."
                 )
+            return updated
         else:
             if not dry_run and target_thread:
                 await target_thread.send(
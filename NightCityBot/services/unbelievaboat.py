@@ -1,85 +1,430 @@
 import asyncio
 import logging
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, Optional
 
 import aiohttp
 import config
+from NightCityBot.services.rate_limiter import RateLimiter, parse_retry_after
+from NightCityBot.services.balance_cache import BalanceCache
+from NightCityBot.services.circuit_breaker import CircuitBreaker, decorrelated_jitter
+from NightCityBot.services.api_metrics import ApiMetrics, EndpointStats
 
 logger = logging.getLogger(__name__)
 
+# Connection pool tuning for the shared client. Every cog talks to the same
+# host, so a small per-host pool of kept-alive connections is enough and lets
+# rent night reuse warm TLS sessions instead of handshaking per request.
+CONNECTOR_LIMIT = 20
+CONNECTOR_LIMIT_PER_HOST = 10
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+REQUEST_TIMEOUT = 30
+# Largest page the leaderboard endpoint returns
+LEADERBOARD_PAGE_SIZE = 1000
+# Retry policy: attempts per call, jittered backoff bounds and the total time
+# one call may spend across all attempts before giving up.
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+CALL_DEADLINE = 20.0
+# How long a successful or failed write check stays valid for simulations
+WRITE_CHECK_TTL = 600
+
+
+class BalanceUpdateUnconfirmed(Exception):
+    """A balance PATCH may have been applied but no answer confirmed it.
+
+    Raised instead of retrying, since sending the PATCH again could charge
+    the member twice. Check the balance before trying again.
+    """
+
 
 class UnbelievaBoatAPI:
     """Minimal async wrapper for the UnbelievaBoat REST API."""
 
     def __init__(
-        self, api_token: str, session: Optional[aiohttp.ClientSession] = None
+        self,
+        api_token: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        cache_ttl: float = 0,
+        cache_size: int = 1024,
+        base_url: Optional[str] = None,
     ) -> None:
-        """Create a new API wrapper."""
+        """Create a new API wrapper.
+
+        The HTTP session is created lazily on first use so the wrapper can be
+        constructed before the event loop is running. Passing a positive
+        ``cache_ttl`` enables the in-memory balance cache. ``base_url``
+        overrides ``config.UNBELIEVABOAT_API_URL``.
+        """
         self.api_token = api_token
-        self.base_url = f"https://unbelievaboat.com/api/v1/guilds/{config.GUILD_ID}"
+        api_url = base_url or getattr(
+            config, "UNBELIEVABOAT_API_URL", "https://unbelievaboat.com/api/v1"
+        )
+        self.base_url = f"{api_url.rstrip('/')}/guilds/{config.GUILD_ID}"
         self.headers = {"Authorization": api_token, "Content-Type": "application/json"}
-        self.session = session or aiohttp.ClientSession()
+        self.session = session
+        self.limiter = RateLimiter()
+        self.breaker = CircuitBreaker()
+        self.metrics = ApiMetrics()
+        self.balance_cache: Optional[BalanceCache] = (
+            BalanceCache(cache_ttl, cache_size) if cache_ttl > 0 else None
+        )
+        # Pending balance fetches keyed by user ID so concurrent callers share one
+        self._inflight: Dict[int, asyncio.Future] = {}
+        self._write_check: Optional[tuple[float, bool]] = None
+        self._write_check_lock = asyncio.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it if needed."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTOR_LIMIT,
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
+        return self.session
 
     async def close(self) -> None:
-        await self.session.close()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
 
-    async def get_balance(self, user_id: int) -> Optional[Dict]:
-        """Get a user's balance from UnbelievaBoat."""
-        url = f"{self.base_url}/users/{user_id}"
-        for attempt in range(3):
+    @property
+    def available(self) -> bool:
+        """Return ``False`` while the circuit breaker is rejecting calls."""
+        return self.breaker.available
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        bucket: str,
+        label: str,
+        *,
+        endpoint: Optional[str] = None,
+        deadline: float = CALL_DEADLINE,
+        **kwargs,
+    ) -> Optional[Dict]:
+        """Send a request through the shared rate limiter and circuit breaker.
+
+        Returns the decoded JSON body on success or ``None`` once all attempts
+        have failed, ``deadline`` seconds have passed or the breaker is open.
+        Timings are recorded in :attr:`metrics` under ``endpoint``.
+
+        A PATCH is only retried when it certainly wasn't applied: after a
+        429 or when the connection couldn't be opened. A timeout, dropped
+        connection or 5xx after it was sent raises
+        :class:`BalanceUpdateUnconfirmed`.
+        """
+        stats = self.metrics.endpoint(endpoint or f"{method} {label}")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = None
+        try:
+            result = await self._send(method, url, bucket, label, stats, deadline, **kwargs)
+        finally:
+            stats.observe(loop.time() - started, result is not None)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        bucket: str,
+        label: str,
+        stats: EndpointStats,
+        deadline: float,
+        **kwargs,
+    ) -> Optional[Dict]:
+        if not self.breaker.allow():
+            stats.errors["circuit_open"] += 1
+            logger.warning("%s skipped: economy backend unavailable", label)
+            return None
+        session = self._get_session()
+        loop = asyncio.get_running_loop()
+        # Only reads are safe to repeat once the request may have arrived
+        idempotent = method == "GET"
+        give_up_at = loop.time() + deadline
+        delay = BACKOFF_BASE
+        for attempt in range(MAX_ATTEMPTS):
+            remaining = give_up_at - loop.time()
+            if remaining <= 0:
+                break
+            waited = loop.time()
             try:
-                async with self.session.get(url, headers=self.headers) as resp:
+                await asyncio.wait_for(self.limiter.acquire(bucket), remaining)
+            except asyncio.TimeoutError:
+                stats.errors["deadline"] += 1
+                break
+            finally:
+                stats.limiter_wait += loop.time() - waited
+            remaining = max(give_up_at - loop.time(), 0.001)
+            stats.attempts += 1
+            sent = loop.time()
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=remaining),
+                    **kwargs,
+                ) as resp:
+                    stats.upstream_time += loop.time() - sent
+                    self.limiter.update_from_headers(bucket, resp.headers)
                     if resp.status == 200:
-                        return await resp.json()
+                        self.limiter.record_success(bucket)
+                        self.breaker.record_success()
+                        try:
+                            return await resp.json(content_type=None) or {}
+                        except ValueError:
+                            return {}
                     if resp.status == 429:
-                        data = await resp.json()
-                        retry = float(data.get("retry_after", 1))
-                        if retry > 1000:
-                            retry /= 1000
-                        await asyncio.sleep(retry)
+                        self.breaker.record_success()
+                        try:
+                            data = await resp.json(content_type=None)
+                        except ValueError:
+                            data = None
+                        retry_after = parse_retry_after(data, resp.headers)
+                        stats.rate_limited += 1
+                        stats.rate_limit_sleep += retry_after
+                        self.limiter.backoff(bucket, retry_after)
                         continue
+                    stats.errors[str(resp.status)] += 1
                     logger.warning(
-                        "Balance fetch failed (%s): %s", resp.status, await resp.text()
+                        "%s failed (%s): %s", label, resp.status, await resp.text()
                     )
-            except aiohttp.ClientError as e:
-                logger.warning(
-                    "Balance request error on attempt %s: %s", attempt + 1, e
-                )
-            await asyncio.sleep(1)
+                    if resp.status < 500:
+                        # The backend answered; retrying won't change a 4xx
+                        self.breaker.record_success()
+                        return None
+                    self.breaker.record_failure()
+                    if not idempotent:
+                        raise self._unconfirmed(label, stats, f"status {resp.status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                stats.upstream_time += loop.time() - sent
+                stats.errors[
+                    "timeout" if isinstance(e, asyncio.TimeoutError) else "connection"
+                ] += 1
+                logger.warning("%s error on attempt %s: %s", label, attempt + 1, e)
+                self.breaker.record_failure()
+                if not idempotent and not isinstance(e, aiohttp.ClientConnectorError):
+                    raise self._unconfirmed(label, stats, str(e) or type(e).__name__) from e
+            if not self.breaker.available:
+                break
+            delay = decorrelated_jitter(delay, BACKOFF_BASE, BACKOFF_CAP)
+            pause = min(delay, max(give_up_at - loop.time(), 0))
+            stats.backoff_sleep += pause
+            await asyncio.sleep(pause)
         return None
 
+    @staticmethod
+    def _unconfirmed(
+        label: str, stats: EndpointStats, detail: str
+    ) -> BalanceUpdateUnconfirmed:
+        stats.errors["unconfirmed"] += 1
+        logger.warning("%s may have been applied (%s); not retrying", label, detail)
+        return BalanceUpdateUnconfirmed(f"{label} may have been applied ({detail})")
+
+    async def get_balance(self, user_id: int, *, fresh: bool = False) -> Optional[Dict]:
+        """Get a user's balance from UnbelievaBoat.
+
+        When the balance cache is enabled a recent value may be returned.
+        Pass ``fresh=True`` on paths that move money to always hit the API.
+        """
+        cache = self.balance_cache
+        if cache is not None and not fresh:
+            cached = cache.get(user_id)
+            if cached is not None:
+                return cached
+
+        task = self._inflight.get(user_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_balance(user_id))
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda t: self._forget_inflight(user_id, t))
+        # Shield the shared request so one cancelled caller doesn't cancel it
+        result = await asyncio.shield(task)
+        return dict(result) if result else result
+
+    async def _fetch_balance(self, user_id: int) -> Optional[Dict]:
+        url = f"{self.base_url}/users/{user_id}"
+        result = await self._request(
+            "GET", url, "get", "Balance fetch", endpoint="GET /users/{id}"
+        )
+        # Skip caching when a PATCH superseded this fetch while it was running
+        current = self._inflight.get(user_id) is asyncio.current_task()
+        if self.balance_cache is not None and result and current:
+            self.balance_cache.set(user_id, result)
+        return result
+
+    def _forget_inflight(self, user_id: int, task: asyncio.Future) -> None:
+        if self._inflight.get(user_id) is task:
+            del self._inflight[user_id]
+
     async def update_balance(
         self, user_id: int, amount_dict: Dict, reason: str = "Automated rent/income"
     ) -> bool:
-        """Update a user's balance on UnbelievaBoat."""
+        """Update a user's balance on UnbelievaBoat.
+
+        Returns ``False`` on failure, including when the PATCH may have been
+        applied without a confirmation (that case is logged as such).
+        """
+        try:
+            result = await self.update_balance_returning(user_id, amount_dict, reason)
+        except BalanceUpdateUnconfirmed:
+            return False
+        return result is not None
+
+    async def update_balance_returning(
+        self, user_id: int, amount_dict: Dict, reason: str = "Automated rent/income"
+    ) -> Optional[Dict]:
+        """Update a user's balance and return the decoded PATCH response.
+
+        Returns ``None`` when the PATCH was rejected or never sent, and
+        raises :class:`BalanceUpdateUnconfirmed` when it may have been
+        applied. Callers can read the post-mutation balance from the
+        response with :func:`parse_balance` instead of sending another GET.
+        """
         url = f"{self.base_url}/users/{user_id}"
         payload = amount_dict.copy()
         payload["reason"] = reason
+        # A GET already in flight may predate this change; later reads must
+        # start a new request instead of joining it.
+        self._inflight.pop(user_id, None)
+        try:
+            result = await self._request(
+                "PATCH",
+                url,
+                "patch",
+                "Balance PATCH",
+                endpoint="PATCH /users/{id}",
+                json=payload,
+            )
+        except BalanceUpdateUnconfirmed:
+            if self.balance_cache is not None:
+                self.balance_cache.invalidate(user_id)
+            raise
+        if self.balance_cache is not None:
+            if parse_balance(result):
+                self.balance_cache.set(user_id, result)
+            else:
+                self.balance_cache.invalidate(user_id)
+        return result
 
-        for attempt in range(3):
+    async def _fetch_leaderboard_page(
+        self, page: int, page_size: int
+    ) -> tuple[Dict[int, Dict[str, int]], int]:
+        """Return the balances on one leaderboard page and the page count."""
+        url = f"{self.base_url}/users"
+        params = {"page": page, "limit": page_size}
+        data = await self._request(
+            "GET",
+            url,
+            "get",
+            f"Leaderboard page {page}",
+            endpoint="GET /users",
+            params=params,
+        )
+        if isinstance(data, dict):
+            users = data.get("users", [])
+            total_pages = int(data.get("total_pages", 1) or 1)
+        else:
+            users = data or []
+            total_pages = page + 1 if len(users) >= page_size else page
+        balances: Dict[int, Dict[str, int]] = {}
+        for entry in users:
+            bal = parse_balance(entry)
+            if bal is None:
+                continue
             try:
-                async with self.session.patch(
-                    url, headers=self.headers, json=payload
-                ) as resp:
-                    if resp.status == 200:
-                        return True
-                    if resp.status == 429:
-                        data = await resp.json()
-                        retry = float(data.get("retry_after", 1))
-                        if retry > 1000:
-                            retry /= 1000
-                        await asyncio.sleep(retry)
-                        continue
-                    error = await resp.text()
-                    logger.warning("PATCH failed (%s): %s", resp.status, error)
-            except aiohttp.ClientError as e:
-                logger.warning("Balance PATCH error on attempt %s: %s", attempt + 1, e)
-            await asyncio.sleep(1)
-        return False
+                balances[int(entry.get("user_id"))] = bal
+            except (TypeError, ValueError):
+                continue
+        return balances, total_pages
+
+    async def fetch_all_balances(
+        self, *, concurrency: int = 1, page_size: int = LEADERBOARD_PAGE_SIZE
+    ) -> Dict[int, Dict[str, int]]:
+        """Return ``{user_id: {"cash", "bank"}}`` for every member on the leaderboard.
+
+        Pages are fetched one after another by default. With ``concurrency``
+        greater than one the remaining pages run in parallel, still throttled
+        by the shared rate limiter. Members missing from the result (failed
+        pages or no economy record) should be looked up with
+        :meth:`get_balance`.
+        """
+        balances, total_pages = await self._fetch_leaderboard_page(1, page_size)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page: int) -> Dict[int, Dict[str, int]]:
+            async with semaphore:
+                page_balances, _ = await self._fetch_leaderboard_page(page, page_size)
+                return page_balances
+
+        if concurrency > 1:
+            pages = await asyncio.gather(
+                *(fetch(p) for p in range(2, total_pages + 1))
+            )
+            for page_balances in pages:
+                balances.update(page_balances)
+        else:
+            page = 2
+            while page <= total_pages:
+                page_balances, total_pages = await self._fetch_leaderboard_page(
+                    page, page_size
+                )
+                balances.update(page_balances)
+                page += 1
+
+        if self.balance_cache is not None:
+            for uid, bal in balances.items():
+                self.balance_cache.set(uid, bal)
+        return balances
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return balance cache hit/miss counters (all zero when disabled)."""
+        if self.balance_cache is None:
+            return {"hits": 0, "misses": 0, "size": 0}
+        return self.balance_cache.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return client metrics as a JSON-serialisable mapping."""
+        return {
+            "endpoints": self.metrics.snapshot(),
+            "cache": self.cache_stats(),
+            "circuit": {"state": self.breaker.state, "failures": self.breaker.failures},
+            "rate_limits": {
+                name: round(bucket.rate, 2)
+                for name, bucket in self.limiter.buckets.items()
+            },
+        }
+
+    async def check_write_access(self, *, refresh: bool = False) -> bool:
+        """Return whether balances can be updated, probing the test account once.
+
+        Simulations call this instead of :meth:`verify_balance_ops` for every
+        member. The result is cached for ``WRITE_CHECK_TTL`` seconds so one
+        probe covers a whole run, including nested rent and cyberware previews.
+        """
+        async with self._write_check_lock:
+            now = time.monotonic()
+            cached = self._write_check
+            if not refresh and cached and now - cached[0] < WRITE_CHECK_TTL:
+                return cached[1]
+            ok = await self.verify_balance_ops(config.TEST_USER_ID)
+            self._write_check = (now, ok)
+            return ok
 
     async def verify_balance_ops(self, user_id: int) -> bool:
         """Test updating a balance without affecting the final amount."""
-        balance = await self.get_balance(user_id)
+        balance = await self.get_balance(user_id, fresh=True)
         if not balance:
             return False
 
@@ -103,8 +448,32 @@ class UnbelievaBoatAPI:
         if not plus:
             return False
 
-        final = await self.get_balance(user_id)
+        final = await self.get_balance(user_id, fresh=True)
         if not final:
             return False
 
         return final.get(target_field, 0) == start_value
+
+
+def parse_balance(data: Any) -> Optional[Dict[str, int]]:
+    """Return ``{"cash", "bank"}`` from an API response body if present."""
+    if isinstance(data, dict) and "cash" in data and "bank" in data:
+        return {"cash": data["cash"], "bank": data["bank"]}
+    return None
+
+
+def get_shared_client(bot) -> UnbelievaBoatAPI:
+    """Return the bot-wide UnbelievaBoat client, creating it on first use.
+
+    All cogs and services share this instance so they reuse one connection
+    pool. The bot is responsible for closing it on shutdown.
+    """
+    client = getattr(bot, "unbelievaboat", None)
+    if not isinstance(client, UnbelievaBoatAPI):
+        client = UnbelievaBoatAPI(
+            config.UNBELIEVABOAT_API_TOKEN,
+            cache_ttl=getattr(config, "BALANCE_CACHE_TTL", 0),
+            cache_size=getattr(config, "BALANCE_CACHE_SIZE", 1024),
+        )
+        bot.unbelievaboat = client
+    return client
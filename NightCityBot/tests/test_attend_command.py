@@ -1,3 +1,7 @@
+import json
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
 from typing import List
 import discord
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -5,6 +9,16 @@ from datetime import datetime, timedelta
 import config
 from NightCityBot.utils.constants import ROLE_COSTS_BUSINESS, ROLE_COSTS_HOUSING
 
+@contextmanager
+def attend_log(data):
+    """Point ATTEND_LOG_FILE at a temporary log holding ``data``."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "attendance_log.json"
+        path.write_text(json.dumps(data))
+        with patch.object(config, "ATTEND_LOG_FILE", path):
+            yield path
+
+
 async def run(suite, ctx) -> List[str]:
     """Test the attend reward command and its restrictions."""
     control = suite.bot.get_cog('SystemControl')
@@ -56,11 +70,7 @@ async def run(suite, ctx) -> List[str]:
     prev = sunday - timedelta(hours=1)
     with (
         patch("NightCityBot.utils.helpers.get_tz_now", return_value=sunday),
-        patch(
-            "NightCityBot.cogs.economy.load_json_file",
-            new=AsyncMock(return_value={str(mock_author.id): [prev.isoformat()]}),
-        ),
-        patch("NightCityBot.cogs.economy.save_json_file", new=AsyncMock()),
+        attend_log({str(mock_author.id): [prev.isoformat()]}),
     ):
         await economy.attend(ctx)
         msg = ctx.send.await_args[0][0]
@@ -74,11 +84,7 @@ async def run(suite, ctx) -> List[str]:
     prev2 = sunday - timedelta(days=7)
     with (
         patch("NightCityBot.utils.helpers.get_tz_now", return_value=sunday),
-        patch(
-            "NightCityBot.cogs.economy.load_json_file",
-            new=AsyncMock(return_value={str(mock_author.id): [prev2.isoformat()]}),
-        ),
-        patch("NightCityBot.cogs.economy.save_json_file", new=AsyncMock()),
+        attend_log({str(mock_author.id): [prev2.isoformat()]}),
         patch.object(economy.unbelievaboat, "update_balance", new=AsyncMock()),
     ):
         await economy.attend(ctx)
@@ -21,6 +21,7 @@ async def run(suite, ctx) -> List[str]:
 
     with (
         patch.object(economy.unbelievaboat, "get_balance", new=AsyncMock(return_value={"cash": 100, "bank": 50})),
+        patch.object(economy.unbelievaboat, "fetch_all_balances", new=AsyncMock(return_value={})),
         patch("NightCityBot.cogs.economy.save_json_file", new=fake_save),
         patch.object(economy, "backup_balances", new=AsyncMock()) as mock_backup,
     ):
@@ -27,11 +27,12 @@ async def run(suite, ctx) -> List[str]:
 
     with (
         patch.object(economy.unbelievaboat, 'get_balance', new=AsyncMock(return_value={'cash': BASELINE_LIVING_COST - 400, 'bank': 0})),
-        patch.object(economy.unbelievaboat, 'update_balance', new=AsyncMock(return_value=True)),
+        patch.object(economy.unbelievaboat, 'update_balance_returning', new=AsyncMock(return_value={})),
         patch.object(economy, 'backup_balances', new=AsyncMock()),
         patch.object(economy.trauma_service, 'process_trauma_team_payment', new=AsyncMock()),
         patch('NightCityBot.cogs.economy.load_json_file', new=AsyncMock(return_value={})),
         patch('NightCityBot.cogs.economy.save_json_file', new=AsyncMock()),
+        patch('NightCityBot.utils.helpers.save_json_file', new=AsyncMock()),
         patch('pathlib.Path.exists', return_value=False),
     ):
         await economy.collect_rent(ctx, target_user=user)
@@ -25,7 +25,10 @@ async def run(suite, ctx) -> List[str]:
     ctx.guild.members = [user]
     ctx.send = AsyncMock()
 
-    with patch.object(economy.unbelievaboat, 'get_balance', new=AsyncMock(return_value={'cash': 500, 'bank': 0})):
+    with (
+        patch.object(economy.unbelievaboat, 'fetch_all_balances', new=AsyncMock(return_value={})),
+        patch.object(economy.unbelievaboat, 'get_balance', new=AsyncMock(return_value={'cash': 500, 'bank': 0})),
+    ):
         await economy.list_deficits(ctx)
         suite.assert_send(logs, ctx.send, 'ctx.send')
         msg = ctx.send.await_args[0][0]
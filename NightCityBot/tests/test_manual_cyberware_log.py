@@ -21,6 +21,7 @@ async def run(suite, ctx) -> List[str]:
     with (
         patch('NightCityBot.cogs.cyberware.load_json_file', new=AsyncMock(return_value=[])),
         patch('NightCityBot.cogs.cyberware.save_json_file', new=AsyncMock()) as mock_save,
+        patch('NightCityBot.utils.helpers.save_json_file', new=AsyncMock()),
         patch.object(cyber.unbelievaboat, 'get_balance', new=AsyncMock(return_value={"cash": 500, "bank": 0})),
         patch.object(cyber.unbelievaboat, 'update_balance', new=AsyncMock(return_value=True)),
     ):
@@ -24,14 +24,15 @@ async def run(suite, ctx) -> List[str]:
     bank = 4335
     with (
         patch.object(economy.unbelievaboat, 'get_balance', new=AsyncMock(return_value={'cash': cash, 'bank': bank})),
-        patch.object(economy.unbelievaboat, 'update_balance', new=AsyncMock(return_value=True)) as mock_update,
+        patch.object(economy.unbelievaboat, 'update_balance_returning', new=AsyncMock(return_value={})) as mock_update,
         patch.object(economy, 'backup_balances', new=AsyncMock()),
         patch('NightCityBot.cogs.economy.load_json_file', new=AsyncMock(return_value={})),
         patch('NightCityBot.cogs.economy.save_json_file', new=AsyncMock()),
+        patch('NightCityBot.utils.helpers.save_json_file', new=AsyncMock()),
         patch('pathlib.Path.exists', return_value=False),
     ):
         await economy.collect_rent(ctx, target_user=user)
-        suite.assert_called(logs, mock_update, 'update_balance')
+        suite.assert_called(logs, mock_update, 'update_balance_returning')
         args = mock_update.await_args_list[0].args
         payload = args[1]
         if payload.get('bank') == -BASELINE_LIVING_COST and 'cash' not in payload:
@@ -1,8 +1,11 @@
+import tempfile
+from pathlib import Path
 from typing import List
 import asyncio
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
 import config
+from NightCityBot.services.event_log import get_event_log
 
 async def run(suite, ctx) -> List[str]:
     logs = []
@@ -12,28 +15,20 @@ async def run(suite, ctx) -> List[str]:
     economy = suite.bot.get_cog('Economy')
     ctx.channel = ctx.guild.get_channel(config.BUSINESS_ACTIVITY_CHANNEL_ID)
 
-    storage = {}
-
-    async def fake_load(*_, **__):
-        return storage.get("data", {})
-
-    async def fake_save(_, data):
-        storage["data"] = data
-
     ctx.send = AsyncMock()
     sunday = datetime(2025, 6, 15)
     with (
         patch("NightCityBot.utils.helpers.get_tz_now", return_value=sunday),
-        patch("NightCityBot.cogs.economy.load_json_file", new=fake_load),
-        patch("NightCityBot.cogs.economy.save_json_file", new=fake_save),
+        tempfile.TemporaryDirectory() as tmp,
+        patch.object(config, "OPEN_LOG_FILE", Path(tmp) / "business_open_log.json"),
         patch.object(economy.unbelievaboat, "update_balance", new=AsyncMock()),
     ):
         await asyncio.gather(
             economy.open_shop(ctx),
             economy.open_shop(ctx),
         )
+        entries = await get_event_log(config.OPEN_LOG_FILE).entries(ctx.author.id)
 
-    entries = storage.get("data", {}).get(str(ctx.author.id), [])
     msgs = [c.args[0] for c in ctx.send.call_args_list]
     if len(entries) == 1 and any("already" in m for m in msgs):
         logs.append("✅ concurrent open_shop calls serialized")
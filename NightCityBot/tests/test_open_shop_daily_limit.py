@@ -1,3 +1,5 @@
+import tempfile
+from pathlib import Path
 from typing import List
 import discord
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,21 +17,13 @@ async def run(suite, ctx) -> List[str]:
     original_channel = ctx.channel
     ctx.channel = ctx.guild.get_channel(config.BUSINESS_ACTIVITY_CHANNEL_ID)
 
-    storage = {}
-
-    async def fake_load(*_, **__):
-        return storage.get("data", {})
-
-    async def fake_save(path, data):
-        storage["data"] = data
-
     ctx.send = AsyncMock()
 
     sunday = datetime(2025, 6, 15)
     with (
         patch("NightCityBot.utils.helpers.get_tz_now", return_value=sunday),
-        patch("NightCityBot.cogs.economy.load_json_file", new=fake_load),
-        patch("NightCityBot.cogs.economy.save_json_file", new=fake_save),
+        tempfile.TemporaryDirectory() as tmp,
+        patch.object(config, "OPEN_LOG_FILE", Path(tmp) / "business_open_log.json"),
         patch.object(economy.unbelievaboat, "update_balance", new=AsyncMock()),
     ):
         await economy.open_shop(ctx)
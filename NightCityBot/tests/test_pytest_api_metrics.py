@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from scripts.fake_unbelievaboat import FakeUnbelievaBoat
+from NightCityBot import bot as bot_module
+from NightCityBot.cogs.admin import Admin
+from NightCityBot.services.api_metrics import EndpointStats
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+
+def test_histogram_percentiles():
+    stats = EndpointStats()
+    for elapsed in (0.01, 0.02, 0.03, 0.3, 7.0):
+        stats.observe(elapsed, True)
+    stats.observe(0.2, False)
+    snap = stats.snapshot()
+    assert snap["calls"] == 6
+    assert snap["failures"] == 1
+    assert snap["histogram"]["<=0.05s"] == 3
+    assert snap["histogram"]["<=10.0s"] == 1
+    assert stats.percentile(0.5) == 0.05
+    assert stats.percentile(0.95) == 10.0
+
+
+def test_client_records_attempts_and_rate_limits():
+    server = FakeUnbelievaBoat(rate_limit=0.5, retry_after_ms=20, seed=1)
+
+    async def runner():
+        base_url = await server.start()
+        api = UnbelievaBoatAPI("token", base_url=base_url)
+        try:
+            await api.get_balance(1)
+            await api.update_balance(1, {"cash": -1})
+            return api.stats()
+        finally:
+            await api.close()
+            await server.stop()
+
+    stats = asyncio.run(runner())
+    get = stats["endpoints"]["GET /users/{id}"]
+    assert get["calls"] == 1
+    assert get["attempts"] == 2
+    assert get["rate_limited"] == 1
+    assert get["rate_limit_sleep"] == 0.02
+    assert "PATCH /users/{id}" in stats["endpoints"]
+    assert stats["circuit"]["state"] == "closed"
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def test_api_stats_command():
+    bot = DummyBot()
+    admin = Admin(bot)
+    client = UnbelievaBoatAPI("token")
+    bot.unbelievaboat = client
+    client.metrics.endpoint("GET /users/{id}").observe(0.1, True)
+    client.metrics.endpoint("GET /users/{id}").errors["503"] += 2
+    ctx = MagicMock()
+    ctx.send = AsyncMock()
+    asyncio.run(admin.api_stats.callback(admin, ctx))
+    text = ctx.send.await_args_list[0].args[0]
+    assert "GET /users/{id}" in text
+    assert "503×2" in text
+    asyncio.run(admin.api_stats.callback(admin, ctx, "reset"))
+    assert client.metrics.snapshot() == {}
+
+
+def test_api_stats_route_reads_metrics_on_the_bot_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    client = UnbelievaBoatAPI("token")
+    client.metrics.endpoint("GET /users/{id}").observe(0.1, True)
+    seen = []
+    real_stats = client.stats
+
+    def stats():
+        seen.append(threading.current_thread() is thread)
+        return real_stats()
+
+    client.stats = stats
+    app = bot_module.app
+    try:
+        app.config["BOT"] = SimpleNamespace(unbelievaboat=client, loop=loop)
+        response = app.test_client().get("/api_stats")
+        app.config["BOT"] = SimpleNamespace(unbelievaboat=client)
+        not_ready = app.test_client().get("/api_stats")
+    finally:
+        app.config.pop("BOT", None)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    assert response.status_code == 200
+    assert "GET /users/{id}" in response.get_json()["endpoints"]
+    assert seen == [True]
+    assert not_ready.status_code == 503
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import config
+from NightCityBot.cogs.economy import Economy
+from NightCityBot.services.backup_index import INDEX_FILE, BackupLabelIndex
+from NightCityBot.utils import helpers
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def write_backup(path, *entries):
+    path.write_text(json.dumps([{"label": l, "timestamp": t, "cash": 0, "bank": 0} for l, t in entries]))
+
+
+def test_index_is_built_once_from_existing_backups(tmp_path):
+    recent = datetime.utcnow().isoformat()
+    old = (datetime.utcnow() - timedelta(days=40)).isoformat()
+    write_backup(
+        tmp_path / "balance_backup_1.json",
+        ("collect_rent_before", old),
+        ("collect_rent_after", old),
+        ("collect_rent_after", recent),
+    )
+    index = BackupLabelIndex()
+    loads = AsyncMock(wraps=helpers.load_json_file)
+
+    async def run():
+        first = await index.last_used(tmp_path, 1, "collect_rent_after")
+        before = await index.last_used(tmp_path, 1, "collect_rent_before")
+        missing = await index.last_used(tmp_path, 2, "collect_rent_after")
+        return first, before, missing
+
+    with patch.object(helpers, "load_json_file", new=loads):
+        first, before, missing = asyncio.run(run())
+    assert first == datetime.fromisoformat(recent)
+    assert before == datetime.fromisoformat(old)
+    assert missing is None
+    # One read of the (missing) index and one of the backup file
+    assert loads.await_count == 2
+    assert (tmp_path / INDEX_FILE).exists()
+
+
+def test_backups_written_after_the_index_are_rescanned(tmp_path):
+    ts = datetime.utcnow().isoformat()
+    (tmp_path / INDEX_FILE).write_text("{}")
+    backup = tmp_path / "balance_backup_5.json"
+    write_backup(backup, ("collect_trauma_after", ts))
+    # Simulate a backup that hit disk after the last index save
+    saved = (tmp_path / INDEX_FILE).stat().st_mtime
+    os.utime(backup, (saved + 5, saved + 5))
+
+    index = BackupLabelIndex()
+    assert asyncio.run(index.last_used(tmp_path, 5, "collect_trauma_after")) == datetime.fromisoformat(ts)
+
+
+def test_backup_balances_updates_the_index(tmp_path):
+    bot = DummyBot()
+    economy = Economy(bot)
+    member = MagicMock()
+    member.id = 9
+
+    async def run():
+        await economy.backup_balances(
+            [member], label="collect_housing_after", balances={9: {"cash": 1, "bank": 2}}
+        )
+        used = await economy._label_used_recently(member, "collect_housing_after")
+        unused = await economy._label_used_recently(member, "collect_business_after")
+        return used, unused
+
+    with patch.object(config, "BALANCE_BACKUP_DIR", tmp_path):
+        used, unused = asyncio.run(run())
+    assert used is True
+    assert unused is False
+
+
+def test_temporary_files_are_not_indexed(tmp_path):
+    ts = datetime.utcnow().isoformat()
+    write_backup(tmp_path / "balance_backup_5.json", ("manual", ts))
+    # Left behind by a save that never finished
+    write_backup(tmp_path / "balance_backup_5.json.tmp", ("collect_rent_after", ts))
+
+    index = BackupLabelIndex()
+
+    async def run():
+        return (
+            await index.last_used(tmp_path, 5, "manual"),
+            await index.last_used(tmp_path, 5, "collect_rent_after"),
+        )
+
+    manual, rent = asyncio.run(run())
+    assert manual == datetime.fromisoformat(ts)
+    assert rent is None
@@ -0,0 +1,77 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import config
+from NightCityBot.services import backup_store
+from NightCityBot.services.backup_store import BalanceBackupStore
+
+
+def labels(entries):
+    return [e["label"] for e in entries]
+
+
+def test_after_entries_follow_their_before(tmp_path):
+    store = BalanceBackupStore()
+
+    async def run():
+        await store.append(1, "collect_rent_before", {"cash": 100, "bank": 0})
+        await store.append(1, "cyberware_before", {"cash": 80, "bank": 0})
+        await store.append(1, "collect_rent_after", {"cash": 60, "bank": 5})
+        return await store.entries(1)
+
+    with patch.object(config, "BALANCE_BACKUP_DIR", tmp_path):
+        entries = asyncio.run(run())
+    assert labels(entries) == ["collect_rent_before", "collect_rent_after", "cyberware_before"]
+    assert [e["change"] for e in entries] == [100, -35, -20]
+    assert set(entries[1]) == {"timestamp", "label", "cash", "bank", "change"}
+    # Only the append log was written
+    assert not (tmp_path / "balance_backup_1.json").exists()
+    assert len((tmp_path / "balance_backup_1.jsonl").read_text().splitlines()) == 3
+
+
+def test_existing_history_and_compaction(tmp_path):
+    legacy = [
+        {"timestamp": "2025-01-01T00:00:00", "label": "collect_rent_before", "cash": 10, "bank": 0, "change": 10}
+    ]
+    (tmp_path / "balance_backup_7.json").write_text(json.dumps(legacy))
+
+    async def run():
+        store = BalanceBackupStore()
+        await store.append(7, "collect_rent_after", {"cash": 4, "bank": 0})
+        for i in range(3):
+            await store.append(7, f"manual_{i}", {"cash": i, "bank": 0})
+        before = await store.entries(7)
+        latest = await store.latest(7, "collect_rent_after")
+        # A fresh store (e.g. after a restart) sees the same history
+        return before, latest, await BalanceBackupStore().entries(7)
+
+    with (
+        patch.object(config, "BALANCE_BACKUP_DIR", tmp_path),
+        patch.object(backup_store, "COMPACT_AFTER", 4),
+    ):
+        before, latest, after = asyncio.run(run())
+    assert labels(before) == ["collect_rent_before", "collect_rent_after", "manual_0", "manual_1", "manual_2"]
+    assert latest["change"] == -6
+    assert after == before
+    assert json.loads((tmp_path / "balance_backup_7.json").read_text()) == before
+    assert not (tmp_path / "balance_backup_7.jsonl").exists()
+
+
+def test_log_lines_already_compacted_are_ignored(tmp_path):
+    compacted = [{"label": "a", "cash": 1, "bank": 0}, {"label": "b", "cash": 2, "bank": 0}]
+    (tmp_path / "balance_backup_3.json").write_text(json.dumps(compacted))
+    # Left behind by a crash between rewriting the list and removing the log
+    stale = {"seq": 1, "key": [1, 0, 0], "label": "b", "cash": 2, "bank": 0}
+    (tmp_path / "balance_backup_3.jsonl").write_text(json.dumps(stale) + "\n")
+
+    async def run():
+        store = BalanceBackupStore()
+        await store.append(3, "c", {"cash": 3, "bank": 0})
+        return await store.entries(3), await store.member_ids()
+
+    with patch.object(config, "BALANCE_BACKUP_DIR", tmp_path):
+        entries, ids = asyncio.run(run())
+    assert labels(entries) == ["a", "b", "c"]
+    assert entries[-1]["change"] == 1
+    assert ids == [3]
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+from NightCityBot.services.balance_cache import BalanceCache
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+
+def test_cache_ttl_and_lru():
+    cache = BalanceCache(ttl=0.05, max_size=2)
+    cache.set(1, {"cash": 1, "bank": 0})
+    cache.set(2, {"cash": 2, "bank": 0})
+    assert cache.get(1) == {"cash": 1, "bank": 0}
+    cache.set(3, {"cash": 3, "bank": 0})
+    # 2 was least recently used and is evicted
+    assert cache.get(2) is None
+    time.sleep(0.06)
+    assert cache.get(1) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_get_balance_uses_cache():
+    api = UnbelievaBoatAPI("token", cache_ttl=30)
+    mock = AsyncMock(return_value={"cash": 10, "bank": 5})
+
+    async def runner():
+        with patch.object(api, "_request", new=mock):
+            await api.get_balance(1)
+            await api.get_balance(1)
+            assert mock.await_count == 1
+            await api.get_balance(1, fresh=True)
+            assert mock.await_count == 2
+
+    asyncio.run(runner())
+    assert api.cache_stats()["hits"] == 1
+
+
+def test_patch_updates_cache():
+    api = UnbelievaBoatAPI("token", cache_ttl=30)
+
+    async def runner():
+        with patch.object(api, "_request", new=AsyncMock(return_value={"cash": 3, "bank": 4})):
+            await api.update_balance(1, {"cash": -7})
+        assert await api.get_balance(1) == {"cash": 3, "bank": 4}
+        with patch.object(api, "_request", new=AsyncMock(return_value=None)):
+            await api.update_balance(1, {"cash": -1})
+        assert api.balance_cache.get(1) is None
+
+    asyncio.run(runner())
+
+
+def test_cache_disabled_by_default():
+    api = UnbelievaBoatAPI("token")
+    assert api.balance_cache is None
+    assert api.cache_stats() == {"hits": 0, "misses": 0, "size": 0}
@@ -0,0 +1,49 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from NightCityBot.utils.output import BufferedSender
+
+
+def test_lines_are_packed_up_to_the_limit():
+    send = AsyncMock()
+
+    async def run():
+        async with BufferedSender(send, limit=20, interval=0) as out:
+            await out.extend(["a" * 8, "b" * 8, "c" * 8, "d" * 30, "e"])
+        return out
+
+    out = asyncio.run(run())
+    assert [c.args[0] for c in send.await_args_list] == [
+        "a" * 8 + "\n" + "b" * 8,
+        "c" * 8,
+        "d" * 30,
+        "e",
+    ]
+    assert out.messages_sent == 4
+
+
+def test_buffer_is_flushed_after_the_interval():
+    send = AsyncMock()
+
+    async def run():
+        out = BufferedSender(send, interval=0.01)
+        await out.send("first")
+        await out.send("second")
+        await asyncio.sleep(0.05)
+        sent_early = [c.args[0] for c in send.await_args_list]
+        await out.flush()
+        return sent_early
+
+    assert asyncio.run(run()) == ["first\nsecond"]
+    assert send.await_count == 1
+
+
+def test_send_errors_are_not_raised():
+    send = AsyncMock(side_effect=RuntimeError("rate limited"))
+
+    async def run():
+        async with BufferedSender(send, interval=0) as out:
+            await out.send("line")
+
+    asyncio.run(run())
+    send.assert_awaited_once_with("line")
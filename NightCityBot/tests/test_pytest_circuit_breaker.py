@@ -0,0 +1,123 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+
+from NightCityBot.services import unbelievaboat as ub
+from NightCityBot.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    decorrelated_jitter,
+)
+from NightCityBot.cogs.economy import Economy
+
+
+class FailingSession:
+    closed = False
+
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        raise aiohttp.ClientConnectionError("connection refused")
+
+
+def test_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    assert breaker.allow()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert not breaker.available
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Only one probe is let through while half-open
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_decorrelated_jitter_bounds():
+    for _ in range(100):
+        delay = decorrelated_jitter(2.0, 0.5, 4.0)
+        assert 0.5 <= delay <= 4.0
+
+
+def test_open_breaker_fails_fast(monkeypatch):
+    monkeypatch.setattr(ub, "BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(ub, "BACKOFF_CAP", 0.002)
+    session = FailingSession()
+    api = ub.UnbelievaBoatAPI("token", session=session)
+    api.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    async def runner():
+        first = await api.get_balance(1)
+        calls = session.calls
+        start = time.monotonic()
+        second = await api.get_balance(2)
+        return first, calls, second, time.monotonic() - start
+
+    first, calls, second, elapsed = asyncio.run(runner())
+    assert first is None and second is None
+    assert calls == 3
+    # The second call never reached the session
+    assert session.calls == 3
+    assert not api.available
+    assert elapsed < 0.05
+
+
+def test_request_respects_deadline():
+    class SlowSession:
+        closed = False
+
+        def request(self, method, url, **kwargs):
+            raise asyncio.TimeoutError()
+
+    api = ub.UnbelievaBoatAPI("token", session=SlowSession())
+
+    async def runner():
+        start = time.monotonic()
+        result = await api._request("GET", "url", "get", "Test", deadline=0.2)
+        return result, time.monotonic() - start
+
+    result, elapsed = asyncio.run(runner())
+    assert result is None
+    assert elapsed < 0.5
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def test_rent_collection_aborts_when_backend_down():
+    bot = DummyBot()
+    economy = Economy(bot)
+    economy.unbelievaboat.breaker.record_failure()
+    economy.unbelievaboat.breaker.state = OPEN
+    economy.unbelievaboat.breaker.opened_at = time.monotonic()
+    ctx = MagicMock()
+    ctx.send = AsyncMock()
+    asyncio.run(economy.run_rent_collection(ctx, dry_run=True))
+    messages = [c.args[0] for c in ctx.send.await_args_list]
+    assert any("Economy backend unavailable" in m for m in messages)
+    ctx.guild.get_channel.assert_not_called()
@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+from NightCityBot.services import event_log
+from NightCityBot.services.event_log import EventLog
+
+
+def test_appends_are_replayed_on_load(tmp_path):
+    path = tmp_path / "open.json"
+    path.write_text(json.dumps({"1": ["2025-06-01T10:00:00"]}))
+
+    async def scenario():
+        log = EventLog(path)
+        await log.append(1, "2025-06-08T10:00:00")
+        await log.append(2, "2025-06-08T11:00:00")
+        # The snapshot is untouched until the log is compacted
+        assert json.loads(path.read_text()) == {"1": ["2025-06-01T10:00:00"]}
+        assert len(log.log_path.read_text().splitlines()) == 2
+        return await EventLog(path).snapshot()
+
+    data = asyncio.run(scenario())
+    assert data == {
+        "1": ["2025-06-01T10:00:00", "2025-06-08T10:00:00"],
+        "2": ["2025-06-08T11:00:00"],
+    }
+    assert json.loads(path.read_text()) == data
+    assert not (tmp_path / "open.jsonl").exists()
+
+
+def test_replay_skips_events_already_compacted(tmp_path, monkeypatch):
+    path = tmp_path / "open.json"
+    monkeypatch.setattr(event_log, "COMPACT_AFTER", 2)
+    log = EventLog(path)
+
+    async def scenario():
+        await log.append(1, "a")
+        await log.append(1, "b")
+        await log.append(1, "c")
+
+    asyncio.run(scenario())
+    assert json.loads(path.read_text()) == {"1": ["a", "b"]}
+    # Simulate a crash after the snapshot was written but before the log
+    # holding those events was removed.
+    with open(log.log_path, "a") as f:
+        f.write(json.dumps({"user": "1", "ts": "a"}) + "\n")
+    assert asyncio.run(EventLog(path).entries(1)) == ["a", "b", "c"]
+
+
+def test_rotate_and_retain(tmp_path):
+    path = tmp_path / "open.json"
+    backup = tmp_path / "open_backup.json"
+    log = EventLog(path)
+
+    async def scenario():
+        await log.append(1, "a")
+        await log.append(2, "b")
+        removed = await log.retain([1])
+        old = await log.rotate(backup)
+        return removed, old, await log.snapshot()
+
+    removed, old, data = asyncio.run(scenario())
+    assert removed == 1
+    assert old == {"1": ["a"]}
+    assert data == {}
+    assert json.loads(backup.read_text()) == {"1": ["a"]}
+    assert json.loads(path.read_text()) == {}
+
+
+def test_retain_keeps_concurrent_appends(tmp_path):
+    path = tmp_path / "open.json"
+    log = EventLog(path)
+
+    async def scenario():
+        await log.append(1, "a")
+        await log.append(2, "b")
+        # retain starts while the append is still writing its line
+        await asyncio.gather(log.append(1, "c"), log.retain([1]))
+        return await log.snapshot()
+
+    assert asyncio.run(scenario()) == {"1": ["a", "c"]}
+    assert asyncio.run(EventLog(path).snapshot()) == {"1": ["a", "c"]}
+
+
+def test_count_matches_entries(tmp_path):
+    log = EventLog(tmp_path / "open.json")
+
+    async def scenario():
+        await log.append(1, "a")
+        await log.append(1, "b")
+        return await log.count(1), await log.count(2)
+
+    assert asyncio.run(scenario()) == (2, 0)
@@ -56,6 +56,10 @@ def run_test(func):
     return asyncio.run(func(suite, ctx))
 
 
-def test_eviction_on_baseline_failure():
-    logs = run_test(run_eviction)
+def test_eviction_on_baseline_failure(tmp_path):
+    with (
+        patch.object(config, "RENT_JOURNAL_DIR", tmp_path / "journals"),
+        patch.object(config, "RENT_AUDIT_DIR", tmp_path / "audits"),
+    ):
+        logs = run_test(run_eviction)
     assert all("❌" not in l for l in logs), f"Logs: {logs}"
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from scripts.fake_unbelievaboat import FakeUnbelievaBoat
+from NightCityBot.services import unbelievaboat as ub
+
+
+def run_against(server, coro_factory):
+    async def runner():
+        base_url = await server.start()
+        api = ub.UnbelievaBoatAPI("token", base_url=base_url)
+        try:
+            return await coro_factory(api)
+        finally:
+            await api.close()
+            await server.stop()
+
+    return asyncio.run(runner())
+
+
+def test_client_round_trip():
+    server = FakeUnbelievaBoat(starting_cash=100)
+
+    async def scenario(api):
+        before = await api.get_balance(1)
+        after = await api.update_balance_returning(1, {"cash": -40})
+        await api.get_balance(2)
+        snapshot = await api.fetch_all_balances(page_size=1)
+        return before, ub.parse_balance(after), snapshot
+
+    before, after, snapshot = run_against(server, scenario)
+    assert before["cash"] == 100
+    assert after == {"cash": 60, "bank": 0}
+    assert snapshot == {1: {"cash": 60, "bank": 0}, 2: {"cash": 100, "bank": 0}}
+    assert server.stats["leaderboard"] == 2
+
+
+def test_client_recovers_from_rate_limit():
+    # With this seed the first request is rate limited and the retry succeeds
+    server = FakeUnbelievaBoat(rate_limit=0.5, retry_after_ms=20, seed=1)
+
+    async def scenario(api):
+        return await api.get_balance(5)
+
+    result = run_against(server, scenario)
+    assert result["cash"] == server.starting_cash
+    assert server.stats["429"] == 1
+
+
+def test_server_errors_open_breaker(monkeypatch):
+    monkeypatch.setattr(ub, "BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(ub, "BACKOFF_CAP", 0.002)
+    server = FakeUnbelievaBoat(error_rate=1.0)
+
+    async def scenario(api):
+        first = await api.get_balance(1)
+        second = await api.get_balance(2)
+        return first, second, api.available
+
+    first, second, available = run_against(server, scenario)
+    assert first is None and second is None
+    assert not available
+    assert server.stats["5xx"] == 5
+
+
+def test_dropped_connection_is_retried(monkeypatch):
+    monkeypatch.setattr(ub, "BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(ub, "BACKOFF_CAP", 0.002)
+    server = FakeUnbelievaBoat(drop_rate=0.5, seed=3)
+
+    async def scenario(api):
+        return [await api.get_balance(uid) for uid in range(1, 6)]
+
+    results = run_against(server, scenario)
+    assert server.stats["dropped"] >= 1
+    assert sum(1 for r in results if r) >= 3
+
+
+def test_unconfirmed_patch_is_not_retried(monkeypatch):
+    monkeypatch.setattr(ub, "BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(ub, "BACKOFF_CAP", 0.002)
+    server = FakeUnbelievaBoat(drop_rate=1.0)
+
+    async def scenario(api):
+        with pytest.raises(ub.BalanceUpdateUnconfirmed):
+            await api.update_balance_returning(1, {"cash": -10})
+        server.drop_rate = 0.0
+        server.error_rate = 1.0
+        ok = await api.update_balance(1, {"cash": -10})
+        return ok, api.stats()
+
+    ok, stats = run_against(server, scenario)
+    assert ok is False
+    # One attempt each: a PATCH that may have landed is never sent again
+    assert server.stats["dropped"] == 1 and server.stats["5xx"] == 1
+    assert stats["endpoints"]["PATCH /users/{id}"]["errors"]["unconfirmed"] == 2
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import config
+from NightCityBot.utils import helpers, json_codec
+
+
+def test_exceeds_stops_at_the_limit():
+    assert not json_codec.exceeds({"a": [1, 2, "xyz"]}, 100)
+    assert json_codec.exceeds({"a": ["x" * 60, "y" * 60]}, 100)
+    # A huge container is judged by its length without walking it
+    assert json_codec.exceeds(list(range(10**6)), 100)
+
+
+def test_large_documents_are_offloaded(tmp_path):
+    small = {"1": "ok"}
+    large = {str(i): "x" * 100 for i in range(50)}
+    threads = []
+    real_dumps = json.dumps
+
+    def spy(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return real_dumps(*args, **kwargs)
+
+    async def scenario():
+        await helpers.save_json_file(tmp_path / "small.json", small)
+        await helpers.save_json_file(tmp_path / "large.json", large)
+        return (
+            await helpers.load_json_file(tmp_path / "small.json"),
+            await helpers.load_json_file(tmp_path / "large.json"),
+        )
+
+    json_codec.metrics.reset()
+    with (
+        patch.object(config, "JSON_OFFLOAD_BYTES", 1024),
+        patch.object(json_codec.json, "dumps", new=spy),
+    ):
+        loaded_small, loaded_large = asyncio.run(scenario())
+
+    assert loaded_small == small and loaded_large == large
+    assert threads[0] == "MainThread"
+    assert threads[1].startswith("json")
+    stats = json_codec.metrics.snapshot()
+    assert stats["encode"]["calls"] == 2 and stats["encode"]["offloaded"] == 1
+    assert stats["decode"]["calls"] == 2 and stats["decode"]["offloaded"] == 1
+    assert stats["encode"]["chars"] == (tmp_path / "small.json").stat().st_size + (
+        tmp_path / "large.json"
+    ).stat().st_size
+    assert any(line.startswith("JSON encode") for line in json_codec.metrics.summary_lines())
+
+
+def test_offloaded_document_is_snapshotted(tmp_path):
+    doc = {str(i): {"entries": ["x" * 100]} for i in range(50)}
+    expected = json.loads(json.dumps(doc))
+
+    async def scenario():
+        saves = [
+            asyncio.create_task(helpers.save_json_file(tmp_path / "doc.json", doc))
+            for _ in range(3)
+        ]
+        # Let the saves hand the document to the workers, then keep changing it
+        await asyncio.sleep(0)
+        doc["0"]["entries"].append("late")
+        doc["new"] = {}
+        return await asyncio.gather(*saves)
+
+    with patch.object(config, "JSON_OFFLOAD_BYTES", 1024):
+        results = asyncio.run(scenario())
+
+    assert results == [True, True, True]
+    assert json.loads((tmp_path / "doc.json").read_text()) == expected
+    # Concurrent saves use their own temporary files and leave none behind
+    assert [p.name for p in tmp_path.iterdir()] == ["doc.json"]
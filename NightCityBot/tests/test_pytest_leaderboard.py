@@ -0,0 +1,102 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from NightCityBot.cogs.economy import Economy
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+
+class PagedSession:
+    closed = False
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def request(self, method, url, **kwargs):
+        page = kwargs["params"]["page"]
+        self.requested.append(page)
+        return PageResponse(
+            {"users": self.pages[page - 1], "page": page, "total_pages": len(self.pages)}
+        )
+
+
+class PageResponse:
+    status = 200
+    headers = {}
+
+    def __init__(self, body):
+        self.body = body
+
+    async def json(self, content_type=None):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+PAGES = [
+    [{"user_id": "1", "cash": 10, "bank": 5}, {"user_id": "2", "cash": 0, "bank": 7}],
+    [{"user_id": "3", "cash": 1, "bank": 1}],
+    [{"user_id": "4", "cash": 2, "bank": 3}, {"rank": 5}],
+]
+
+
+def test_fetch_all_balances_walks_every_page():
+    session = PagedSession(PAGES)
+    api = UnbelievaBoatAPI("token", session=session, cache_ttl=60)
+    balances = asyncio.run(api.fetch_all_balances())
+    assert balances == {
+        1: {"cash": 10, "bank": 5},
+        2: {"cash": 0, "bank": 7},
+        3: {"cash": 1, "bank": 1},
+        4: {"cash": 2, "bank": 3},
+    }
+    assert session.requested == [1, 2, 3]
+    # The snapshot seeds the balance cache for later single-member reads
+    assert api.balance_cache.get(3) == {"cash": 1, "bank": 1}
+
+
+def test_fetch_all_balances_concurrent_pages():
+    session = PagedSession(PAGES)
+    api = UnbelievaBoatAPI("token", session=session)
+    balances = asyncio.run(api.fetch_all_balances(concurrency=3))
+    assert sorted(balances) == [1, 2, 3, 4]
+    assert sorted(session.requested) == [1, 2, 3]
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def test_list_deficits_uses_snapshot():
+    bot = DummyBot()
+    economy = Economy(bot)
+    member = MagicMock()
+    member.id = 1
+    member.display_name = "Tester"
+    role = MagicMock()
+    role.name = "Housing Tier 1"
+    role.id = 0
+    member.roles = [role]
+    ctx = MagicMock()
+    ctx.guild.members = [member]
+    ctx.send = AsyncMock()
+    with (
+        patch.object(
+            economy.unbelievaboat,
+            "fetch_all_balances",
+            new=AsyncMock(return_value={1: {"cash": 0, "bank": 0}}),
+        ),
+        patch.object(economy.unbelievaboat, "get_balance", new=AsyncMock()) as get_bal,
+    ):
+        asyncio.run(economy.list_deficits.callback(economy, ctx))
+    get_bal.assert_not_called()
+    assert any("Housing Tier 1" in c.args[0] for c in ctx.send.await_args_list)
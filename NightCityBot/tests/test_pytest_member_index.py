@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import config
+from NightCityBot.cogs.cyberware import CyberwareManager
+from NightCityBot.utils.member_index import MemberIndex
+
+
+def make_role(role_id, name):
+    role = MagicMock()
+    role.id = role_id
+    role.name = name
+    return role
+
+
+APPROVED = make_role(config.APPROVED_ROLE_ID, "Approved")
+VERIFIED = make_role(config.VERIFIED_ROLE_ID, "Verified")
+HOUSING = make_role(101, "Housing Tier 1")
+MEDIUM = make_role(config.CYBER_MEDIUM_ROLE_ID, "Cyberware Medium")
+CHECKUP = make_role(config.CYBER_CHECKUP_ROLE_ID, "Checkup")
+LOA = make_role(config.LOA_ROLE_ID, "LOA")
+
+
+def make_member(uid, *roles):
+    member = MagicMock()
+    member.id = uid
+    member.display_name = f"Member {uid}"
+    member.roles = list(roles)
+    member.add_roles = AsyncMock()
+    return member
+
+
+def test_rent_members_keep_guild_order():
+    members = [
+        make_member(1, APPROVED, HOUSING),
+        make_member(2, VERIFIED),
+        make_member(3, APPROVED, VERIFIED),
+        make_member(4, HOUSING),
+        make_member(5, APPROVED),
+        make_member(6, VERIFIED, APPROVED),
+    ]
+    assert [m.id for m in MemberIndex(members).rent_members()] == [1, 3, 6]
+
+
+def test_role_names_are_checked_once_per_role():
+    name = PropertyMock(return_value="Business Tier 2")
+    business = MagicMock()
+    type(business).name = name
+    members = [make_member(uid, business, APPROVED) for uid in range(50)]
+
+    index = MemberIndex(members)
+    assert len(index.rent_members()) == 50
+    assert name.call_count == 1
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def test_give_checkup_role_only_visits_cyberware_members():
+    bot = DummyBot()
+    with patch("asyncio.create_task", lambda *a, **k: None):
+        manager = CyberwareManager(bot)
+    members = [
+        make_member(1, APPROVED, MEDIUM),
+        make_member(2, APPROVED),
+        make_member(3, MEDIUM, CHECKUP),
+        make_member(4, MEDIUM, LOA),
+    ]
+    roles = {r.id: r for r in (MEDIUM, CHECKUP, LOA)}
+    ctx = MagicMock()
+    ctx.guild.members = members
+    ctx.guild.get_role.side_effect = roles.get
+    ctx.send = AsyncMock()
+
+    asyncio.run(manager.give_checkup_role.callback(manager, ctx))
+
+    members[0].add_roles.assert_awaited_once_with(CHECKUP, reason="Checkup role assign")
+    for member in members[1:]:
+        member.add_roles.assert_not_awaited()
+    ctx.send.assert_awaited_once_with("✅ Gave the checkup role to 1 member(s).")
@@ -54,6 +54,10 @@ def run_test(func):
     return asyncio.run(func(suite, ctx))
 
 
-def test_negative_cash():
-    logs = run_test(run_negative)
+def test_negative_cash(tmp_path):
+    with (
+        patch.object(config, "RENT_JOURNAL_DIR", tmp_path / "journals"),
+        patch.object(config, "RENT_AUDIT_DIR", tmp_path / "audits"),
+    ):
+        logs = run_test(run_negative)
     assert all("❌" not in l for l in logs), f"Logs: {logs}"
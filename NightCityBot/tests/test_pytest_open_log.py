@@ -0,0 +1,32 @@
+from datetime import date, datetime
+
+from NightCityBot.services.open_log import OpenLogIndex
+
+
+def test_counts_and_last_open_per_month():
+    index = OpenLogIndex.from_log(
+        {
+            "1": ["2025-06-01T12:00:00", "2025-06-15T09:00:00", "2025-05-25T10:00:00"],
+            "2": ["2025-06-08T20:00:00", "not a date"],
+        }
+    )
+    assert index.count(1, 2025, 6) == 2
+    assert index.count("1", 2025, 5) == 1
+    assert index.last_open(1, 2025, 6) == date(2025, 6, 15)
+    assert index.count(2, 2025, 6) == 1
+    # Bad entries still count towards the length of the stored list
+    assert index.total(2) == 2
+    assert index.count(3, 2025, 6) == 0
+    assert index.last_open(3, 2025, 6) is None
+
+    index.add(3, datetime(2025, 6, 22, 18))
+    assert index.count(3, 2025, 6) == 1
+    assert index.last_open(3, 2025, 6) == date(2025, 6, 22)
+
+
+def test_resync_replaces_a_members_entries():
+    index = OpenLogIndex.from_log({"1": ["2025-06-01T12:00:00", "2025-06-08T12:00:00"]})
+    index.resync(1, ["2025-07-06T12:00:00"])
+    assert index.count(1, 2025, 6) == 0
+    assert index.count(1, 2025, 7) == 1
+    assert index.total(1) == 1
@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from discord.ext import commands
+from NightCityBot.cogs.economy import Economy
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI, parse_balance
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+    def add_cog(self, cog):
+        self.cogs[cog.__class__.__name__] = cog
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def test_parse_balance():
+    assert parse_balance({"cash": 1, "bank": 2, "total": 3}) == {"cash": 1, "bank": 2}
+    assert parse_balance({}) is None
+    assert parse_balance(True) is None
+
+
+def test_update_balance_returns_body():
+    api = UnbelievaBoatAPI("token")
+    body = {"user_id": "1", "cash": 90, "bank": 10, "total": 100}
+    with patch.object(api, "_request", new=AsyncMock(return_value=body)):
+        assert asyncio.run(api.update_balance(1, {"cash": -10})) is True
+        assert asyncio.run(api.update_balance_returning(1, {"cash": -10})) == body
+
+
+def test_flat_fee_uses_patch_balance():
+    bot = DummyBot()
+    econ = Economy(bot)
+    member = MagicMock(id=1)
+    log = []
+    with patch.object(
+        econ.unbelievaboat, "update_balance_returning", new=AsyncMock(return_value={"cash": 0, "bank": 450})
+    ):
+        ok, cash, bank = asyncio.run(econ.deduct_flat_fee(member, 100, 850, log, 500))
+    assert ok and (cash, bank) == (0, 450)
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from NightCityBot.services.rate_limiter import RateLimiter, parse_retry_after
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+    async def json(self, content_type=None):
+        return self.body
+    async def text(self):
+        return str(self.body)
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    closed = False
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+def test_bucket_limits_burst():
+    limiter = RateLimiter({"get": (20.0, 2)})
+
+    async def runner():
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire("get")
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(runner())
+    # Two tokens are available immediately, the other two refill at 20/s
+    assert elapsed >= 0.09
+
+
+def test_429_pauses_all_buckets():
+    api = UnbelievaBoatAPI("token", session=FakeSession([
+        FakeResponse(429, {"retry_after": 50}),
+        FakeResponse(200, {"cash": 5, "bank": 1}),
+    ]))
+
+    async def runner():
+        bal = await api.get_balance(1)
+        assert bal == {"cash": 5, "bank": 1}
+        assert api.limiter.paused_until > 0
+        assert api.limiter.buckets["get"].rate < api.limiter.buckets["get"].base_rate
+        start = time.monotonic()
+        api.limiter.backoff("get", 0.1)
+        await api.limiter.acquire("patch")
+        return time.monotonic() - start
+
+    assert asyncio.run(runner()) >= 0.09
+
+
+def test_headers_update_bucket():
+    limiter = RateLimiter()
+    limiter.update_from_headers(
+        "patch",
+        {"X-RateLimit-Limit": "3", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"},
+    )
+    bucket = limiter.buckets["patch"]
+    assert bucket.capacity == 3
+    assert bucket.tokens == 0
+    assert bucket.blocked_until > time.monotonic()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"retry_after": 2500}, {}) == 2.5
+    assert parse_retry_after({"retry_after": 300}, {}) == 0.3
+    assert parse_retry_after(None, {"Retry-After": "4"}) == 4.0
@@ -0,0 +1,39 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import config
+from NightCityBot.services import rent_audit
+from NightCityBot.services.rent_audit import RentAuditWriter
+
+
+def test_entries_reach_the_file_before_close(tmp_path):
+    path = tmp_path / "audits" / "rent_audit.log"
+
+    async def run():
+        async with RentAuditWriter(path) as audit:
+            await audit.write("first member\nsummary")
+            await audit.write("second member")
+            # Visible on disk while the run is still going
+            return path.read_text()
+
+    during = asyncio.run(run())
+    assert during == "first member\nsummary\nsecond member\n"
+    assert path.read_text() == during
+
+
+def test_no_file_without_entries(tmp_path):
+    path = tmp_path / "rent_audit.log"
+
+    async def run():
+        async with RentAuditWriter(path):
+            pass
+
+    asyncio.run(run())
+    assert not path.exists()
+
+
+def test_audit_path_is_monthly(tmp_path):
+    with patch.object(config, "RENT_AUDIT_DIR", tmp_path):
+        path = rent_audit.audit_path(datetime(2025, 3, 9))
+    assert path == tmp_path / "rent_audit_March_2025.log"
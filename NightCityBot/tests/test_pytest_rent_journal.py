@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import config
+from NightCityBot.cogs.economy import Economy
+from NightCityBot.services import rent_journal
+from NightCityBot.services.unbelievaboat import BalanceUpdateUnconfirmed
+from NightCityBot.utils.constants import BASELINE_LIVING_COST, ROLE_COSTS_HOUSING
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    def get_channel(self, cid):
+        return None
+
+
+def make_member(uid, *names):
+    member = MagicMock()
+    member.id = uid
+    member.display_name = f"Member {uid}"
+    member.roles = []
+    for role_id, name in [(config.APPROVED_ROLE_ID, "Approved"), (config.VERIFIED_ROLE_ID, "Verified")] + [
+        (0, n) for n in names
+    ]:
+        role = MagicMock()
+        role.id = role_id
+        role.name = name
+        member.roles.append(role)
+    member.guild.get_role.return_value = None
+    member.send = AsyncMock()
+    return member
+
+
+def setup(tmp_path, *, land_then_crash):
+    bot = DummyBot()
+    economy = Economy(bot)
+    members = [make_member(1), make_member(2, "Housing Tier 1")]
+    ctx = MagicMock()
+    ctx.guild.members = members
+    ctx.guild.get_member.side_effect = {m.id: m for m in members}.get
+    ctx.guild.get_channel.return_value = None
+    ctx.send = AsyncMock()
+    ledger = {m.id: {"cash": 10_000, "bank": 0} for m in members}
+    patches = []
+    crashed = False
+
+    async def get_balance(user_id, **kwargs):
+        return dict(ledger[user_id])
+
+    async def update_balance_returning(user_id, payload, reason="", **kwargs):
+        nonlocal crashed
+        patches.append((user_id, reason))
+        if reason == "Housing Rent" and not crashed:
+            crashed = True
+            if land_then_crash:
+                ledger[user_id]["cash"] += payload.get("cash", 0)
+            raise BalanceUpdateUnconfirmed("connection lost")
+        for field, value in payload.items():
+            ledger[user_id][field] += value
+        return dict(ledger[user_id])
+
+    stack = [
+        patch.object(config, "RENT_JOURNAL_DIR", tmp_path / "journals"),
+        patch.object(config, "OPEN_LOG_FILE", tmp_path / "open.json"),
+        patch.object(config, "LAST_RENT_FILE", tmp_path / "last_rent.json"),
+        patch.object(config, "LAST_PAYMENT_FILE", tmp_path / "last_payment.json"),
+        patch.object(config, "RENT_AUDIT_DIR", tmp_path / "audits"),
+        patch.object(config, "REPORT_USER_ID", 0),
+        patch.object(economy, "backup_balances", new=AsyncMock()),
+        patch.object(economy.unbelievaboat, "get_balance", new=get_balance),
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=update_balance_returning),
+    ]
+    return economy, ctx, ledger, patches, stack
+
+
+def run_and_resume(tmp_path, *, land_then_crash):
+    economy, ctx, ledger, patches, stack = setup(tmp_path, land_then_crash=land_then_crash)
+    for p in stack:
+        p.start()
+    try:
+        asyncio.run(economy.run_rent_collection(ctx, force=True))
+        journals = list((tmp_path / "journals").glob("rent_*.jsonl"))
+        assert len(journals) == 1
+        run_id = journals[0].stem[len("rent_"):]
+        state = rent_journal.load_journal(run_id)
+        assert not state.finished
+        assert state.remaining == [2]
+        assert state.member(2).steps == {"baseline"}
+
+        ctx.send.reset_mock()
+        asyncio.run(economy.resume_rent.callback(economy, ctx, run_id))
+        assert rent_journal.load_journal(run_id).finished
+    finally:
+        for p in reversed(stack):
+            p.stop()
+    return ctx, ledger, patches
+
+
+def test_resume_does_not_repeat_a_charge_that_landed(tmp_path):
+    ctx, ledger, patches = run_and_resume(tmp_path, land_then_crash=True)
+
+    assert patches.count((2, "Housing Rent")) == 1
+    assert patches.count((2, "Flat Monthly Fee")) == 1
+    assert patches.count((1, "Flat Monthly Fee")) == 1
+    assert ledger[2]["cash"] == 10_000 - BASELINE_LIVING_COST - ROLE_COSTS_HOUSING["Housing Tier 1"]
+    lines = "\n".join(c.args[0] for c in ctx.send.await_args_list).split("\n")
+    assert "ℹ️ 1 member(s) to process." in lines
+
+
+def test_resume_retries_a_charge_that_never_landed(tmp_path):
+    ctx, ledger, patches = run_and_resume(tmp_path, land_then_crash=False)
+
+    assert patches.count((2, "Housing Rent")) == 2
+    assert patches.count((2, "Flat Monthly Fee")) == 1
+    assert ledger[2]["cash"] == 10_000 - BASELINE_LIVING_COST - ROLE_COSTS_HOUSING["Housing Tier 1"]
@@ -0,0 +1,213 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import config
+from NightCityBot.cogs.economy import Economy
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    def get_channel(self, cid):
+        return None
+
+
+def make_member(uid):
+    member = MagicMock()
+    member.id = uid
+    member.display_name = f"Member {uid}"
+    approved = MagicMock()
+    approved.id = config.APPROVED_ROLE_ID
+    approved.name = "Approved"
+    verified = MagicMock()
+    verified.id = config.VERIFIED_ROLE_ID
+    verified.name = "Verified"
+    member.roles = [approved, verified]
+    member.guild.get_role.return_value = None
+    return member
+
+
+def test_members_run_concurrently_but_report_in_order():
+    bot = DummyBot()
+    economy = Economy(bot)
+    members = [make_member(uid) for uid in range(1, 6)]
+    ctx = MagicMock()
+    ctx.guild.members = members
+    ctx.guild.get_channel.return_value = None
+    ctx.send = AsyncMock()
+    running = 0
+    peak = 0
+
+    async def get_balance(user_id, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later members answer first so completion order is reversed
+        await asyncio.sleep(0.01 * (6 - user_id))
+        running -= 1
+        if user_id == 3:
+            raise RuntimeError("boom")
+        return {"cash": 1000, "bank": 0}
+
+    with (
+        patch.object(config, "RENT_CONCURRENCY", 3),
+        patch.object(economy.unbelievaboat, "get_balance", new=get_balance),
+        patch.object(
+            economy.unbelievaboat, "check_write_access", new=AsyncMock(return_value=True)
+        ),
+    ):
+        asyncio.run(economy.run_rent_collection(ctx, dry_run=True, force=True))
+
+    # Output is packed into a few messages; compare it line by line
+    messages = "\n".join(c.args[0] for c in ctx.send.await_args_list).split("\n")
+    assert len(ctx.send.await_args_list) < len(messages)
+    working = [m for m in messages if "Working on" in m]
+    assert working == [
+        f"🔍 **Working on:** <@{uid}> ({uid}/5)" for uid in range(1, 6)
+    ]
+    assert any("Error processing <@3>" in m for m in messages)
+    completed = [m for m in messages if m.startswith("✅ Completed for")]
+    assert completed == [f"✅ Completed for <@{uid}>" for uid in (1, 2, 4, 5)]
+    assert 1 < peak <= 3
+
+
+def test_only_a_window_of_members_is_in_flight():
+    bot = DummyBot()
+    admin = MagicMock()
+    reported = []
+    admin.log_audit = AsyncMock(side_effect=lambda author, text: reported.append(text))
+    bot.cogs["Admin"] = admin
+    economy = Economy(bot)
+    members = [make_member(uid) for uid in range(1, 11)]
+    ctx = MagicMock()
+    ctx.guild.members = members
+    ctx.guild.get_channel.return_value = None
+    ctx.send = AsyncMock()
+    alive = []
+
+    async def collect(ctx, member, idx, total, **kwargs):
+        # Members started but not yet reported each hold a task
+        alive.append(sum(1 for t in asyncio.all_tasks() if "process" in t.get_coro().__qualname__))
+        await asyncio.sleep(0)
+        return [("audit", f"member {idx}")]
+
+    with (
+        patch.object(config, "RENT_CONCURRENCY", 2),
+        patch("NightCityBot.cogs.economy.RENT_WINDOW_FACTOR", 2),
+        patch.object(economy, "_collect_member_rent", new=collect),
+        patch.object(
+            economy.unbelievaboat, "check_write_access", new=AsyncMock(return_value=True)
+        ),
+    ):
+        asyncio.run(economy.run_rent_collection(ctx, dry_run=True, force=True))
+
+    assert [r for r in reported if r.startswith("member")] == [
+        f"member {idx}" for idx in range(1, 11)
+    ]
+    assert len(alive) == 10
+    assert max(alive) <= 4
+
+
+def test_deficit_report_reuses_final_balances(tmp_path):
+    bot = DummyBot()
+    report = MagicMock()
+    report.send = AsyncMock()
+    bot.get_user = MagicMock(return_value=report)
+    economy = Economy(bot)
+    members = [make_member(uid) for uid in range(1, 4)]
+    for member in members:
+        member.send = AsyncMock()
+    housing = MagicMock()
+    housing.id = 0
+    housing.name = "Housing Tier 1"
+    members[1].roles.append(housing)
+    ctx = MagicMock()
+    ctx.guild.members = members
+    ctx.guild.get_channel.return_value = None
+    ctx.send = AsyncMock()
+    ledger = {1: 5000, 2: 10, 3: 5000}
+    fetched = []
+
+    async def get_balance(user_id, **kwargs):
+        fetched.append(user_id)
+        return {"cash": ledger[user_id], "bank": 0}
+
+    async def update_balance_returning(user_id, payload, reason="", **kwargs):
+        ledger[user_id] += payload.get("cash", 0)
+        return {"cash": ledger[user_id], "bank": 0}
+
+    with (
+        patch.object(config, "REPORT_USER_ID", 99),
+        patch.object(config, "RENT_JOURNAL_DIR", tmp_path / "journals"),
+        patch.object(config, "RENT_AUDIT_DIR", tmp_path / "audits"),
+        patch.object(config, "OPEN_LOG_FILE", tmp_path / "open.json"),
+        patch.object(config, "LAST_RENT_FILE", tmp_path / "last_rent.json"),
+        patch.object(config, "LAST_PAYMENT_FILE", tmp_path / "last_payment.json"),
+        patch.object(config, "BALANCE_BACKUP_DIR", tmp_path / "backups"),
+        patch.object(economy.unbelievaboat, "get_balance", new=get_balance),
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=update_balance_returning),
+        patch.object(economy.unbelievaboat, "fetch_all_balances", new=AsyncMock()) as snapshot,
+    ):
+        asyncio.run(economy.run_rent_collection(ctx, force=True))
+
+    # The "before" backup and the member's own fetch; nothing after the run
+    assert sorted(fetched) == [1, 1, 2, 2, 3, 3]
+    snapshot.assert_not_awaited()
+    report.send.assert_awaited_with(
+        "✅ Rent collection completed.\nMember 2 can't pay: Baseline living cost, Housing Tier 1"
+    )
+    audit = "".join(p.read_text() for p in (tmp_path / "audits").glob("rent_audit_*.log"))
+    assert audit.count("🔍 **Working on:**") == 3
+    assert audit.endswith("✅ Rent collection completed.\n")
+
+
+def test_failed_patch_is_reported_unpaid(tmp_path):
+    bot = DummyBot()
+    report = MagicMock()
+    report.send = AsyncMock()
+    bot.get_user = MagicMock(return_value=report)
+    economy = Economy(bot)
+    member = make_member(1)
+    member.send = AsyncMock()
+    housing = MagicMock()
+    housing.id = 0
+    housing.name = "Housing Tier 1"
+    member.roles.append(housing)
+    ctx = MagicMock()
+    ctx.guild.members = [member]
+    ctx.guild.get_channel.return_value = None
+    ctx.send = AsyncMock()
+    ledger = {"cash": 5000}
+
+    async def update_balance_returning(user_id, payload, reason="", **kwargs):
+        # The housing PATCH fails even though the member can afford it
+        if reason == "Housing Rent":
+            return None
+        ledger["cash"] += payload.get("cash", 0)
+        return {"cash": ledger["cash"], "bank": 0}
+
+    with (
+        patch.object(config, "REPORT_USER_ID", 99),
+        patch.object(config, "RENT_JOURNAL_DIR", tmp_path / "journals"),
+        patch.object(config, "RENT_AUDIT_DIR", tmp_path / "audits"),
+        patch.object(config, "OPEN_LOG_FILE", tmp_path / "open.json"),
+        patch.object(config, "LAST_RENT_FILE", tmp_path / "last_rent.json"),
+        patch.object(config, "LAST_PAYMENT_FILE", tmp_path / "last_payment.json"),
+        patch.object(config, "BALANCE_BACKUP_DIR", tmp_path / "backups"),
+        patch.object(
+            economy.unbelievaboat,
+            "get_balance",
+            new=AsyncMock(side_effect=lambda *a, **k: {"cash": ledger["cash"], "bank": 0}),
+        ),
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=update_balance_returning),
+    ):
+        asyncio.run(economy.run_rent_collection(ctx, force=True))
+
+    report.send.assert_awaited_with(
+        "✅ Rent collection completed.\nMember 1 can't pay: Housing Tier 1"
+    )
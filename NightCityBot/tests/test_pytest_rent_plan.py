@@ -0,0 +1,276 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+
+import config
+from NightCityBot.cogs.economy import Economy
+from NightCityBot.services import rent_plan
+from NightCityBot.services.rent_plan import build_rent_plan
+from NightCityBot.services.unbelievaboat import BalanceUpdateUnconfirmed
+from NightCityBot.utils.constants import (
+    BASELINE_LIVING_COST,
+    ROLE_COSTS_BUSINESS,
+    ROLE_COSTS_HOUSING,
+    TRAUMA_ROLE_COSTS,
+)
+
+HOUSING_ROLE = next(iter(ROLE_COSTS_HOUSING))
+BUSINESS_ROLE = "Business Tier 1"
+TRAUMA_ROLE = next(iter(TRAUMA_ROLE_COSTS))
+ROLES = ["Approved", HOUSING_ROLE, BUSINESS_ROLE, TRAUMA_ROLE]
+
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+    def get_channel(self, cid):
+        return None
+
+
+def make_member():
+    member = MagicMock()
+    member.id = 1
+    member.roles = []
+    for name in ROLES:
+        role = MagicMock()
+        role.name = name
+        role.id = config.APPROVED_ROLE_ID if name == "Approved" else 0
+        member.roles.append(role)
+    member.guild.get_role.return_value = None
+    return member
+
+
+def test_plan_orders_items_and_projects_balance():
+    plan = build_rent_plan(ROLES, on_loa=False, balance={"cash": 100, "bank": 1_000_000})
+    assert [item.kind for item in plan.items] == [
+        rent_plan.BASELINE,
+        rent_plan.HOUSING,
+        rent_plan.BUSINESS,
+        rent_plan.TRAUMA,
+    ]
+    assert plan.total_due == (
+        BASELINE_LIVING_COST
+        + ROLE_COSTS_HOUSING[HOUSING_ROLE]
+        + ROLE_COSTS_BUSINESS[BUSINESS_ROLE]
+        + TRAUMA_ROLE_COSTS[TRAUMA_ROLE]
+    )
+    baseline = plan.get(rent_plan.BASELINE)
+    assert (baseline.cash, baseline.bank) == (100, BASELINE_LIVING_COST - 100)
+    assert baseline.payload() == {"cash": -100, "bank": -(BASELINE_LIVING_COST - 100)}
+    assert plan.cash == 0
+    assert plan.bank == 1_000_000 - (plan.total_due - 100)
+    assert plan.deficit == 0 and not plan.unpaid
+
+
+def test_plan_marks_unaffordable_items():
+    plan = build_rent_plan(ROLES, on_loa=False, balance={"cash": BASELINE_LIVING_COST, "bank": 0})
+    assert plan.get(rent_plan.BASELINE).payable is True
+    assert [item.kind for item in plan.unpaid] == [
+        rent_plan.HOUSING,
+        rent_plan.BUSINESS,
+        rent_plan.TRAUMA,
+    ]
+    assert plan.deficit == plan.total_due - BASELINE_LIVING_COST
+
+
+def test_plan_loa_and_disabled_systems():
+    plan = build_rent_plan(ROLES, on_loa=True, cyberware=(2, 500))
+    assert [item.kind for item in plan.items] == [rent_plan.BUSINESS]
+    assert plan.get(rent_plan.BUSINESS).payable is None
+
+    plan = build_rent_plan(ROLES, on_loa=False, housing=False, trauma=False)
+    assert [item.kind for item in plan.items] == [rent_plan.BASELINE, rent_plan.BUSINESS]
+    assert plan.disabled == [rent_plan.HOUSING, rent_plan.TRAUMA]
+
+
+def test_simulation_makes_no_writes():
+    bot = DummyBot()
+    economy = Economy(bot)
+    member = make_member()
+
+    plan = economy.plan_rent(member, {"cash": 1_000_000, "bank": 0})
+    log = []
+    with (
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=AsyncMock()) as update,
+        patch.object(
+            economy.trauma_service, "process_trauma_team_payment", new=AsyncMock()
+        ) as trauma,
+    ):
+        cash, bank = asyncio.run(
+            economy._execute_rent_plan(
+                member, plan, 1_000_000, 0, log, None, None, dry_run=True
+            )
+        )
+    update.assert_not_awaited()
+    trauma.assert_not_awaited()
+    # Without the forum channel the Trauma Team preview is skipped
+    assert "⚠️ TT forum channel not found." in log
+    assert cash == 1_000_000 - (plan.total_due - TRAUMA_ROLE_COSTS[TRAUMA_ROLE])
+    assert bank == 0
+
+
+def run_plan(economy, member, *, merge, result):
+    update = AsyncMock(return_value=result)
+    log = []
+    plan = economy.plan_rent(member, {"cash": 1_000_000, "bank": 0})
+    with (
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=update),
+        patch.object(economy, "backup_balances", new=AsyncMock()),
+    ):
+        balance = asyncio.run(
+            economy._execute_rent_plan(
+                member, plan, 1_000_000, 0, log, None, None, merge=merge
+            )
+        )
+    return update, log, balance
+
+
+def test_merged_charges_use_one_patch_and_same_log():
+    bot = DummyBot()
+    economy = Economy(bot)
+    bot.cogs["Economy"] = economy
+    member = make_member()
+
+    separate, separate_log, separate_balance = run_plan(
+        economy, member, merge=False, result={}
+    )
+    merged, merged_log, merged_balance = run_plan(economy, member, merge=True, result={})
+
+    assert separate.await_count == 3
+    merged.assert_awaited_once()
+    due = (
+        BASELINE_LIVING_COST
+        + ROLE_COSTS_HOUSING[HOUSING_ROLE]
+        + ROLE_COSTS_BUSINESS[BUSINESS_ROLE]
+    )
+    assert merged.await_args.args == (1, {"cash": -due})
+    assert (
+        merged.await_args.kwargs["reason"]
+        == "Flat Monthly Fee + Housing Rent + Business Rent"
+    )
+    assert merged_log == separate_log
+    assert merged_balance == separate_balance == (1_000_000 - due, 0)
+
+
+def test_failed_merged_patch_fails_every_step():
+    bot = DummyBot()
+    economy = Economy(bot)
+    bot.cogs["Economy"] = economy
+    member = make_member()
+
+    update, log, balance = run_plan(economy, member, merge=True, result=None)
+
+    # The merged PATCH and then each charge on its own
+    assert update.await_count == 4
+    assert "❌ Failed to deduct flat monthly fee." in log
+    assert "❌ Failed to deduct housing rent despite having sufficient funds." in log
+    assert "❌ Failed to deduct business rent despite having sufficient funds." in log
+    assert balance == (1_000_000, 0)
+
+
+def test_failed_merged_patch_falls_back_to_separate_charges():
+    bot = DummyBot()
+    economy = Economy(bot)
+    bot.cogs["Economy"] = economy
+    member = make_member()
+    thread = MagicMock()
+    thread.name = "Member - 1"
+    thread.send = AsyncMock()
+    forum = MagicMock(spec=discord.ForumChannel)
+    forum.threads = [thread]
+    bot.get_channel = lambda cid: forum if cid == config.TRAUMA_FORUM_CHANNEL_ID else None
+
+    async def update_balance_returning(user_id, payload, reason="", **kwargs):
+        return None if " + " in reason else {}
+
+    update = AsyncMock(side_effect=update_balance_returning)
+    log = []
+    plan = economy.plan_rent(member, {"cash": 1_000_000, "bank": 0})
+    with (
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=update),
+        patch.object(economy, "backup_balances", new=AsyncMock()),
+    ):
+        balance = asyncio.run(
+            economy._execute_rent_plan(
+                member, plan, 1_000_000, 0, log, None, None, merge=True
+            )
+        )
+
+    reasons = [c.kwargs["reason"] for c in update.await_args_list]
+    assert reasons == [
+        "Flat Monthly Fee + Housing Rent + Business Rent + Trauma Team Subscription",
+        "Flat Monthly Fee",
+        "Housing Rent",
+        "Business Rent",
+        "Trauma Team Subscription",
+    ]
+    assert balance == (1_000_000 - plan.total_due, 0)
+    assert "✅ Trauma Team payment completed." in log
+    notices = [c.args[0] for c in thread.send.await_args_list]
+    assert len(notices) == 1 and "Payment Successful" in notices[0]
+
+
+def run_unconfirmed_merge(economy, member, *, landed):
+    ledger = {"cash": 1_000_000, "bank": 0}
+    reasons = []
+
+    async def update_balance_returning(user_id, payload, reason="", **kwargs):
+        reasons.append(reason)
+        ledger["cash"] += payload.get("cash", 0)
+        if " + " in reason:
+            if not landed:
+                ledger["cash"] -= payload.get("cash", 0)
+            raise BalanceUpdateUnconfirmed("timed out")
+        return dict(ledger)
+
+    log = []
+    plan = economy.plan_rent(member, dict(ledger))
+    with (
+        patch.object(economy.unbelievaboat, "update_balance_returning", new=update_balance_returning),
+        patch.object(
+            economy.unbelievaboat, "get_balance", new=AsyncMock(side_effect=lambda *a, **k: dict(ledger))
+        ) as get_balance,
+        patch.object(economy, "backup_balances", new=AsyncMock()),
+    ):
+        balance = asyncio.run(
+            economy._execute_rent_plan(
+                member, plan, 1_000_000, 0, log, None, None, merge=True
+            )
+        )
+    get_balance.assert_awaited_once_with(1, fresh=True)
+    return reasons, ledger, balance
+
+
+def test_unconfirmed_merged_patch_that_landed_is_not_repeated():
+    bot = DummyBot()
+    economy = Economy(bot)
+    bot.cogs["Economy"] = economy
+    member = make_member()
+
+    reasons, ledger, balance = run_unconfirmed_merge(economy, member, landed=True)
+
+    assert reasons == ["Flat Monthly Fee + Housing Rent + Business Rent"]
+    assert balance == (ledger["cash"], 0)
+
+
+def test_unconfirmed_merged_patch_that_did_not_land_is_split():
+    bot = DummyBot()
+    economy = Economy(bot)
+    bot.cogs["Economy"] = economy
+    member = make_member()
+
+    reasons, ledger, balance = run_unconfirmed_merge(economy, member, landed=False)
+
+    assert reasons[1:] == ["Flat Monthly Fee", "Housing Rent", "Business Rent"]
+    assert balance == (ledger["cash"], 0)
+    assert ledger["cash"] == 1_000_000 - (
+        BASELINE_LIVING_COST
+        + ROLE_COSTS_HOUSING[HOUSING_ROLE]
+        + ROLE_COSTS_BUSINESS[BUSINESS_ROLE]
+    )
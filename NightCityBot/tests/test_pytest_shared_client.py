@@ -0,0 +1,49 @@
+import asyncio
+from unittest.mock import patch
+from discord.ext import commands
+from NightCityBot.cogs.economy import Economy
+from NightCityBot.cogs.cyberware import CyberwareManager
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+class DummyBot:
+    def __init__(self):
+        self.cogs = {}
+        self.loop = asyncio.new_event_loop()
+    def add_cog(self, cog):
+        self.cogs[cog.__class__.__name__] = cog
+    def get_cog(self, name):
+        return self.cogs.get(name)
+
+
+def test_cogs_share_client():
+    bot = DummyBot()
+    try:
+        with patch("asyncio.create_task", lambda *a, **k: None):
+            econ = Economy(bot)
+            cyber = CyberwareManager(bot)
+        cyber.weekly_check.cancel()
+        assert isinstance(bot.unbelievaboat, UnbelievaBoatAPI)
+        assert econ.unbelievaboat is bot.unbelievaboat
+        assert cyber.unbelievaboat is bot.unbelievaboat
+        assert econ.trauma_service.unbelievaboat is bot.unbelievaboat
+    finally:
+        # Cancel the cog's startup task so the loop closes cleanly
+        pending = asyncio.all_tasks(bot.loop)
+        for task in pending:
+            task.cancel()
+        bot.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        bot.loop.close()
+
+
+def test_session_created_lazily():
+    api = UnbelievaBoatAPI("token")
+    assert api.session is None
+
+    async def runner():
+        session = api._get_session()
+        assert api._get_session() is session
+        assert session.connector.limit_per_host > 0
+        await api.close()
+        assert session.closed
+
+    asyncio.run(runner())
@@ -0,0 +1,49 @@
+import asyncio
+from unittest.mock import patch
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+
+def test_concurrent_get_balance_coalesced():
+    api = UnbelievaBoatAPI("token")
+    calls = []
+
+    async def fake_request(method, url, bucket, label, **kwargs):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return {"cash": 1, "bank": 2}
+
+    async def runner():
+        with patch.object(api, "_request", new=fake_request):
+            results = await asyncio.gather(*(api.get_balance(7) for _ in range(5)))
+            other = await api.get_balance(8)
+            again = await api.get_balance(7)
+        return results, other, again
+
+    results, other, again = asyncio.run(runner())
+    assert all(r == {"cash": 1, "bank": 2} for r in results)
+    # Five concurrent callers for user 7 share one request
+    assert len(calls) == 3
+    assert not api._inflight
+    # Callers receive independent copies
+    results[0]["cash"] = 99
+    assert results[1]["cash"] == 1
+
+
+def test_patch_detaches_inflight_get():
+    api = UnbelievaBoatAPI("token")
+    calls = []
+
+    async def fake_request(method, url, bucket, label, **kwargs):
+        calls.append(method)
+        await asyncio.sleep(0.01)
+        return {"cash": 1, "bank": 2}
+
+    async def runner():
+        with patch.object(api, "_request", new=fake_request):
+            first = asyncio.ensure_future(api.get_balance(7))
+            await asyncio.sleep(0)
+            await api.update_balance(7, {"cash": -1})
+            await asyncio.gather(first, api.get_balance(7))
+
+    asyncio.run(runner())
+    assert calls.count("GET") == 2 and calls.count("PATCH") == 1
@@ -0,0 +1,154 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import config
+from NightCityBot.services import storage_migration
+from NightCityBot.services.backup_store import BalanceBackupStore, SQLiteBackupStore
+from NightCityBot.services.event_log import SQLiteEventLog
+from NightCityBot.services.sqlite_backend import SQLiteBackend
+from NightCityBot.services.state_store import StateStore
+
+LABELS = [
+    "manual_1",
+    "collect_rent_before",
+    "collect_rent_after",
+    "manual_2",
+    "collect_rent_before",
+    "collect_rent_after",
+    "collect_rent_after",
+]
+
+
+def strip_timestamps(entries):
+    return [{k: v for k, v in e.items() if k != "timestamp"} for e in entries]
+
+
+def test_backups_match_the_json_store(tmp_path):
+    backend = SQLiteBackend(tmp_path / "state.db")
+
+    async def record(store):
+        for i, label in enumerate(LABELS):
+            await store.append(7, label, {"cash": 100 * i, "bank": 5})
+        return (
+            await store.entries(7),
+            await store.latest(7, "collect_rent_after"),
+            await store.last_used(7, "manual_2"),
+            await store.member_ids(),
+        )
+
+    async def scenario():
+        with patch.object(config, "BALANCE_BACKUP_DIR", tmp_path / "backups"):
+            expected = await record(BalanceBackupStore())
+        actual = await record(SQLiteBackupStore(backend))
+        await backend.close()
+        return expected, actual
+
+    expected, actual = asyncio.run(scenario())
+    assert strip_timestamps(actual[0]) == strip_timestamps(expected[0])
+    assert {k: v for k, v in actual[1].items() if k != "timestamp"} == {
+        k: v for k, v in expected[1].items() if k != "timestamp"
+    }
+    assert actual[2] is not None
+    assert actual[3] == expected[3] == [7]
+
+
+def test_documents_and_events_round_trip(tmp_path):
+    db = tmp_path / "state.db"
+    archive = tmp_path / "open_history.json"
+
+    async def scenario():
+        backend = SQLiteBackend(db)
+        store = StateStore(interval=0, backend=backend)
+        data = await store.load(tmp_path / "thread_map.json")
+        data.update({"1": 10, "2": 20})
+        await store.save(tmp_path / "thread_map.json", data)
+        del data["1"]
+        await store.save(tmp_path / "thread_map.json", data)
+
+        log = SQLiteEventLog(tmp_path / "business_open_log.json", backend)
+        await log.append(1, "a")
+        await log.append(1, "b")
+        await log.append(2, "c")
+        removed = await log.retain([1])
+        entries = await log.entries(1)
+        counts = (await log.count(1), await log.count(2))
+        old = await log.rotate(archive)
+        after = await log.snapshot()
+        await backend.close()
+
+        reopened = SQLiteBackend(db)
+        doc = await reopened.load_document("thread_map")
+        await reopened.close()
+        return removed, entries, counts, old, after, doc
+
+    removed, entries, counts, old, after, doc = asyncio.run(scenario())
+    assert removed == 1
+    assert entries == ["a", "b"]
+    assert counts == (2, 0)
+    assert old == {"1": ["a", "b"]}
+    assert after == {}
+    assert json.loads(archive.read_text()) == {"1": ["a", "b"]}
+    assert doc == {"2": 20}
+
+
+def test_import_json(tmp_path):
+    thread_map = tmp_path / "thread_map.json"
+    thread_map.write_text(json.dumps({"1": 111}))
+    open_log = tmp_path / "business_open_log.json"
+    open_log.write_text(json.dumps({"1": ["2025-06-01T10:00:00"]}))
+    backups = tmp_path / "backups"
+    backups.mkdir()
+    (backups / "balance_backup_5.json").write_text(
+        json.dumps([{"timestamp": "t", "label": "manual", "cash": 1, "bank": 2, "change": 3}])
+    )
+
+    async def scenario():
+        backend = SQLiteBackend(tmp_path / "state.db")
+        counts = await storage_migration.import_json(backend)
+        result = (
+            counts,
+            await backend.load_document("thread_map"),
+            await backend.events("business_open_log"),
+            await backend.backup_entries(5),
+        )
+        await backend.close()
+        return result
+
+    with (
+        patch.object(config, "THREAD_MAP_FILE", thread_map),
+        patch.object(config, "SYSTEM_STATUS_FILE", tmp_path / "system_status.json"),
+        patch.object(config, "LAST_PAYMENT_FILE", tmp_path / "last_payment.json"),
+        patch.object(config, "CYBERWARE_LOG_FILE", tmp_path / "cyberware_log.json"),
+        patch.object(config, "OPEN_LOG_FILE", open_log),
+        patch.object(config, "ATTEND_LOG_FILE", tmp_path / "attendance_log.json"),
+        patch.object(config, "BALANCE_BACKUP_DIR", backups),
+    ):
+        counts, doc, events, entries = asyncio.run(scenario())
+
+    assert counts["thread_map"] == 1
+    assert counts["business_open_log"] == 1
+    assert counts["balance_backups"] == 1
+    assert doc == {"1": 111}
+    assert events == {"1": ["2025-06-01T10:00:00"]}
+    assert entries == [{"timestamp": "t", "label": "manual", "cash": 1, "bank": 2, "change": 3}]
+
+
+def test_closed_backend_rejects_late_writes(tmp_path):
+    async def scenario():
+        backend = SQLiteBackend(tmp_path / "state.db")
+        store = StateStore(interval=0, backend=backend)
+        log = SQLiteEventLog(tmp_path / "attendance_log.json", backend)
+        await store.save(tmp_path / "thread_map.json", {"1": 10})
+        await backend.close()
+        await backend.close()
+        # A late flush is reported and the document stays dirty
+        await store.save(tmp_path / "thread_map.json", {"1": 11})
+        try:
+            await log.append(1, "a")
+        except RuntimeError as e:
+            return str(e), store._dirty
+
+    error, dirty = asyncio.run(scenario())
+    assert error == "SQLite backend for state.db is closed"
+    assert dirty == {tmp_path / "thread_map.json"}
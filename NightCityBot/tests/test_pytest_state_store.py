@@ -0,0 +1,75 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import config
+from NightCityBot.services.state_store import StateStore
+
+
+def test_saves_are_coalesced_into_one_write(tmp_path):
+    path = tmp_path / "status.json"
+    path.write_text(json.dumps({"dm": False}))
+    store = StateStore(interval=0.05)
+
+    async def scenario():
+        data = await store.load(path)
+        assert await store.load(path) is data
+        for system in ("dm", "loa", "attend"):
+            data[system] = True
+            await store.save(path, data)
+        # Nothing is written until the interval has passed
+        assert json.loads(path.read_text()) == {"dm": False}
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert store.writes == 1
+    assert json.loads(path.read_text()) == {"dm": True, "loa": True, "attend": True}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_close_writes_pending_files(tmp_path):
+    store = StateStore(interval=60)
+
+    async def scenario():
+        await store.save(tmp_path / "a.json", {"1": 1})
+        await store.save(tmp_path / "b.json", {"2": 2})
+        await store.close()
+
+    asyncio.run(scenario())
+    assert json.loads((tmp_path / "a.json").read_text()) == {"1": 1}
+    assert json.loads((tmp_path / "b.json").read_text()) == {"2": 2}
+
+
+def test_failed_write_is_retried(tmp_path):
+    path = tmp_path / "map.json"
+    store = StateStore(interval=0)
+    failing = AsyncMock(return_value=False)
+
+    async def scenario():
+        with patch("NightCityBot.utils.helpers.save_json_file", new=failing):
+            await store.save(path, {"1": 1})
+        assert not path.exists()
+        await store.flush()
+
+    asyncio.run(scenario())
+    failing.assert_awaited_once()
+    assert json.loads(path.read_text()) == {"1": 1}
+
+
+def test_nested_changes_during_a_write_are_not_saved(tmp_path):
+    path = tmp_path / "cyberware_log.json"
+    store = StateStore(interval=60)
+    data = {str(i): {"weeks": ["x" * 100]} for i in range(50)}
+    expected = json.loads(json.dumps(data))
+
+    async def scenario():
+        await store.save(path, data)
+        flush = asyncio.create_task(store.flush())
+        await asyncio.sleep(0)
+        # The cog keeps updating a nested entry while the file is written
+        data["0"]["weeks"].append("late")
+        await flush
+
+    with patch.object(config, "JSON_OFFLOAD_BYTES", 1024):
+        asyncio.run(scenario())
+    assert json.loads(path.read_text()) == expected
@@ -0,0 +1,37 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import config
+from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+
+def test_write_check_probes_test_user_once():
+    api = UnbelievaBoatAPI("token")
+
+    async def runner():
+        with patch.object(
+            api, "verify_balance_ops", new=AsyncMock(return_value=True)
+        ) as verify:
+            results = await asyncio.gather(
+                *(api.check_write_access() for _ in range(5))
+            )
+            await api.check_write_access()
+            return results, verify
+
+    results, verify = asyncio.run(runner())
+    assert all(results)
+    verify.assert_awaited_once_with(config.TEST_USER_ID)
+
+
+def test_write_check_refresh():
+    api = UnbelievaBoatAPI("token")
+
+    async def runner():
+        with patch.object(
+            api, "verify_balance_ops", new=AsyncMock(side_effect=[False, True])
+        ) as verify:
+            first = await api.check_write_access()
+            second = await api.check_write_access(refresh=True)
+            return first, second, verify.await_count
+
+    assert asyncio.run(runner()) == (False, True, 2)
@@ -22,14 +22,15 @@ async def run(suite, ctx) -> List[str]:
 
     with (
         patch.object(economy.unbelievaboat, 'get_balance', new=AsyncMock(return_value={'cash': BASELINE_LIVING_COST, 'bank': 0})),
-        patch.object(economy.unbelievaboat, 'update_balance', new=AsyncMock(return_value=True)) as mock_update,
+        patch.object(economy.unbelievaboat, 'update_balance_returning', new=AsyncMock(return_value={})) as mock_update,
         patch.object(economy, 'backup_balances', new=AsyncMock()),
         patch('NightCityBot.cogs.economy.load_json_file', new=AsyncMock(return_value={})),
         patch('NightCityBot.cogs.economy.save_json_file', new=AsyncMock()),
+        patch('NightCityBot.utils.helpers.save_json_file', new=AsyncMock()),
         patch('pathlib.Path.exists', return_value=False),
     ):
         await economy.collect_rent(ctx, target_user=user)
-        suite.assert_called(logs, mock_update, 'update_balance')
+        suite.assert_called(logs, mock_update, 'update_balance_returning')
         args = mock_update.await_args_list[0].args
         if args[0] == user.id and args[1].get('cash') == -BASELINE_LIVING_COST:
             logs.append('✅ baseline deducted for non-tier user')
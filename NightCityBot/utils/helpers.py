@@ -5,9 +5,13 @@ from zoneinfo import ZoneInfo
 import config
 from pathlib import Path
 import json
+import os
+import uuid
 import aiofiles
 import logging
 
+from NightCityBot.utils import json_codec
+
 logger = logging.getLogger(__name__)
 
 def build_channel_name(usernames, max_length=100):
@@ -39,7 +43,7 @@ async def load_json_file(file_path: Path | str, default=None):
                 content = await f.read()
                 if not content.strip():
                     return default if default is not None else {}
-                return json.loads(content)
+                return await json_codec.loads(content)
     except json.JSONDecodeError as e:
         # File had invalid JSON; treat as empty and log without traceback
         logger.error("Invalid JSON in %s: %s", path.name, e)
@@ -48,14 +52,23 @@ async def load_json_file(file_path: Path | str, default=None):
     return default if default is not None else {}
 
 async def save_json_file(file_path: Path | str, data):
-    """Safely save data to a JSON file."""
+    """Safely save data to a JSON file.
+
+    The data is written to a temporary file that then replaces ``file_path``,
+    so readers never see a half-written file. Each save uses its own
+    temporary file, so concurrent saves of the same path don't collide.
+    """
     path = Path(file_path)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
     try:
-        async with aiofiles.open(path, 'w') as f:
-            await f.write(json.dumps(data, indent=2))
+        content = await json_codec.dumps(data, indent=2)
+        async with aiofiles.open(tmp, 'w') as f:
+            await f.write(content)
+        os.replace(tmp, path)
         return True
     except Exception as e:
         logger.exception("Error saving %s: %s", path.name, e)
+        tmp.unlink(missing_ok=True)
         return False
 
 async def append_json_file(file_path: Path | str, item) -> bool:
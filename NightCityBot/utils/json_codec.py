@@ -0,0 +1,161 @@
+import asyncio
+import functools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import config
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(config, "JSON_WORKERS", 2), thread_name_prefix="json"
+        )
+    return _executor
+
+
+def offload_threshold() -> int:
+    return getattr(config, "JSON_OFFLOAD_BYTES", 64 * 1024)
+
+
+def exceeds(data: Any, limit: int) -> bool:
+    """Return ``True`` if ``data`` would encode to roughly ``limit`` characters.
+
+    Strings count their length and everything else a few characters. The
+    walk stops as soon as the estimate passes ``limit``, so checking a huge
+    document costs far less than encoding it.
+    """
+    size = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2
+        elif isinstance(item, dict):
+            size += 8 * len(item)
+            if size < limit:
+                stack.extend(item.keys())
+                stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            size += 2 * len(item)
+            if size < limit:
+                stack.extend(item)
+        else:
+            size += 8
+        if size >= limit:
+            return True
+    return False
+
+
+def snapshot(data: Any) -> Any:
+    """Return a copy of ``data`` that shares no dicts or lists with it.
+
+    Strings and numbers are immutable and kept as they are, so this is
+    much cheaper than :func:`copy.deepcopy`.
+    """
+    if isinstance(data, dict):
+        return {key: snapshot(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [snapshot(value) for value in data]
+    return data
+
+
+class CodecStats:
+    """Counters for one direction (encode or decode)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.offloaded = 0
+        self.chars = 0
+        # Time the event loop spent encoding/decoding inline
+        self.loop_time = 0.0
+        # Time offloaded calls took, including waiting for a worker
+        self.worker_time = 0.0
+        self.max_time = 0.0
+
+    def observe(self, elapsed: float, chars: int, offloaded: bool) -> None:
+        self.calls += 1
+        self.chars += chars
+        if offloaded:
+            self.offloaded += 1
+            self.worker_time += elapsed
+        else:
+            self.loop_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "offloaded": self.offloaded,
+            "chars": self.chars,
+            "loop_time": round(self.loop_time, 3),
+            "worker_time": round(self.worker_time, 3),
+            "max_time": round(self.max_time, 3),
+        }
+
+
+class JsonMetrics:
+    """Time spent encoding and decoding JSON files, on and off the loop."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.encode = CodecStats()
+        self.decode = CodecStats()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {"encode": self.encode.snapshot(), "decode": self.decode.snapshot()}
+
+    def summary_lines(self) -> List[str]:
+        """Return one human readable line per direction that was used."""
+        lines = []
+        for name, stats in (("encode", self.encode), ("decode", self.decode)):
+            if not stats.calls:
+                continue
+            lines.append(
+                f"JSON {name} — {stats.calls} calls, {stats.offloaded} offloaded, "
+                f"{stats.chars / 1024:.0f} KiB | loop {stats.loop_time:.2f}s, "
+                f"workers {stats.worker_time:.2f}s, max {stats.max_time:.2f}s"
+            )
+        return lines
+
+
+metrics = JsonMetrics()
+
+
+async def dumps(data: Any, **kwargs: Any) -> str:
+    """Encode ``data``, on a worker thread when it is large.
+
+    An offloaded document is copied with :func:`snapshot` first, so the
+    caller may keep changing ``data`` while the worker encodes it.
+    """
+    offload = exceeds(data, offload_threshold())
+    start = time.perf_counter()
+    if offload:
+        text = await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), functools.partial(json.dumps, snapshot(data), **kwargs)
+        )
+    else:
+        text = json.dumps(data, **kwargs)
+    metrics.encode.observe(time.perf_counter() - start, len(text), offload)
+    return text
+
+
+async def loads(text: str) -> Any:
+    """Decode ``text``, on a worker thread when it is large."""
+    offload = len(text) >= offload_threshold()
+    start = time.perf_counter()
+    if offload:
+        data = await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), json.loads, text
+        )
+    else:
+        data = json.loads(text)
+    metrics.decode.observe(time.perf_counter() - start, len(text), offload)
+    return data
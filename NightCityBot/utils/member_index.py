@@ -0,0 +1,66 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import discord
+
+import config
+
+
+def is_tier_role(name: str) -> bool:
+    """Return ``True`` for housing and business tier role names."""
+    return "Tier" in name
+
+
+class MemberIndex:
+    """Guild members grouped by role, built in one pass over the guild.
+
+    discord.py works out ``Role.members`` by scanning every guild member, so
+    collecting several roles that way costs a full scan per role. This
+    walks ``members`` once, buckets them by role and checks each distinct
+    role name only once. Selections are plain sets; :meth:`ordered` turns
+    one back into a list in guild order.
+    """
+
+    def __init__(self, members: Iterable[discord.Member]) -> None:
+        self.members = list(members)
+        self._order: Dict[discord.Member, int] = {}
+        self._by_role: Dict[Any, Set[discord.Member]] = {}
+        for pos, member in enumerate(self.members):
+            self._order[member] = pos
+            for role in member.roles:
+                self._by_role.setdefault(role, set()).add(member)
+        self._by_id: Dict[Optional[int], Set[discord.Member]] = {}
+        for role, members in self._by_role.items():
+            self._by_id.setdefault(getattr(role, "id", None), set()).update(members)
+
+    def with_role(self, role: Any) -> Set[discord.Member]:
+        """Return members holding ``role``; ``None`` matches nobody."""
+        if role is None:
+            return set()
+        return set(self._by_role.get(role, ()))
+
+    def with_role_id(self, role_id: int) -> Set[discord.Member]:
+        return set(self._by_id.get(role_id, ()))
+
+    def with_any(self, *roles: Any) -> Set[discord.Member]:
+        """Return members holding at least one of ``roles``."""
+        found: Set[discord.Member] = set()
+        for role in roles:
+            found |= self.with_role(role)
+        return found
+
+    def with_role_name(self, predicate: Callable[[str], bool]) -> Set[discord.Member]:
+        """Return members holding a role whose name matches ``predicate``."""
+        found: Set[discord.Member] = set()
+        for role, members in self._by_role.items():
+            if predicate(getattr(role, "name", "") or ""):
+                found |= members
+        return found
+
+    def ordered(self, members: Iterable[discord.Member]) -> List[discord.Member]:
+        """Return ``members`` sorted into guild order."""
+        return sorted(members, key=self._order.__getitem__)
+
+    def rent_members(self) -> List[discord.Member]:
+        """Return approved members who are verified or hold a tier role."""
+        eligible = self.with_role_id(config.VERIFIED_ROLE_ID) | self.with_role_name(is_tier_role)
+        return self.ordered(self.with_role_id(config.APPROVED_ROLE_ID) & eligible)
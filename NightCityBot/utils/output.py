@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Matches the chunk size of the package-wide ``Messageable.send`` patch
+MESSAGE_LIMIT = 1900
+
+
+class BufferedSender:
+    """Pack output lines into as few Discord messages as possible.
+
+    Lines are joined with newlines into messages of at most ``limit``
+    characters. Buffered text is sent when the next line would not fit,
+    ``interval`` seconds after the first buffered line or on :meth:`flush`.
+    Use it as an async context manager so the tail is always sent. Send
+    errors are logged rather than raised, like the per-line sends it
+    replaces in long-running jobs.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[object]],
+        *,
+        limit: int = MESSAGE_LIMIT,
+        interval: Optional[float] = None,
+    ) -> None:
+        self._send = send
+        self.limit = limit
+        self.interval = (
+            getattr(config, "OUTPUT_FLUSH_INTERVAL", 2.0) if interval is None else interval
+        )
+        self._lines: List[str] = []
+        self._size = 0
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self.messages_sent = 0
+
+    async def __aenter__(self) -> "BufferedSender":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.flush()
+
+    async def send(self, text: str) -> None:
+        """Queue ``text`` as one or more lines of output."""
+        if not text:
+            return
+        async with self._lock:
+            extra = len(text) + (1 if self._lines else 0)
+            if self._lines and self._size + extra > self.limit:
+                await self._flush_locked()
+                extra = len(text)
+            self._lines.append(text)
+            self._size += extra
+            if self._size >= self.limit:
+                await self._flush_locked()
+            elif self._timer is None and self.interval > 0:
+                self._timer = asyncio.create_task(self._flush_later())
+
+    async def extend(self, lines: Iterable[str]) -> None:
+        """Queue several lines in order."""
+        for line in lines:
+            await self.send(line)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send whatever is buffered now."""
+        async with self._lock:
+            await self._flush_locked()
+
+    async def _flush_locked(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        if not self._lines:
+            return
+        text = "\n".join(self._lines)
+        self._lines = []
+        self._size = 0
+        try:
+            await self._send(text)
+            self.messages_sent += 1
+        except Exception:
+            logger.exception("Failed to send buffered output")
@@ -6,8 +6,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 import config
-from .helpers import load_json_file, save_json_file
-from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+from NightCityBot.services.event_log import get_event_log
+from NightCityBot.services.state_store import get_state_store
+from NightCityBot.services.unbelievaboat import get_shared_client
 
 # Role and channel identifiers to verify
 ROLE_ID_FIELDS: Iterable[str] = [
@@ -81,9 +82,13 @@ REQUIRED_FIELDS: Iterable[str] = [
 
 LOG_FILES = [
     config.THREAD_MAP_FILE,
+    config.CYBERWARE_LOG_FILE,
+]
+
+# Append-only logs (see ``services/event_log.py``), rebuilt here at startup
+EVENT_LOG_FILES = [
     config.OPEN_LOG_FILE,
     config.ATTEND_LOG_FILE,
-    config.CYBERWARE_LOG_FILE,
 ]
 
 async def verify_config(bot: discord.Client) -> None:
@@ -141,32 +146,38 @@ async def cleanup_logs(bot: discord.Client) -> None:
 
     member_ids = {str(m.id) for m in guild.members}
 
+    store = get_state_store()
     for file_path in LOG_FILES:
         path = Path(file_path)
-        if not path.exists():
+        if store.backend is None and not path.exists():
             continue
-        data = await load_json_file(path, default={})
-        cleaned = {uid: val for uid, val in data.items() if uid in member_ids}
-        if cleaned != data:
-            await save_json_file(path, cleaned)
+        # Cleaned in place so cogs holding the cached document see it too
+        data = await store.load(path, default={})
+        orphaned = [uid for uid in data if uid not in member_ids]
+        if orphaned:
+            for uid in orphaned:
+                del data[uid]
+            await store.save(path, data)
             logger.info("\u2705 Cleaned orphaned entries from %s", path.name)
 
+    for file_path in EVENT_LOG_FILES:
+        log = get_event_log(file_path)
+        if await log.retain(member_ids):
+            logger.info("\u2705 Cleaned orphaned entries from %s", log.path.name)
+
 async def check_unbelievaboat(bot: discord.Client) -> None:
     """Verify we can reach the UnbelievaBoat API."""
     token = getattr(config, "UNBELIEVABOAT_API_TOKEN", None)
     if not token:
         logger.warning("\u26a0\ufe0f UNBELIEVABOAT_API_TOKEN not configured.")
         return
-    api = UnbelievaBoatAPI(token)
-    try:
-        logger.info("Checking UnbelievaBoat connection...")
-        result = await api.get_balance(getattr(config, "TEST_USER_ID", 0))
-        if result is not None:
-            logger.info("\u2705 Connected to UnbelievaBoat successfully.")
-        else:
-            logger.warning("\u26a0\ufe0f Failed to fetch balance from UnbelievaBoat.")
-    finally:
-        await api.close()
+    api = get_shared_client(bot)
+    logger.info("Checking UnbelievaBoat connection...")
+    result = await api.get_balance(getattr(config, "TEST_USER_ID", 0))
+    if result is not None:
+        logger.info("\u2705 Connected to UnbelievaBoat successfully.")
+    else:
+        logger.warning("\u26a0\ufe0f Failed to fetch balance from UnbelievaBoat.")
 
 async def perform_startup_checks(bot: discord.Client) -> None:
     await bot.wait_until_ready()
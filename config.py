@@ -18,6 +18,10 @@ load_dotenv(BASE_DIR / ".env")
 # or patched in tests.
 TOKEN = os.getenv("TOKEN")
 UNBELIEVABOAT_API_TOKEN = os.getenv("UNBELIEVABOAT_API_TOKEN")
+# Point this at scripts/fake_unbelievaboat.py to test against a local stand-in
+UNBELIEVABOAT_API_URL = os.getenv(
+    "UNBELIEVABOAT_API_URL", "https://unbelievaboat.com/api/v1"
+)
 
 AUDIT_LOG_CHANNEL_ID = 1349160856688267285
 GROUP_AUDIT_LOG_CHANNEL_ID = 1379222007513874523
@@ -44,10 +48,31 @@ LAST_PAYMENT_FILE = BASE_DIR / "last_payment.json"
 BALANCE_BACKUP_DIR = BASE_DIR / "backups"
 CHARACTER_BACKUP_DIR = BASE_DIR / "sheet_backups"
 RENT_AUDIT_DIR = BASE_DIR / "rent_audits"
+RENT_JOURNAL_DIR = BASE_DIR / "rent_journals"
 ATTEND_LOG_FILE = BASE_DIR / "attendance_log.json"
 CYBERWARE_LOG_FILE = BASE_DIR / "cyberware_log.json"
 CYBERWARE_WEEKLY_FILE = BASE_DIR / "cyberware_weekly.json"
 SYSTEM_STATUS_FILE = BASE_DIR / "system_status.json"
+# "json" keeps state in the files above; "sqlite" uses SQLITE_DB_FILE
+# (import the files first with !migrate_storage)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").lower()
+SQLITE_DB_FILE = BASE_DIR / "nightcity.db"
+# Seconds a fetched balance may be reused by read-only commands (0, the default, disables)
+BALANCE_CACHE_TTL = int(os.getenv("BALANCE_CACHE_TTL", 0))
+BALANCE_CACHE_SIZE = 2048
+# Leaderboard pages fetched in parallel for guild-wide balance snapshots
+LEADERBOARD_CONCURRENCY = 2
+# Members processed at once during rent collection
+RENT_CONCURRENCY = 4
+# Apply each member's rent charges in one balance update (collect_rent -merge)
+RENT_MERGE_CHARGES = False
+# Seconds buffered admin output may wait before it is sent
+OUTPUT_FLUSH_INTERVAL = 2.0
+# Seconds a changed state file (thread map, system status, ...) may wait before it is written
+STATE_FLUSH_INTERVAL = 5.0
+# JSON documents at least this many characters are encoded/decoded on a worker thread
+JSON_OFFLOAD_BYTES = 64 * 1024
+JSON_WORKERS = 2
 CYBER_CHECKUP_ROLE_ID = 1383623743934300272
 CYBER_MEDIUM_ROLE_ID = 1383623573939159240
 CYBER_HIGH_ROLE_ID = 1383623624560345139
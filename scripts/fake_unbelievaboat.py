@@ -0,0 +1,221 @@
+"""Local stand-in for the UnbelievaBoat API.
+
+Serves the endpoints ``UnbelievaBoatAPI`` uses from in-memory balances and can
+inject latency, rate limits, server errors and dropped connections::
+
+    python -m scripts.fake_unbelievaboat --port 8080 --latency 0.05 --rate-limit 0.02
+    UNBELIEVABOAT_API_URL=http://127.0.0.1:8080 python -m NightCityBot.bot
+
+``--bench`` starts the server, replays the request pattern of a rent run,
+weekly cyberware processing and a balance restore against it, and prints the
+throughput of each.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from aiohttp import web
+
+
+class FakeUnbelievaBoat:
+    """In-memory UnbelievaBoat server with configurable failure injection.
+
+    Each rate is the probability (0-1) that a request gets that treatment.
+    Unknown users start with ``starting_cash`` in cash and nothing in the bank.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: float = 0.0,
+        retry_after_ms: int = 250,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        starting_cash: int = 10_000,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.retry_after_ms = retry_after_ms
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.starting_cash = starting_cash
+        self.random = random.Random(seed)
+        self.balances: Dict[int, Dict[str, int]] = {}
+        self.stats: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+
+    def _balance(self, user_id: int) -> Dict[str, int]:
+        return self.balances.setdefault(
+            user_id, {"cash": self.starting_cash, "bank": 0}
+        )
+
+    def _body(self, user_id: int) -> Dict:
+        bal = self._balance(user_id)
+        return {
+            "user_id": str(user_id),
+            "cash": bal["cash"],
+            "bank": bal["bank"],
+            "total": bal["cash"] + bal["bank"],
+        }
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler):
+        self.stats["requests"] += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.random.random()
+        if roll < self.drop_rate:
+            self.stats["dropped"] += 1
+            request.transport.close()
+            return web.Response(status=500)
+        roll -= self.drop_rate
+        if roll < self.rate_limit:
+            self.stats["429"] += 1
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": self.retry_after_ms},
+                status=429,
+            )
+        roll -= self.rate_limit
+        if roll < self.error_rate:
+            self.stats["5xx"] += 1
+            return web.json_response({"message": "Internal Server Error"}, status=503)
+        return await handler(request)
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        self.stats["get"] += 1
+        return web.json_response(self._body(int(request.match_info["user_id"])))
+
+    async def patch_user(self, request: web.Request) -> web.Response:
+        self.stats["patch"] += 1
+        user_id = int(request.match_info["user_id"])
+        payload = await request.json()
+        bal = self._balance(user_id)
+        for field in ("cash", "bank"):
+            bal[field] += int(payload.get(field, 0) or 0)
+        return web.json_response(self._body(user_id))
+
+    async def leaderboard(self, request: web.Request) -> web.Response:
+        self.stats["leaderboard"] += 1
+        page = int(request.query.get("page", 1))
+        limit = int(request.query.get("limit", 1000))
+        ranked = sorted(
+            self.balances, key=lambda u: -(self.balances[u]["cash"] + self.balances[u]["bank"])
+        )
+        total_pages = max(1, -(-len(ranked) // limit))
+        chunk = ranked[(page - 1) * limit : page * limit]
+        users = [
+            {"rank": str((page - 1) * limit + i + 1), **self._body(uid)}
+            for i, uid in enumerate(chunk)
+        ]
+        return web.json_response(
+            {"users": users, "page": page, "total_pages": total_pages}
+        )
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._faults])
+        app.router.add_get("/guilds/{guild_id}/users", self.leaderboard)
+        app.router.add_get("/guilds/{guild_id}/users/{user_id}", self.get_user)
+        app.router.add_patch("/guilds/{guild_id}/users/{user_id}", self.patch_user)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL to give ``UnbelievaBoatAPI``."""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = self._runner.addresses[0][1]
+        return f"http://{host}:{bound}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def bench(server: FakeUnbelievaBoat, members: int) -> None:
+    """Replay rent, cyberware and restore request patterns and print timings."""
+    from NightCityBot.services.unbelievaboat import UnbelievaBoatAPI
+
+    base_url = await server.start()
+    api = UnbelievaBoatAPI("fake-token", base_url=base_url)
+    user_ids = list(range(1, members + 1))
+    for uid in user_ids:
+        server._balance(uid)
+
+    async def rent(uid: int) -> None:
+        # Baseline, housing, business and trauma charges after one read
+        await api.get_balance(uid, fresh=True)
+        for item in ("Baseline", "Housing", "Business", "Trauma"):
+            await api.update_balance_returning(uid, {"cash": -10}, reason=item)
+
+    async def cyberware(uid: int) -> None:
+        await api.get_balance(uid, fresh=True)
+        await api.update_balance(uid, {"cash": -5}, reason="Cyberware medication")
+
+    async def restore(uid: int) -> None:
+        await api.get_balance(uid, fresh=True)
+        await api.update_balance(uid, {"cash": 45}, reason="Balance restore")
+
+    try:
+        for name, step in (
+            ("run_rent_collection", rent),
+            ("process_week", cyberware),
+            ("restore_balances", restore),
+        ):
+            server.stats.clear()
+            start = time.perf_counter()
+            for uid in user_ids:
+                await step(uid)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name}: {members} members in {elapsed:.2f}s "
+                f"({members / elapsed:.1f}/s) {dict(server.stats)}"
+            )
+    finally:
+        await api.close()
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 probability")
+    parser.add_argument("--retry-after", type=int, default=250, help="429 retry_after in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 probability")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="dropped connection probability")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--bench", type=int, metavar="MEMBERS", help="run the offline benchmark")
+    args = parser.parse_args()
+
+    server = FakeUnbelievaBoat(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        retry_after_ms=args.retry_after,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    if args.bench:
+        asyncio.run(bench(server, args.bench))
+    else:
+        web.run_app(server.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()